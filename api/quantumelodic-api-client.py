@@ -3,16 +3,33 @@ Quantumelodic API Client for Free Astrology API Integration
 Handles all communication with the astrology API and data transformation
 """
 
+import asyncio
+import copy
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import logging
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
-import pytz
+import numpy as np
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=128)
+def _tz(name: str) -> ZoneInfo:
+    """Resolve a timezone name once per process"""
+    return ZoneInfo(name)
+
+@dataclass(frozen=True)
 class BirthData:
-    """Data class for birth information"""
+    """Data class for birth information (hashable so it can key caches)"""
     name: str
     year: int
     month: int
@@ -33,12 +50,72 @@ class AstrologyAPIClient:
             'Content-Type': 'application/json',
             'x-api-key': api_key
         }
-    
-    def get_natal_chart(self, birth_data: BirthData) -> Dict:
-        """Fetch complete natal chart with planets, houses, and aspects"""
+        self.timeout = 10
+        
+        # Birth facts never change, so natal charts are cached per BirthData;
+        # transits are cached per (BirthData, current minute)
+        self.cache_size = 512
+        self._natal_cache = OrderedDict()
+        self._transit_cache = OrderedDict()
+        
+        # Persistent session so back-to-back calls reuse the TLS connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Every endpoint is a quota-counted POST: connection failures (nothing
+        # was sent) are retried, but 429/5xx replies only for idempotent
+        # methods, so a POST is never replayed after the server has seen it
+        retries = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True
+        )
+        self.session.mount(
+            'https://',
+            HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+        )
         
-        # Prepare request payload
-        payload = {
+        # Lets the blocking client issue independent POSTs side by side
+        self._pool = ThreadPoolExecutor(max_workers=4)
+    
+    def close(self):
+        """Release pooled connections and worker threads"""
+        self._pool.shutdown(wait=False)
+        self.session.close()
+    
+    def _post(self, path: str, payload: Dict) -> Dict:
+        """POST to an API endpoint on the pooled session"""
+        response = self.session.post(
+            f"{self.base_url}{path}",
+            json=payload,
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.json()
+    
+    def _cache_get(self, cache: OrderedDict, key) -> Optional[Dict]:
+        """Return a copy of a cached response and mark it most recently used"""
+        if key in cache:
+            cache.move_to_end(key)
+            return copy.deepcopy(cache[key])
+        return None
+    
+    def _cache_put(self, cache: OrderedDict, key, value: Optional[Dict]):
+        """Store a copy of a successful response, evicting the least recently used entry"""
+        if value is None:
+            return
+        cache[key] = copy.deepcopy(value)
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+    
+    def _transit_key(self, birth_data: BirthData) -> Tuple:
+        """Cache key for transits: the payload only has minute resolution"""
+        now = datetime.now(_tz(birth_data.timezone))
+        return birth_data, now.replace(second=0, microsecond=0)
+    
+    def _natal_payload(self, birth_data: BirthData) -> Dict:
+        """Build the request payload shared by the natal wheel and aspects endpoints"""
+        return {
             "name": birth_data.name,
             "year": birth_data.year,
             "month": birth_data.month,
@@ -54,44 +131,10 @@ class AstrologyAPIClient:
                 "language": "en"
             }
         }
-        
-        try:
-            # Get natal wheel (planets and houses)
-            response = requests.post(
-                f"{self.base_url}/native/natal-wheel-chart",
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            natal_data = response.json()
-            
-            # Get aspects
-            aspects_response = requests.post(
-                f"{self.base_url}/native/aspects",
-                headers=self.headers,
-                json=payload
-            )
-            aspects_response.raise_for_status()
-            aspects_data = aspects_response.json()
-            
-            # Combine data
-            return {
-                'natal_wheel': natal_data,
-                'aspects': aspects_data,
-                'birth_data': birth_data.__dict__
-            }
-            
-        except requests.exceptions.RequestException as e:
-            print(f"API Error: {e}")
-            return None
     
-    def get_current_transits(self, birth_data: BirthData) -> Dict:
-        """Get current planetary transits"""
-        
-        # Current date/time
-        now = datetime.now(pytz.timezone(birth_data.timezone))
-        
-        transit_payload = {
+    def _transit_payload(self, birth_data: BirthData, now: datetime) -> Dict:
+        """Build the transits request payload for the given moment"""
+        return {
             "name": birth_data.name,
             "year": birth_data.year,
             "month": birth_data.month,
@@ -111,18 +154,110 @@ class AstrologyAPIClient:
                 "ayanamsha": "lahiri"
             }
         }
+    
+    def get_natal_chart(self, birth_data: BirthData) -> Dict:
+        """Fetch complete natal chart with planets, houses, and aspects"""
+        
+        cached = self._cache_get(self._natal_cache, birth_data)
+        if cached is not None:
+            return cached
+        
+        payload = self._natal_payload(birth_data)
         
         try:
-            response = requests.post(
-                f"{self.base_url}/native/transits",
-                headers=self.headers,
-                json=transit_payload
-            )
-            response.raise_for_status()
-            return response.json()
+            # Natal wheel (planets and houses) and aspects are independent,
+            # so both requests are in flight at once
+            natal_future = self._pool.submit(self._post, "/native/natal-wheel-chart", payload)
+            aspects_future = self._pool.submit(self._post, "/native/aspects", payload)
+            natal_data = natal_future.result()
+            aspects_data = aspects_future.result()
+            
+            # Combine data
+            result = {
+                'natal_wheel': natal_data,
+                'aspects': aspects_data,
+                'birth_data': birth_data.__dict__
+            }
+            self._cache_put(self._natal_cache, birth_data, result)
+            return result
             
         except requests.exceptions.RequestException as e:
-            print(f"Transit API Error: {e}")
+            logger.warning("API Error: %s", e)
+            return None
+    
+    def get_current_transits(self, birth_data: BirthData) -> Dict:
+        """Get current planetary transits"""
+        
+        key = self._transit_key(birth_data)
+        cached = self._cache_get(self._transit_cache, key)
+        if cached is not None:
+            return cached
+        
+        transit_payload = self._transit_payload(birth_data, key[1])
+        
+        try:
+            transits = self._post("/native/transits", transit_payload)
+            self._cache_put(self._transit_cache, key, transits)
+            return transits
+            
+        except requests.exceptions.RequestException as e:
+            logger.warning("Transit API Error: %s", e)
+            return None
+    
+    async def _post_async(self, session: aiohttp.ClientSession, path: str, payload: Dict) -> Dict:
+        """POST to an API endpoint on a shared aiohttp session"""
+        async with session.post(
+            f"{self.base_url}{path}",
+            headers=self.headers,
+            json=payload,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+    
+    async def get_natal_chart_async(self, session: aiohttp.ClientSession,
+                                    birth_data: BirthData) -> Dict:
+        """Fetch natal wheel and aspects concurrently"""
+        cached = self._cache_get(self._natal_cache, birth_data)
+        if cached is not None:
+            return cached
+        
+        payload = self._natal_payload(birth_data)
+        
+        try:
+            natal_data, aspects_data = await asyncio.gather(
+                self._post_async(session, "/native/natal-wheel-chart", payload),
+                self._post_async(session, "/native/aspects", payload)
+            )
+            result = {
+                'natal_wheel': natal_data,
+                'aspects': aspects_data,
+                'birth_data': birth_data.__dict__
+            }
+            self._cache_put(self._natal_cache, birth_data, result)
+            return result
+        
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning("API Error: %s", e)
+            return None
+    
+    async def get_current_transits_async(self, session: aiohttp.ClientSession,
+                                         birth_data: BirthData) -> Dict:
+        """Get current planetary transits without blocking the event loop"""
+        key = self._transit_key(birth_data)
+        cached = self._cache_get(self._transit_cache, key)
+        if cached is not None:
+            return cached
+        
+        try:
+            transits = await self._post_async(
+                session, "/native/transits", self._transit_payload(birth_data, key[1])
+            )
+            self._cache_put(self._transit_cache, key, transits)
+            return transits
+        
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning("Transit API Error: %s", e)
             return None
 
 
@@ -153,6 +288,28 @@ class QuantumelodicDataTransformer:
             'North Node': 'Locrian',
             'Chiron': 'Dorian'
         }
+        
+        # Planet weights for the element distribution
+        self.planet_weights = {
+            'Sun': 3, 'Moon': 3, 'Ascendant': 3,
+            'Mercury': 2, 'Venus': 2, 'Mars': 2,
+            'Jupiter': 1.5, 'Saturn': 1.5,
+            'Uranus': 1, 'Neptune': 1, 'Pluto': 1
+        }
+        
+        # Integer bin tables so distributions are a single np.bincount
+        self.elements = ['Fire', 'Earth', 'Air', 'Water']
+        self.modalities = ['Cardinal', 'Fixed', 'Mutable']
+        self._element_index = {element: i for i, element in enumerate(self.elements)}
+        self._modality_index = {
+            sign: self.modalities.index(modality)
+            for modality, signs in (
+                ('Cardinal', ['Aries', 'Cancer', 'Libra', 'Capricorn']),
+                ('Fixed', ['Taurus', 'Leo', 'Scorpio', 'Aquarius']),
+                ('Mutable', ['Gemini', 'Virgo', 'Sagittarius', 'Pisces'])
+            )
+            for sign in signs
+        }
     
     def transform_natal_chart(self, api_data: Dict) -> Dict:
         """Transform API data into Quantumelodic format"""
@@ -218,46 +375,36 @@ class QuantumelodicDataTransformer:
     
     def _calculate_element_distribution(self, planets: Dict) -> Dict:
         """Calculate distribution of elements in chart"""
-        distribution = {'Fire': 0, 'Earth': 0, 'Air': 0, 'Water': 0}
-        
-        # Weight different planets
-        weights = {
-            'Sun': 3, 'Moon': 3, 'Ascendant': 3,
-            'Mercury': 2, 'Venus': 2, 'Mars': 2,
-            'Jupiter': 1.5, 'Saturn': 1.5,
-            'Uranus': 1, 'Neptune': 1, 'Pluto': 1
-        }
-        
-        for planet, data in planets.items():
-            weight = weights.get(planet, 1)
-            element = data.get('element', 'Earth')
-            distribution[element] += weight
+        count = len(planets)
+        indices = np.fromiter(
+            (self._element_index[data.get('element', 'Earth')] for data in planets.values()),
+            dtype=np.intp, count=count
+        )
+        weights = np.fromiter(
+            (self.planet_weights.get(planet, 1) for planet in planets),
+            dtype=np.float64, count=count
+        )
+        distribution = np.bincount(indices, weights=weights, minlength=len(self.elements))
         
         # Normalize
-        total = sum(distribution.values())
+        total = distribution.sum()
         if total > 0:
-            distribution = {k: v/total for k, v in distribution.items()}
+            distribution /= total
         
-        return distribution
+        return dict(zip(self.elements, distribution.tolist()))
     
     def _calculate_modality_distribution(self, planets: Dict) -> Dict:
         """Calculate distribution of modalities in chart"""
-        modalities = {
-            'Cardinal': ['Aries', 'Cancer', 'Libra', 'Capricorn'],
-            'Fixed': ['Taurus', 'Leo', 'Scorpio', 'Aquarius'],
-            'Mutable': ['Gemini', 'Virgo', 'Sagittarius', 'Pisces']
-        }
-        
-        distribution = {'Cardinal': 0, 'Fixed': 0, 'Mutable': 0}
-        
-        for planet, data in planets.items():
-            sign = data.get('sign', '')
-            for modality, signs in modalities.items():
-                if sign in signs:
-                    distribution[modality] += 1
-                    break
+        indices = [
+            self._modality_index[sign]
+            for sign in (data.get('sign', '') for data in planets.values())
+            if sign in self._modality_index
+        ]
+        distribution = np.bincount(
+            np.asarray(indices, dtype=np.intp), minlength=len(self.modalities)
+        )
         
-        return distribution
+        return dict(zip(self.modalities, distribution.tolist()))
     
     def _identify_chart_pattern(self, planets: Dict, aspects: List) -> str:
         """Identify major chart patterns"""
@@ -265,17 +412,14 @@ class QuantumelodicDataTransformer:
         aspect_count = len(aspects)
         
         # Count different aspect types
-        aspect_types = {}
-        for aspect in aspects:
-            aspect_type = aspect['aspect_type']
-            aspect_types[aspect_type] = aspect_types.get(aspect_type, 0) + 1
+        aspect_types = Counter(aspect['aspect_type'] for aspect in aspects)
         
         # Basic pattern identification
-        if aspect_types.get('trine', 0) >= 3:
+        if aspect_types['trine'] >= 3:
             return 'Grand Trine'
-        elif aspect_types.get('square', 0) >= 4:
+        elif aspect_types['square'] >= 4:
             return 'Grand Cross'
-        elif aspect_types.get('opposition', 0) >= 2 and aspect_types.get('sextile', 0) >= 2:
+        elif aspect_types['opposition'] >= 2 and aspect_types['sextile'] >= 2:
             return 'Mystic Rectangle'
         elif aspect_count > 15:
             return 'Highly Aspected'
@@ -293,26 +437,48 @@ class QuantumelodicAPIIntegration:
         self.api_client = AstrologyAPIClient(api_key)
         self.transformer = QuantumelodicDataTransformer()
     
-    def process_birth_chart(self, birth_data: BirthData) -> Dict:
-        """Complete processing pipeline"""
+    async def process_birth_chart_async(self, birth_data: BirthData,
+                                        session: Optional[aiohttp.ClientSession] = None) -> Dict:
+        """Complete processing pipeline with all API calls issued concurrently
         
-        print("🌟 Fetching astrological data...")
-        raw_data = self.api_client.get_natal_chart(birth_data)
+        aiohttp sessions are bound to the event loop that created them, so
+        long-running async callers should pass their own session to keep
+        connections alive across calls; otherwise one is opened per call.
+        """
+        if session is None:
+            async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=32)) as session:
+                return await self.process_birth_chart_async(birth_data, session)
+        
+        logger.info("Fetching astrological data and current transits")
+        raw_data, transits = await asyncio.gather(
+            self.api_client.get_natal_chart_async(session, birth_data),
+            self.api_client.get_current_transits_async(session, birth_data)
+        )
         
         if not raw_data:
-            print("❌ Failed to fetch astrological data")
+            logger.error("Failed to fetch astrological data")
             return None
         
-        print("🔄 Transforming data for musical synthesis...")
+        logger.debug("Transforming data for musical synthesis")
         transformed_data = self.transformer.transform_natal_chart(raw_data)
         
-        print("🎵 Adding current transits...")
-        transits = self.api_client.get_current_transits(birth_data)
         if transits:
             transformed_data['current_transits'] = transits
         
         return transformed_data
     
+    def process_birth_chart(self, birth_data: BirthData) -> Dict:
+        """Complete processing pipeline
+        
+        Blocking entry point; code already running inside an event loop
+        (FastAPI handlers, Jupyter) should await process_birth_chart_async.
+        """
+        return asyncio.run(self.process_birth_chart_async(birth_data))
+    
+    def close(self):
+        """Close the pooled HTTP session"""
+        self.api_client.close()
+    
     def get_birth_data_from_input(self, user_input: Dict) -> BirthData:
         """Convert user input to BirthData object"""
         return BirthData(
@@ -330,6 +496,7 @@ class QuantumelodicAPIIntegration:
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
     api_key = "Wno8gGxCZO91mq9qaRgqU8oJrMDZ6WXy4FQjua4t"
     integration = QuantumelodicAPIIntegration(api_key)
     
@@ -354,3 +521,5 @@ if __name__ == "__main__":
         print(f"Dominant Element: {result['dominant_element']}")
         print(f"Chart Pattern: {result['chart_pattern']}")
         print(f"Number of Aspects: {len(result['aspects'])}")
+    
+    integration.close()
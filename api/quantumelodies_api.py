@@ -1,58 +1,145 @@
 from fastapi import FastAPI, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
 from pydantic import BaseModel
 from typing import List, Optional
 import uvicorn
 import csv
 import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from types import MappingProxyType
+import json
 import pandas as pd
 
-app = FastAPI(title="Quantumelodies API", version="1.2")
+try:
+    import orjson
+except ImportError:  # orjson is optional; output falls back to the stdlib encoder
+    orjson = None
+
+# JSON responses rendered with orjson when installed; FastAPI's own
+# ORJSONResponse is deprecated
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content)
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+app = FastAPI(title="Quantumelodies API", version="1.2", default_response_class=FastJSONResponse)
+
+# Compact immutable glossary record; converted with asdict() only when a
+# response is serialized
+@dataclass(frozen=True, slots=True)
+class GlossaryEntry:
+    term: str
+    astrological_definition: str
+    musical_equivalent: str
+    mathematical_equivalent: str
+    category: str
+    aliases: tuple
 
 # Load glossary from CSV file with normalized fields and support for category/aliases
 def load_glossary_csv(path: str):
     glossary = []
     if not os.path.exists(path):
         return glossary
-    with open(path, mode='r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
+    with open(path, mode='r', encoding='utf-8', newline='') as file:
+        # Plain csv.reader with column positions resolved once from the header,
+        # so no per-row dict is built just to be read back
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return glossary
+        cols = {name: i for i, name in enumerate(header)}
+        term_i = cols.get("term")
+        definition_i = cols.get("definition")
+        musical_i = cols.get("musical_equivalent")
+        math_i = cols.get("math_equivalent")
+        category_i = cols.get("category")
+        aliases_i = cols.get("aliases")
+
+        def field(row, i):
+            return row[i] if i is not None and i < len(row) else ""
+
         for row in reader:
-            aliases = [alias.strip().lower() for alias in row.get("aliases", "").split(",") if alias.strip()] if "aliases" in row else []
-            glossary.append({
-                "term": row.get("term", "").strip().lower(),
-                "astrological_definition": row.get("definition", "").strip(),
-                "musical_equivalent": row.get("musical_equivalent", "").strip(),
-                "mathematical_equivalent": row.get("math_equivalent", "").strip(),
-                "category": row.get("category", "").strip().lower() if "category" in row else "",
-                "aliases": aliases
-            })
+            aliases = tuple(alias.strip().lower() for alias in field(row, aliases_i).split(",") if alias.strip())
+            glossary.append(GlossaryEntry(
+                term=field(row, term_i).strip().lower(),
+                astrological_definition=field(row, definition_i).strip(),
+                musical_equivalent=field(row, musical_i).strip(),
+                mathematical_equivalent=field(row, math_i).strip(),
+                category=field(row, category_i).strip().lower(),
+                aliases=aliases
+            ))
     return glossary
 
+# Build hash indexes over the glossary so lookups don't scan every entry
+def index_glossary(glossary):
+    term_index = {}
+    alias_index = {}
+    category_index = {}
+    for item in glossary:
+        term_index.setdefault(item.term, item)
+        for alias in item.aliases:
+            alias_index.setdefault(alias, item)
+        category_index.setdefault(item.category, []).append(item)
+    return term_index, alias_index, category_index
+
 # Load from a CSV file stored locally
 GLOSSARY_CSV_PATH = "glossary.csv"
 glossary_data = load_glossary_csv(GLOSSARY_CSV_PATH)
+term_index, alias_index, category_index = index_glossary(glossary_data)
+
+# Planetary thematic mappings for musical interpretation
+THEMES_CSV_PATH = "cleaned_Quantumelodic Dataset Official - Zodiacal-House-Planet Thematics.csv"
+THEME_KEYS = ['Planet', 'Sign', 'House']
+THEME_FIELDS = ['Theme', 'Mode', 'Tempo', 'Instrumentation']
+THEME_COLUMNS = THEME_KEYS + THEME_FIELDS
+THEME_DTYPES = {
+    'Planet': str, 'Sign': str, 'House': str, 'Theme': str,
+    'Mode': 'category', 'Tempo': 'category', 'Instrumentation': 'category'
+}
+
+# Parse the thematic CSV once per process, on first use, and materialize it as a
+# read-only dict keyed on lowercase (planet, sign, house) so request handlers
+# never touch pandas; the first duplicate row wins
+@lru_cache(maxsize=1)
+def load_themes():
+    df = pd.read_csv(THEMES_CSV_PATH, usecols=lambda col: col in THEME_COLUMNS, dtype=THEME_DTYPES)
+    for col in THEME_FIELDS:
+        if col not in df:
+            df[col] = ""
+    df[THEME_KEYS] = df[THEME_KEYS].apply(lambda col: col.str.lower())
 
-# Load planetary thematic mappings for musical interpretation
-thematic_df = pd.read_csv("cleaned_Quantumelodic Dataset Official - Zodiacal-House-Planet Thematics.csv")
+    themes = {}
+    for planet, sign, house, theme, mode, tempo, instrumentation in zip(
+            *(df[col].tolist() for col in THEME_COLUMNS)):
+        themes.setdefault((planet, sign, house), MappingProxyType({
+            "theme": theme,
+            "mode": mode,
+            "tempo": tempo,
+            "instrumentation": instrumentation
+        }))
+    return MappingProxyType(themes)
+
+def default_theme(planet, sign, house):
+    return {
+        "theme": f"{planet} in {sign}, {house} suggests a unique harmonic signature.",
+        "mode": "Ionian",
+        "tempo": "Moderate",
+        "instrumentation": "Strings"
+    }
 
 def find_theme(planet, sign, house):
-    row = thematic_df[(thematic_df['Planet'].str.lower() == planet.lower()) &
-                      (thematic_df['Sign'].str.lower() == sign.lower()) &
-                      (thematic_df['House'].str.lower() == house.lower())]
-    if not row.empty:
-        r = row.iloc[0]
-        return {
-            "theme": r.get("Theme", ""),
-            "mode": r.get("Mode", ""),
-            "tempo": r.get("Tempo", ""),
-            "instrumentation": r.get("Instrumentation", "")
-        }
+    theme = load_themes().get((planet.lower(), sign.lower(), house.lower()))
+    if theme is not None:
+        return dict(theme)
     else:
-        return {
-            "theme": f"{planet} in {sign}, {house} suggests a unique harmonic signature.",
-            "mode": "Ionian",
-            "tempo": "Moderate",
-            "instrumentation": "Strings"
-        }
+        return default_theme(planet, sign, house)
 
 class PlanetPlacement(BaseModel):
     planet: str
@@ -70,20 +157,46 @@ class ChartData(BaseModel):
 @app.get("/glossary/lookup")
 def glossary_lookup(term: str = Query(..., description="Term to search for")):
     clean_term = term.strip().lower()
-    result = next((item for item in glossary_data
-                   if item["term"] == clean_term or clean_term in item.get("aliases", [])), None)
-    return result or {"message": "Term not found."}
+    result = term_index.get(clean_term) or alias_index.get(clean_term)
+    return asdict(result) if result else {"message": "Term not found."}
 
 @app.get("/glossary/by-category")
 def glossary_by_category(type: str = Query(..., description="Category to filter by")):
-    filtered = [item for item in glossary_data if item.get("category") == type.strip().lower()]
-    return filtered or {"message": "No terms found in this category."}
+    filtered = category_index.get(type.strip().lower())
+    return [asdict(item) for item in filtered] if filtered else {"message": "No terms found in this category."}
+
+# Translations are a pure function of the chart, so repeat requests are served
+# from a bounded LRU keyed by the canonical JSON of the payload
+TRANSLATION_CACHE_SIZE = 1024
+translation_cache = OrderedDict()
+translation_cache_lock = threading.Lock()
 
 @app.post("/translate/chart-to-music")
 def translate_chart(data: ChartData):
+    payload = jsonable_encoder(data)
+    if orjson is not None:
+        key = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    else:
+        key = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    with translation_cache_lock:
+        if key in translation_cache:
+            translation_cache.move_to_end(key)
+            return translation_cache[key]
+
+    response = _translate_chart(data)
+    with translation_cache_lock:
+        translation_cache[key] = response
+        if len(translation_cache) > TRANSLATION_CACHE_SIZE:
+            translation_cache.popitem(last=False)
+    return response
+
+def _translate_chart(data: ChartData):
+    # Resolve the theme table and normalize every key once for the whole chart
+    themes = load_themes()
+    keys = [(p.planet.lower(), p.sign.lower(), p.house.lower()) for p in data.placements]
     result = []
-    for placement in data.placements:
-        musical_data = find_theme(placement.planet, placement.sign, placement.house)
+    for placement, key in zip(data.placements, keys):
+        musical_data = themes.get(key) or default_theme(placement.planet, placement.sign, placement.house)
         result.append({
             "planet": placement.planet,
             "theme": musical_data["theme"],
@@ -101,4 +214,10 @@ def generate_sound_map(aspect: Aspect):
     }
 
 if __name__ == "__main__":
-    uvicorn.run("quantumelodies_api:app", host="0.0.0.0", port=8000, reload=True)
+    # Auto-reload is for local development only; production runs multiple
+    # workers (see serve.sh)
+    if os.environ.get("QUANTUMELODIC_DEV") == "1":
+        uvicorn.run("quantumelodies_api:app", host="0.0.0.0", port=8000, reload=True)
+    else:
+        uvicorn.run("quantumelodies_api:app", host="0.0.0.0", port=8000,
+                    workers=int(os.environ.get("WEB_CONCURRENCY", 4)), access_log=False)
@@ -1,27 +1,42 @@
+import os
+import copy
+import json
+import threading
 import numpy as np
 import tensorflow as tf
 from music21 import *
 from typing import Dict, List, Tuple
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request
 from qutip import Bloch, basis, rand_ket
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 import gym
 from gym import spaces
 from stable_baselines3 import PPO
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; output falls back to the stdlib encoder
+    orjson = None
+
 # Previous classes remain the same, adding new and modified classes below
 
 class AstronomicalDataFetcher:
     def __init__(self):
         self.api_url = "https://api.astronomyapi.com/api/v2/bodies/positions"
         self.api_key = "YOUR_API_KEY"  # Replace with actual API key
-    
-    def get_planet_positions(self) -> Dict[str, float]:
-        headers = {
+        self.session = requests.Session()
+        self.session.headers.update({
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
-        }
+        })
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    
+    def close(self):
+        self.session.close()
+    
+    def get_planet_positions(self) -> Dict[str, float]:
         params = {
             "latitude": 0,  # Replace with actual coordinates
             "longitude": 0,
@@ -30,7 +45,7 @@ class AstronomicalDataFetcher:
             "to_date": datetime.now().strftime("%Y-%m-%d"),
             "time": datetime.now().strftime("%H:%M:%S")
         }
-        response = requests.get(self.api_url, headers=headers, params=params)
+        response = self.session.get(self.api_url, params=params, timeout=10)
         data = response.json()
         
         planet_positions = {}
@@ -48,23 +63,41 @@ class CompositionEnvironment(gym.Env):
         self.action_space = spaces.Discrete(len(self.chm.chromatic_tones) * len(self.chm.zodiac_signs))
         self.observation_space = spaces.Box(low=0, high=1, shape=(len(self.chm.planets),))
         self.current_state = None
+        
+        # Draw random states in blocks instead of allocating one per step
+        self._rng = np.random.default_rng()
+        self._rand_buf = self._rng.random((4096, len(self.chm.planets)), dtype=np.float32)
+        self._rand_i = 0
+    
+    def _next_state(self):
+        if self._rand_i >= len(self._rand_buf):
+            self._rng.random(out=self._rand_buf, dtype=np.float32)
+            self._rand_i = 0
+        # Copy the row out; the buffer is refilled in place, and callers may
+        # keep observations (frame stacks, replay buffers) past a refill
+        state = self._rand_buf[self._rand_i].copy()
+        self._rand_i += 1
+        return state
     
     def reset(self):
-        self.current_state = np.random.rand(len(self.chm.planets))
+        self.current_state = self._next_state()
         return self.current_state
     
     def step(self, action):
         # Interpret action as a change to the cosmic harmony matrix
         sign_index = action // len(self.chm.chromatic_tones)
         tone_index = action % len(self.chm.chromatic_tones)
-        self.chm.correlation_matrix[sign_index, tone_index] += 0.1
-        self.chm.correlation_matrix = self.chm.correlation_matrix / np.sum(self.chm.correlation_matrix, axis=1, keepdims=True)
+        # Only this row changes, so renormalize it in place; the other rows
+        # are already normalized
+        row = self.chm.correlation_matrix[sign_index]
+        row[tone_index] += 0.1
+        row *= 1.0 / row.sum()
         
         # Calculate reward based on some metric of harmonic quality
         reward = self._calculate_harmonic_quality()
         
         # Update state
-        self.current_state = np.random.rand(len(self.chm.planets))
+        self.current_state = self._next_state()
         
         done = False  # In this case, the episode never ends
         return self.current_state, reward, done, {}
@@ -76,7 +109,7 @@ class CompositionEnvironment(gym.Env):
 class ReinforcementLearningComponent:
     def __init__(self, cosmic_harmony_matrix):
         self.env = CompositionEnvironment(cosmic_harmony_matrix)
-        self.model = PPO("MlpPolicy", self.env, verbose=1)
+        self.model = PPO("MlpPolicy", self.env, verbose=0)
     
     def train(self, total_timesteps=10000):
         self.model.learn(total_timesteps=total_timesteps)
@@ -96,6 +129,20 @@ class QuantumelodicMetasystem:
         self.quantum_optimizer = QuantumInspiredOptimizer(num_qubits=1)
         self.astro_data_fetcher = AstronomicalDataFetcher()
         self.rl_component = ReinforcementLearningComponent(self.cosmic_harmony_matrix)
+        self._sign_to_idx = {sign: i for i, sign in enumerate(self.cosmic_harmony_matrix.zodiac_signs)}
+    
+    def for_request(self) -> "QuantumelodicMetasystem":
+        # Share the models, fetcher and lookup tables, but give the request its
+        # own harmony matrix (and the helpers built on it) so RL refinements
+        # never leak into other requests or race with their reads
+        scoped = copy.copy(self)
+        matrix = copy.copy(self.cosmic_harmony_matrix)
+        matrix.correlation_matrix = self.cosmic_harmony_matrix.correlation_matrix.copy()
+        scoped.cosmic_harmony_matrix = matrix
+        scoped.tone_zodiac_mapping = ToneZodiacMapping(matrix)
+        scoped.planetary_chord_progressions = PlanetaryChordProgressions(matrix)
+        scoped.house_based_composition = HouseBasedComposition(matrix)
+        return scoped
     
     def generate_composition(self, natal_chart: Dict[str, Tuple[str, int]]) -> stream.Stream:
         # Fetch current planet positions
@@ -114,7 +161,8 @@ class QuantumelodicMetasystem:
         harmony = self.aspectarian_harmony.generate_harmony(current_transits)
         
         # Use RL component to refine the composition
-        rl_observation = np.array([self.cosmic_harmony_matrix.zodiac_signs.index(natal_chart[planet][0]) for planet in self.cosmic_harmony_matrix.planets])
+        planets = self.cosmic_harmony_matrix.planets
+        rl_observation = np.fromiter((self._sign_to_idx[natal_chart[planet][0]] for planet in planets), dtype=np.int32, count=len(planets))
         rl_action = self.rl_component.generate_refinements(rl_observation)
         self.apply_rl_refinement(rl_action)
         
@@ -130,16 +178,15 @@ class QuantumelodicMetasystem:
             # Generate chord progression for this section
             section_progression = self.advanced_music_theory.generate_chord_progression(key_sig, len(section['planets']))
             
-            # Add chords with voice leading
-            previous_chord = None
+            # Voice-lead each chord against the previous one, then append the
+            # whole section in one call so offsets are computed once
+            chords = []
             for rn in section_progression:
-                if previous_chord is None:
-                    c = rn.writeAsChord()
-                else:
-                    c = rn.writeAsChord()
-                    previous_chord, c = self.advanced_music_theory.apply_voice_leading(previous_chord, c)
-                part.append(c)
-                previous_chord = c
+                c = rn.writeAsChord()
+                if chords:
+                    _, c = self.advanced_music_theory.apply_voice_leading(chords[-1], c)
+                chords.append(c)
+            part.append(chords)
             
             # Adjust tempo based on section properties
             if section['tempo'] == 'Fast':
@@ -156,14 +203,42 @@ class QuantumelodicMetasystem:
     def apply_rl_refinement(self, action):
         sign_index = action // len(self.cosmic_harmony_matrix.chromatic_tones)
         tone_index = action % len(self.cosmic_harmony_matrix.chromatic_tones)
-        self.cosmic_harmony_matrix.correlation_matrix[sign_index, tone_index] += 0.1
-        self.cosmic_harmony_matrix.correlation_matrix = self.cosmic_harmony_matrix.correlation_matrix / np.sum(self.cosmic_harmony_matrix.correlation_matrix, axis=1, keepdims=True)
-        self.tone_zodiac_mapping.update_mapping(self.cosmic_harmony_matrix.correlation_matrix)
+        matrix = self.cosmic_harmony_matrix.correlation_matrix
+        row = matrix[sign_index]
+        row[tone_index] += 0.1
+        row *= 1.0 / row.sum()
+        
+        # Hand the mapping a snapshot; update_mapping is free to write to it
+        self.tone_zodiac_mapping.update_mapping(matrix.copy())
     
     # Other methods remain the same
 
+_SYSTEM = None
+_SYSTEM_LOCK = threading.Lock()
+
+def get_system() -> QuantumelodicMetasystem:
+    """Build the metasystem once per process; requests use get_system().for_request()"""
+    global _SYSTEM
+    with _SYSTEM_LOCK:
+        if _SYSTEM is None:
+            _SYSTEM = QuantumelodicMetasystem()
+        return _SYSTEM
+
 app = Flask(__name__)
 
+def _numpy_default(obj):
+    # Stdlib fallback for the NumPy arrays and scalars orjson serializes natively
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def json_response(payload):
+    if orjson is not None:
+        body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        body = json.dumps(payload, default=_numpy_default)
+    return app.response_class(body, mimetype='application/json')
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -173,7 +248,7 @@ def generate_composition():
     data = request.json
     natal_chart = {planet: (sign, house) for planet, (sign, house) in data['natal_chart'].items()}
     
-    system = QuantumelodicMetasystem()
+    system = get_system().for_request()
     composition = system.generate_composition(natal_chart)
     
     # Convert composition to a simple representation for JSON
@@ -188,7 +263,7 @@ def generate_composition():
                 "chords": [str(c) for c in element.getElementsByClass('Chord')]
             })
     
-    return jsonify({"composition": simple_composition})
+    return json_response({"composition": simple_composition})
 
 @app.route('/visualize', methods=['POST'])
 def visualize_chart():
@@ -198,7 +273,7 @@ def visualize_chart():
     # Process the natal chart data for visualization
     visualization_data = process_chart_for_visualization(natal_chart)
     
-    return jsonify(visualization_data)
+    return json_response(visualization_data)
 
 def process_chart_for_visualization(natal_chart):
     # Process the natal chart data into a format suitable for D3.js visualization
@@ -214,5 +289,6 @@ def process_chart_for_visualization(natal_chart):
     return visualization_data
 
 if __name__ == "__main__":
-    app.run(debug=True)
+    # Development server only; use serve.sh (gunicorn) in production
+    app.run(debug=os.environ.get("FLASK_DEBUG") == "1", threaded=True)
 
@@ -4,17 +4,85 @@ A comprehensive system for translating astrological charts into unique musical c
 Version: 1.0.0
 """
 
+import bisect
+import copy
 import json
+import logging
 import numpy as np
-from datetime import datetime
+from collections import OrderedDict, defaultdict
+import time
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
+from functools import lru_cache
+from types import MappingProxyType
 import hashlib
+import struct
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels run as plain NumPy without it
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; output falls back to the stdlib encoder
+    orjson = None
 
 # Import our modules (in production, these would be separate files)
 # from quantumelodic_api_client import AstrologyAPIClient, BirthData, QuantumelodicDataTransformer
 # from quantumelodic_uniqueness import QuantumelodicUniqueness
 
+logger = logging.getLogger(__name__)
+
+# Base note frequencies (simplified calculation)
+_NOTE_FREQS = MappingProxyType({
+    'C': 261.63, 'Db': 277.18, 'D': 293.66, 'Eb': 311.13,
+    'E': 329.63, 'F': 349.23, 'Gb': 369.99, 'G': 392.00,
+    'Ab': 415.30, 'A': 440.00, 'Bb': 466.16, 'B': 493.88
+})
+
+# Visualization colors per planet
+_PLANET_COLORS = MappingProxyType({
+    'Sun': '#FFD700',      # Gold
+    'Moon': '#C0C0C0',     # Silver
+    'Mercury': '#FF8C00',   # Dark Orange
+    'Venus': '#FF69B4',     # Hot Pink
+    'Mars': '#DC143C',      # Crimson
+    'Jupiter': '#4B0082',   # Indigo
+    'Saturn': '#2F4F4F',    # Dark Slate Gray
+    'Uranus': '#00CED1',    # Dark Turquoise
+    'Neptune': '#4682B4',   # Steel Blue
+    'Pluto': '#8B0000'      # Dark Red
+})
+
+# Chord added to the progression for each aspect feeling
+_FEELING_TO_CHORD = MappingProxyType({
+    'harmonious blend': 'I',
+    'smooth harmony': 'V',
+    'subtle harmony': 'vi',
+    'tension': 'bII',  # Neapolitan
+    'dynamic contrast': 'IV',
+    'unresolved': 'V7sus4'
+})
+
+# Tempo markings; a tempo below _TEMPO_CUTS[i] gets _TEMPO_NAMES[i]
+_TEMPO_CUTS = (60, 76, 108, 120, 168)
+_TEMPO_NAMES = ('Largo', 'Adagio', 'Andante', 'Moderato', 'Allegro', 'Presto')
+
+
+
+def _harmonic_sort_key(harmonic: Dict) -> Tuple[str, ...]:
+    """Stable ordering for harmonics in the musical DNA"""
+    return (harmonic['type'], *harmonic['planets'])
+
+
+@njit(cache=True)
+def _freq_kernel(tonics: np.ndarray, degrees: np.ndarray, houses: np.ndarray) -> np.ndarray:
+    """Apply degree and house modifiers to the tonic frequencies"""
+    return tonics * (1.0 + degrees / 360.0) * (1.0 + (houses / 12.0) * 0.1)
+
 class QuantumelodicMetaSystem:
     """
     The complete Quantumelodic MetaSystem
@@ -31,7 +99,12 @@ class QuantumelodicMetaSystem:
         # Musical mappings from datasets
         self.initialize_mappings()
         
-    def initialize_mappings(self):
+        # Compositions are a pure function of the birth data; keep the most
+        # recent ones so repeat charts skip the whole pipeline
+        self.cache_size = 1024
+        self._composition_cache = OrderedDict()
+        
+    def initialize_mappings(self) -> None:
         """Initialize all musical mappings from the datasets"""
         
         # Planetary correspondences
@@ -103,8 +176,21 @@ class QuantumelodicMetaSystem:
             11: {'theme': 'Community', 'musical_role': 'Collective Harmony'},
             12: {'theme': 'Transcendence', 'musical_role': 'Ethereal Resolution'}
         }
+        
+        # Column-wise copies of the planetary mappings, aligned with
+        # _planet_index, so per-planet fields are read by position and numeric
+        # columns can be computed over whole arrays
+        mappings = list(self.planetary_mappings.values())
+        self._planet_names = tuple(self.planetary_mappings)
+        self._planet_index = {planet: i for i, planet in enumerate(self._planet_names)}
+        self._planet_tonics = tuple(m['tonic'] for m in mappings)
+        self._planet_modes = tuple(m['mode'] for m in mappings)
+        self._planet_instruments = tuple(m['instruments'] for m in mappings)
+        self._planet_themes = tuple(m['themes'] for m in mappings)
+        self._planet_tempos = np.array([m['tempo'] for m in mappings], dtype=np.int16)
+        self._tonic_freqs = np.array([_NOTE_FREQS.get(tonic, 440.0) for tonic in self._planet_tonics])
     
-    def generate_composition(self, birth_data: Dict) -> Dict:
+    def generate_composition(self, birth_data: Dict) -> Optional[Dict]:
         """
         Generate a complete musical composition from birth data
         
@@ -114,39 +200,64 @@ class QuantumelodicMetaSystem:
         Returns:
             Complete composition data including frequencies, structure, and instructions
         """
+        key = tuple(sorted(birth_data.items()))
+        if key in self._composition_cache:
+            self._composition_cache.move_to_end(key)
+            composition = copy.deepcopy(self._composition_cache[key])
+        else:
+            composition = self._generate_composition(birth_data)
+            if composition is None:
+                return None
+            
+            self._composition_cache[key] = composition
+            if len(self._composition_cache) > self.cache_size:
+                self._composition_cache.popitem(last=False)
+            composition = copy.deepcopy(composition)
+        
+        # The cached payload is timeless; each returned copy is stamped now
+        composition['metadata']['generated_at'] = self._generated_at()
+        return composition
+    
+    @staticmethod
+    def _generated_at() -> str:
+        """Current UTC time as an ISO string"""
+        return datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat()
+    
+    def _generate_composition(self, birth_data: Dict) -> Optional[Dict]:
+        """Run the full composition pipeline without caching"""
         
         # Step 1: Fetch and transform astrological data
-        print("🌟 Step 1: Fetching astrological data...")
+        logger.debug("Step 1: Fetching astrological data...")
         chart_data = self._fetch_chart_data(birth_data)
         
         if not chart_data:
             return None
         
         # Step 2: Generate unique frequencies
-        print("🎵 Step 2: Calculating unique frequencies...")
+        logger.debug("Step 2: Calculating unique frequencies...")
         frequencies = self._generate_frequencies(chart_data)
         
         # Step 3: Analyze aspects and create harmonic relationships
-        print("🎼 Step 3: Analyzing harmonic relationships...")
+        logger.debug("Step 3: Analyzing harmonic relationships...")
         harmonics = self._analyze_harmonics(chart_data, frequencies)
         
         # Step 4: Create musical structure
-        print("🎹 Step 4: Designing musical structure...")
+        logger.debug("Step 4: Designing musical structure...")
         structure = self._create_musical_structure(chart_data, frequencies, harmonics)
         
         # Step 5: Generate performance instructions
-        print("📜 Step 5: Creating performance instructions...")
+        logger.debug("Step 5: Creating performance instructions...")
         instructions = self._generate_performance_instructions(structure)
         
         # Step 6: Create musical DNA
-        print("🧬 Step 6: Generating Musical DNA...")
+        logger.debug("Step 6: Generating Musical DNA...")
         musical_dna = self._generate_musical_dna(frequencies, harmonics)
         
         # Compile complete composition
         composition = {
             'metadata': {
                 'birth_data': birth_data,
-                'generated_at': datetime.now().isoformat(),
+                'generated_at': self._generated_at(),
                 'musical_dna': musical_dna,
                 'system_version': '1.0.0'
             },
@@ -190,38 +301,42 @@ class QuantumelodicMetaSystem:
     def _generate_frequencies(self, chart_data: Dict) -> Dict:
         """Generate unique frequencies for each planet"""
         frequencies = {}
-        base_frequency = 432.0  # Cosmic tuning
         
+        planets = []
+        indices = []
         for planet, data in chart_data['planets'].items():
-            if planet in self.planetary_mappings:
-                # Calculate unique frequency
-                mapping = self.planetary_mappings[planet]
-                
-                # Base note frequency (simplified calculation)
-                note_frequencies = {
-                    'C': 261.63, 'Db': 277.18, 'D': 293.66, 'Eb': 311.13,
-                    'E': 329.63, 'F': 349.23, 'Gb': 369.99, 'G': 392.00,
-                    'Ab': 415.30, 'A': 440.00, 'Bb': 466.16, 'B': 493.88
-                }
-                
-                base_freq = note_frequencies.get(mapping['tonic'], 440.0)
-                
-                # Apply unique modifiers
-                degree_modifier = 1 + (data['degree'] / 360)
-                house_modifier = 1 + (data['house'] / 12) * 0.1
-                
-                unique_freq = base_freq * degree_modifier * house_modifier
-                
-                frequencies[planet] = {
-                    'frequency': round(unique_freq, 2),
-                    'note': mapping['tonic'],
-                    'mode': mapping['mode'],
-                    'tempo': mapping['tempo'],
-                    'instruments': mapping['instruments'],
-                    'sign': data['sign'],
-                    'house': data['house'],
-                    'themes': mapping['themes']
-                }
+            i = self._planet_index.get(planet)
+            if i is None:
+                continue
+            planets.append((planet, data))
+            indices.append(i)
+        count = len(planets)
+        
+        planet_idx = np.array(indices, dtype=np.intp)
+        degrees = np.fromiter((data['degree'] for _, data in planets), dtype=np.float64, count=count)
+        houses = np.fromiter((data['house'] for _, data in planets), dtype=np.float64, count=count)
+        
+        # Apply unique modifiers to every planet at once
+        unique_freqs = _freq_kernel(self._tonic_freqs[planet_idx], degrees, houses)
+        tempos = self._planet_tempos[planet_idx]
+        
+        # Frequencies are kept to the cent as integers; the float in Hz is
+        # derived from them rather than rounded per planet
+        cents = np.rint(unique_freqs * 100).astype(np.int64)
+        
+        for (planet, data), i, freq_cents, tempo in zip(
+                planets, planet_idx.tolist(), cents.tolist(), tempos.tolist()):
+            frequencies[planet] = {
+                'frequency': freq_cents / 100,
+                'frequency_cents': freq_cents,
+                'note': self._planet_tonics[i],
+                'mode': self._planet_modes[i],
+                'tempo': tempo,
+                'instruments': self._planet_instruments[i],
+                'sign': data['sign'],
+                'house': data['house'],
+                'themes': self._planet_themes[i]
+            }
         
         return frequencies
     
@@ -229,26 +344,42 @@ class QuantumelodicMetaSystem:
         """Analyze aspect relationships and create harmonics"""
         harmonics = []
         
+        aspects = []
+        mappings = []
         for aspect in chart_data['aspects']:
-            if aspect['type'] in self.aspect_mappings:
-                mapping = self.aspect_mappings[aspect['type']]
-                
-                planet1_freq = frequencies[aspect['planet1']]['frequency']
-                planet2_freq = frequencies[aspect['planet2']]['frequency']
-                
-                # Calculate harmonic relationship
-                harmonic = {
-                    'planets': [aspect['planet1'], aspect['planet2']],
-                    'type': aspect['type'],
-                    'interval': mapping['interval'],
-                    'frequencies': [planet1_freq, planet2_freq],
-                    'chord_type': mapping['chord'],
-                    'feeling': mapping['feeling'],
-                    'strength': 1 - (abs(aspect['orb']) / 10),  # Stronger with tighter orb
-                    'musical_expression': self._get_harmonic_expression(aspect['type'])
-                }
-                
-                harmonics.append(harmonic)
+            mapping = self.aspect_mappings.get(aspect['type'])
+            if mapping is None:
+                continue
+            aspects.append(aspect)
+            mappings.append(mapping)
+        
+        # Stronger with tighter orb
+        orbs = np.fromiter((a['orb'] for a in aspects), dtype=np.float64, count=len(aspects))
+        strengths = 1 - (np.abs(orbs) / 10)
+        
+        # Emit harmonics strongest first so consumers don't need to re-sort
+        order = np.argsort(-strengths, kind='stable')
+        
+        for i, strength in zip(order.tolist(), strengths[order].tolist()):
+            aspect = aspects[i]
+            mapping = mappings[i]
+            
+            planet1_freq = frequencies[aspect['planet1']]['frequency']
+            planet2_freq = frequencies[aspect['planet2']]['frequency']
+            
+            # Calculate harmonic relationship
+            harmonic = {
+                'planets': [aspect['planet1'], aspect['planet2']],
+                'type': aspect['type'],
+                'interval': mapping['interval'],
+                'frequencies': [planet1_freq, planet2_freq],
+                'chord_type': mapping['chord'],
+                'feeling': mapping['feeling'],
+                'strength': strength,
+                'musical_expression': self._get_harmonic_expression(aspect['type'])
+            }
+            
+            harmonics.append(harmonic)
         
         return harmonics
     
@@ -261,8 +392,8 @@ class QuantumelodicMetaSystem:
         key_signature = sun_data['mode'] if sun_data else 'Ionian'
         
         # Calculate tempo from dominant planets
-        tempos = [f['tempo'] for f in frequencies.values()]
-        average_tempo = int(np.mean(tempos))
+        mean_tempo = self._mean_tempo(frequencies)
+        average_tempo = int(mean_tempo)
         
         # Create sections based on house emphasis
         sections = self._create_sections(chart_data, frequencies)
@@ -276,7 +407,7 @@ class QuantumelodicMetaSystem:
             'tempo': average_tempo,
             'sections': sections,
             'progression': progression,
-            'dynamics': self._calculate_dynamics(frequencies),
+            'dynamics': self._calculate_dynamics(frequencies, mean_tempo),
             'form': self._determine_musical_form(chart_data)
         }
         
@@ -287,25 +418,24 @@ class QuantumelodicMetaSystem:
         sections = []
         
         # Group planets by house
-        house_planets = {}
+        house_planets = defaultdict(list)
         for planet, data in chart_data['planets'].items():
-            house = data['house']
-            if house not in house_planets:
-                house_planets[house] = []
-            house_planets[house].append(planet)
+            house_planets[data['house']].append(planet)
         
         # Create sections for houses with planets
-        for house, planets in sorted(house_planets.items()):
-            if house in self.house_themes:
-                theme = self.house_themes[house]
-                sections.append({
-                    'name': theme['musical_role'],
-                    'house': house,
-                    'planets': planets,
-                    'duration_bars': 8 * len(planets),  # More planets = longer section
-                    'dynamics': self._get_section_dynamics(planets, frequencies),
-                    'texture': self._get_section_texture(planets)
-                })
+        for house in sorted(house_planets):
+            theme = self.house_themes.get(house)
+            if theme is None:
+                continue
+            planets = house_planets[house]
+            sections.append({
+                'name': theme['musical_role'],
+                'house': house,
+                'planets': planets,
+                'duration_bars': 8 * len(planets),  # More planets = longer section
+                'dynamics': self._get_section_dynamics(planets, frequencies),
+                'texture': self._get_section_texture(planets)
+            })
         
         return sections
     
@@ -313,20 +443,12 @@ class QuantumelodicMetaSystem:
         """Create chord progression from aspects"""
         progression = ['I']  # Start with tonic
         
-        # Add chords based on harmonic relationships
-        for harmonic in sorted(harmonics, key=lambda h: h['strength'], reverse=True):
-            if harmonic['feeling'] == 'harmonious blend':
-                progression.append('I')
-            elif harmonic['feeling'] == 'smooth harmony':
-                progression.append('V')
-            elif harmonic['feeling'] == 'subtle harmony':
-                progression.append('vi')
-            elif harmonic['feeling'] == 'tension':
-                progression.append('bII')  # Neapolitan
-            elif harmonic['feeling'] == 'dynamic contrast':
-                progression.append('IV')
-            elif harmonic['feeling'] == 'unresolved':
-                progression.append('V7sus4')
+        # Add chords based on harmonic relationships; harmonics arrive
+        # strongest first from _analyze_harmonics
+        for harmonic in harmonics:
+            chord = _FEELING_TO_CHORD.get(harmonic['feeling'])
+            if chord is not None:
+                progression.append(chord)
         
         progression.append('I')  # Return to tonic
         
@@ -361,24 +483,32 @@ class QuantumelodicMetaSystem:
         # Create DNA from frequencies
         freq_string = ""
         for planet, data in sorted(frequencies.items()):
-            freq_int = int(data['frequency'] * 100)
-            freq_string += f"{planet[:2]}{freq_int}"
-        
-        # Add harmonic signature
-        harmonic_sig = hashlib.md5(
-            json.dumps(harmonics, sort_keys=True).encode()
-        ).hexdigest()[:8]
+            freq_string += f"{planet[:2]}{data['frequency_cents']}"
+        
+        # Add harmonic signature over a canonical byte encoding of the
+        # harmonics, ordered so the signature doesn't depend on aspect order
+        buf = bytearray()
+        for harmonic in sorted(harmonics, key=_harmonic_sort_key):
+            freq1, freq2 = harmonic['frequencies']
+            buf += struct.pack('<ddd', freq1, freq2, harmonic['strength'])
+            buf += '\0'.join((harmonic['type'], *harmonic['planets'])).encode()
+            buf += b'\0'
+        harmonic_sig = hashlib.blake2b(buf, digest_size=4).hexdigest()
         
         return f"QM-{freq_string[:20]}-{harmonic_sig}"
     
     def _generate_visualization_data(self, frequencies: Dict, harmonics: List[Dict]) -> Dict:
         """Generate data for visual representation"""
         
+        # Spectrum and color palette come from the same pass over the planets
+        spectrum = []
+        colors = []
+        for p, d in frequencies.items():
+            spectrum.append({'planet': p, 'frequency': d['frequency'], 'amplitude': 1.0})
+            colors.append(_PLANET_COLORS.get(p, '#808080'))
+        
         return {
-            'frequency_spectrum': [
-                {'planet': p, 'frequency': d['frequency'], 'amplitude': 1.0}
-                for p, d in frequencies.items()
-            ],
+            'frequency_spectrum': spectrum,
             'harmonic_connections': [
                 {
                     'from': h['planets'][0],
@@ -388,7 +518,7 @@ class QuantumelodicMetaSystem:
                 }
                 for h in harmonics
             ],
-            'color_palette': self._generate_color_palette(frequencies)
+            'color_palette': colors
         }
     
     # Helper methods
@@ -405,10 +535,15 @@ class QuantumelodicMetaSystem:
         else:
             return '4/4'  # Default
     
-    def _calculate_dynamics(self, frequencies: Dict) -> Dict:
+    def _mean_tempo(self, frequencies: Dict) -> float:
+        """Average tempo of the planets in the frequency map"""
+        planet_idx = [self._planet_index[planet] for planet in frequencies]
+        return float(self._planet_tempos[planet_idx].mean())
+    
+    def _calculate_dynamics(self, frequencies: Dict, avg_tempo: Optional[float] = None) -> Dict:
         """Calculate overall dynamic character"""
-        tempos = [f['tempo'] for f in frequencies.values()]
-        avg_tempo = np.mean(tempos)
+        if avg_tempo is None:
+            avg_tempo = self._mean_tempo(frequencies)
         
         if avg_tempo < 70:
             character = "Contemplative and introspective"
@@ -477,18 +612,8 @@ class QuantumelodicMetaSystem:
     
     def _get_tempo_marking(self, tempo: int) -> str:
         """Convert BPM to musical tempo marking"""
-        if tempo < 60:
-            return f'Largo ({tempo} BPM)'
-        elif tempo < 76:
-            return f'Adagio ({tempo} BPM)'
-        elif tempo < 108:
-            return f'Andante ({tempo} BPM)'
-        elif tempo < 120:
-            return f'Moderato ({tempo} BPM)'
-        elif tempo < 168:
-            return f'Allegro ({tempo} BPM)'
-        else:
-            return f'Presto ({tempo} BPM)'
+        name = _TEMPO_NAMES[bisect.bisect_right(_TEMPO_CUTS, tempo)]
+        return f'{name} ({tempo} BPM)'
     
     def _get_performance_notes(self, section: Dict) -> str:
         """Generate specific performance notes for a section"""
@@ -508,27 +633,16 @@ class QuantumelodicMetaSystem:
                 notes.append('Steady tempo, structural clarity')
         
         return '; '.join(notes) if notes else 'Follow the natural flow of the music'
-    
-    def _generate_color_palette(self, frequencies: Dict) -> List[str]:
-        """Generate color palette for visualization"""
-        planet_colors = {
-            'Sun': '#FFD700',      # Gold
-            'Moon': '#C0C0C0',     # Silver
-            'Mercury': '#FF8C00',   # Dark Orange
-            'Venus': '#FF69B4',     # Hot Pink
-            'Mars': '#DC143C',      # Crimson
-            'Jupiter': '#4B0082',   # Indigo
-            'Saturn': '#2F4F4F',    # Dark Slate Gray
-            'Uranus': '#00CED1',    # Dark Turquoise
-            'Neptune': '#4682B4',   # Steel Blue
-            'Pluto': '#8B0000'      # Dark Red
-        }
-        
-        return [planet_colors.get(p, '#808080') for p in frequencies.keys()]
+
+
+@lru_cache(maxsize=8)
+def _get_system(api_key: str) -> QuantumelodicMetaSystem:
+    """Share one system, and its composition cache, per API key"""
+    return QuantumelodicMetaSystem(api_key)
 
 
 # Export function for easy use
-def create_cosmic_symphony(birth_data: Dict, api_key: str) -> Dict:
+def create_cosmic_symphony(birth_data: Dict, api_key: str) -> Optional[Dict]:
     """
     Main entry point for creating a cosmic symphony
     
@@ -548,8 +662,7 @@ def create_cosmic_symphony(birth_data: Dict, api_key: str) -> Dict:
     Returns:
         Complete composition data
     """
-    system = QuantumelodicMetaSystem(api_key)
-    return system.generate_composition(birth_data)
+    return _get_system(api_key).generate_composition(birth_data)
 
 
 # Example usage
@@ -593,6 +706,10 @@ if __name__ == "__main__":
         print(f"  Tempo: {instructions['tempo_marking']}")
         
         # Save to file
-        with open('cosmic_symphony.json', 'w') as f:
-            json.dump(composition, f, indent=2)
+        if orjson is not None:
+            with open('cosmic_symphony.json', 'wb') as f:
+                f.write(orjson.dumps(composition, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open('cosmic_symphony.json', 'w') as f:
+                json.dump(composition, f, indent=2)
         print("\n💾 Full composition saved to 'cosmic_symphony.json'")
@@ -1,20 +1,116 @@
 """
 Quantumelodic MetaSystem Core
 A system for translating astrological data into unique musical compositions
+
+The example below reads the Free Astrology API key from the
+FREEASTROLOGY_API_KEY environment variable.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import copy
+import importlib.util
 import json
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Dict, List, Tuple
-import numpy as np
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+try:
+    from diskcache import Cache
+except ImportError:  # diskcache is optional; charts are fetched every time without it
+    Cache = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; output falls back to the stdlib encoder
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # httpx is only needed by the async fetch path
+    httpx = None
+
+# Natal charts never change for the same birth data; keep them on disk
+CHART_CACHE_DIR = '.qms_cache'
+CHART_CACHE_EXPIRE = 30 * 86400  # seconds
+BATCH_FETCH_WORKERS = 8
+STRUCTURE_CACHE_SIZE = 256
+
+# Sign modalities used to pick the time signature
+CARDINAL = frozenset({'Aries', 'Cancer', 'Libra', 'Capricorn'})
+MUTABLE = frozenset({'Gemini', 'Virgo', 'Sagittarius', 'Pisces'})
+
+# Chords contributed to the progression by strong consonant aspects
+STRONG_CONSONANT_CHORDS = MappingProxyType({
+    'perfect_5th': 'V',
+    'major_6th': 'vi'
+})
+
+# Compact immutable per-planet result; converted with asdict() when the
+# composition is serialized
+@dataclass(frozen=True, slots=True)
+class PlanetFreq:
+    frequency: float
+    mode: str
+    tempo: int
+    instruments: tuple
+    sign: str
+    degree: float
+
+# Harmonic relationship derived from a chart aspect
+@dataclass(frozen=True, slots=True)
+class Aspect:
+    planets: tuple
+    type: str
+    orb: float
+    interval: str
+    harmony: str
+    strength: float
+
+def _dumps(obj) -> str:
+    """Serialize a composition, including its dataclass records, as indented JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, default=asdict)
 
 class QuantumelodicMetaSystem:
     """Core system for astrological-musical translation"""
     
+    # Fixed position of each sign in the zodiac, used for the sign modifier
+    SIGN_MOD12 = MappingProxyType({
+        'Aries': 0, 'Taurus': 1, 'Gemini': 2, 'Cancer': 3,
+        'Leo': 4, 'Virgo': 5, 'Libra': 6, 'Scorpio': 7,
+        'Sagittarius': 8, 'Capricorn': 9, 'Aquarius': 10, 'Pisces': 11
+    })
+    
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.api_base = "https://api.freeastrologyapi.com/api/v3/native"
+        self._cache = Cache(CHART_CACHE_DIR) if Cache is not None else None
+        
+        # One pooled keep-alive session for every chart request; the adapter
+        # retries connection failures, never a POST the API has already seen
+        self._session = requests.Session()
+        self._session.headers.update({
+            'Content-Type': 'application/json',
+            'x-api-key': api_key
+        })
+        retries = Retry(total=3, backoff_factor=0.3)
+        self._session.mount(
+            'https://',
+            HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+        )
         
         # Musical mappings from your dataset
         self.planetary_modes = {
@@ -53,15 +149,28 @@ class QuantumelodicMetaSystem:
             'Aquarius': {'tempo_mult': 1.05, 'intensity': 'eccentric'},
             'Pisces': {'tempo_mult': 0.8, 'intensity': 'fluid'}
         }
-    
-    def fetch_natal_chart(self, birth_data: Dict) -> Dict:
-        """Fetch natal chart data from API"""
-        headers = {
-            'Content-Type': 'application/json',
-            'x-api-key': self.api_key
-        }
         
-        # Prepare request data
+        # Positional copies of the mappings, indexed by small integers, for
+        # the per-planet loops
+        self._planet_idx = {planet: i for i, planet in enumerate(self.planetary_modes)}
+        self._planet_mode = tuple(m['mode'] for m in self.planetary_modes.values())
+        self._planet_tempo = tuple(m['tempo'] for m in self.planetary_modes.values())
+        self._planet_instruments = tuple(tuple(m['instruments']) for m in self.planetary_modes.values())
+        # Indexed by SIGN_MOD12, the one sign -> index table
+        self._sign_tempo_mult = tuple(self.sign_modifiers[sign]['tempo_mult'] for sign in self.SIGN_MOD12)
+        # Aspect names as the API spells them ('Trine') as well as lowercase,
+        # so the usual case needs no per-aspect lower()
+        self._aspect_lookup = {}
+        for name, interval_data in self.aspect_intervals.items():
+            self._aspect_lookup[name] = interval_data
+            self._aspect_lookup[name.capitalize()] = interval_data
+        
+        # Structures are a pure function of the frequencies and aspects, so
+        # re-analyzing the same chart is served from a bounded LRU
+        self._structure_cache = OrderedDict()
+    
+    def _natal_request(self, birth_data: Dict) -> Tuple[bytes, str]:
+        """Encode the natal chart request body once; its hash is the cache key"""
         request_data = {
             "name": birth_data.get("name", "User"),
             "year": birth_data["year"],
@@ -78,17 +187,85 @@ class QuantumelodicMetaSystem:
             }
         }
         
+        if orjson is not None:
+            body = orjson.dumps(request_data, option=orjson.OPT_SORT_KEYS)
+        else:
+            body = json.dumps(request_data, sort_keys=True, separators=(',', ':')).encode()
+        return body, hashlib.blake2b(body).hexdigest()
+    
+    def _cached_chart(self, key: str) -> Optional[Dict]:
+        """Return a previously fetched chart, if any"""
+        return self._cache.get(key) if self._cache is not None else None
+    
+    def _store_chart(self, key: str, chart: Dict):
+        """Keep a fetched chart on disk for later runs"""
+        if self._cache is not None:
+            self._cache.set(key, chart, expire=CHART_CACHE_EXPIRE)
+    
+    def fetch_natal_chart(self, birth_data: Dict) -> Dict:
+        """Fetch natal chart data from API"""
+        body, key = self._natal_request(birth_data)
+        cached = self._cached_chart(key)
+        if cached is not None:
+            return cached
+        
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.api_base}/natal-chart",
-                headers=headers,
-                json=request_data
+                data=body,
+                timeout=10
             )
             response.raise_for_status()
-            return response.json()
+            chart = response.json()
         except Exception as e:
-            print(f"Error fetching natal chart: {e}")
+            logger.warning("Error fetching natal chart: %s", e)
             return None
+        
+        self._store_chart(key, chart)
+        return chart
+    
+    def _async_client(self):
+        """New httpx client; multiplexes requests over HTTP/2 when h2 is installed
+        
+        httpx pools are bound to the event loop that opened them, so clients
+        are scoped to one call (async with) rather than kept on the instance.
+        """
+        if httpx is None:
+            raise ImportError("the async fetch path needs httpx; install it with `pip install httpx`")
+        return httpx.AsyncClient(
+            http2=importlib.util.find_spec('h2') is not None,
+            headers={'Content-Type': 'application/json', 'x-api-key': self.api_key},
+            timeout=10.0
+        )
+    
+    async def afetch_natal_chart(self, birth_data: Dict, client=None) -> Dict:
+        """Fetch natal chart data from API without blocking the event loop
+        
+        Pass an open client to share its connections across several fetches;
+        otherwise one is opened for this call.
+        """
+        body, key = self._natal_request(birth_data)
+        cached = self._cached_chart(key)
+        if cached is not None:
+            return cached
+        
+        if client is None:
+            async with self._async_client() as client:
+                return await self.afetch_natal_chart(birth_data, client)
+        
+        try:
+            response = await client.post(
+                f"{self.api_base}/natal-chart",
+                content=body
+            )
+            response.raise_for_status()
+            chart = response.json()
+        except Exception as e:
+            logger.warning("Error fetching natal chart: %s", e)
+            return None
+        
+        self._store_chart(key, chart)
+        return chart
     
     def calculate_frequencies(self, chart_data: Dict) -> Dict:
         """Calculate unique frequencies based on planetary positions"""
@@ -100,58 +277,102 @@ class QuantumelodicMetaSystem:
             
         planets = chart_data.get('planets', {})
         
+        placements = []
         for planet, data in planets.items():
-            if planet in self.planetary_modes:
-                # Get base note frequency
-                note = self.planetary_modes[planet]['tonic']
-                sign = data.get('sign', 'Aries')
-                degree = data.get('degree', 0)
-                
-                # Calculate unique frequency based on position
-                # This creates a unique frequency for each planetary position
-                frequency_modifier = 1 + (degree / 360)  # 1.0 to 1.0833
-                sign_modifier = hash(sign) % 12 / 12  # 0 to 1 based on sign
-                
-                # Create unique frequency
-                planet_freq = base_frequency * frequency_modifier * (1 + sign_modifier * 0.1)
-                
-                frequencies[planet] = {
-                    'frequency': round(planet_freq, 2),
-                    'mode': self.planetary_modes[planet]['mode'],
-                    'tempo': int(self.planetary_modes[planet]['tempo'] * 
-                                self.sign_modifiers.get(sign, {}).get('tempo_mult', 1.0)),
-                    'instruments': self.planetary_modes[planet]['instruments'],
-                    'sign': sign,
-                    'degree': degree
-                }
+            idx = self._planet_idx.get(planet)
+            if idx is None:
+                continue
+            sign = data.get('sign', 'Aries')
+            placements.append((planet, idx, sign, data.get('degree', 0), self.SIGN_MOD12.get(sign)))
+        count = len(placements)
+        
+        # NumPy is only needed here; importing it lazily keeps module import
+        # (and Streamlit cold starts) cheap
+        import numpy as np
+        degrees = np.fromiter((p[3] for p in placements), dtype=np.float64, count=count)
+        # Signs outside the zodiac count as Aries for the modifier
+        sign_ids = np.fromiter((p[4] if p[4] is not None else 0 for p in placements),
+                               dtype=np.int8, count=count)
+        tempos = np.fromiter((self._planet_tempo[p[1]] for p in placements), dtype=np.float64, count=count)
+        tempo_mults = np.fromiter(
+            (self._sign_tempo_mult[p[4]] if p[4] is not None else 1.0 for p in placements),
+            dtype=np.float64, count=count
+        )
+        
+        # Calculate unique frequency based on position
+        # This creates a unique frequency for each planetary position
+        frequency_modifiers = 1 + (degrees / 360)  # 1.0 to 1.0833
+        sign_modifiers = sign_ids / 12  # 0 to 1 based on sign
+        planet_freqs = base_frequency * frequency_modifiers * (1 + sign_modifiers * 0.1)
+        planet_tempos = (tempos * tempo_mults).astype(np.int64)
+        
+        for (planet, idx, sign, degree, _), planet_freq, tempo in zip(
+                placements, planet_freqs.tolist(), planet_tempos.tolist()):
+            frequencies[planet] = PlanetFreq(
+                frequency=round(planet_freq, 2),
+                mode=self._planet_mode[idx],
+                tempo=tempo,
+                instruments=self._planet_instruments[idx],
+                sign=sign,
+                degree=degree
+            )
         
         return frequencies
     
-    def generate_aspect_harmonics(self, chart_data: Dict) -> List[Dict]:
+    def generate_aspect_harmonics(self, chart_data: Dict) -> List[Aspect]:
         """Generate harmonic relationships based on aspects"""
-        aspects = []
-        aspect_data = chart_data.get('aspects', [])
-        
-        for aspect in aspect_data:
-            if aspect['aspect_name'].lower() in self.aspect_intervals:
-                interval_data = self.aspect_intervals[aspect['aspect_name'].lower()]
-                aspects.append({
-                    'planets': [aspect['planet1'], aspect['planet2']],
-                    'type': aspect['aspect_name'],
-                    'orb': aspect['orb'],
-                    'interval': interval_data['interval'],
-                    'harmony': interval_data['harmony'],
-                    'strength': 1 - (abs(aspect['orb']) / 8)  # Strength based on orb
-                })
-        
-        return aspects
+        lookup = self._aspect_lookup
+        return [
+            Aspect(
+                planets=(a['planet1'], a['planet2']),
+                type=a['aspect_name'],
+                orb=a['orb'],
+                interval=iv['interval'],
+                harmony=iv['harmony'],
+                strength=1 - (abs(a['orb']) / 8)  # Strength based on orb
+            )
+            for a in chart_data.get('aspects', [])
+            if (iv := lookup.get(a['aspect_name']) or lookup.get(a['aspect_name'].lower())) is not None
+        ]
     
-    def create_musical_structure(self, frequencies: Dict, aspects: List[Dict]) -> Dict:
+    def create_musical_structure(self, frequencies: Dict, aspects: List[Aspect]) -> Dict:
         """Create the overall musical structure"""
+        key = (
+            tuple(sorted(frequencies.items())),
+            tuple(aspects)
+        )
+        if key in self._structure_cache:
+            self._structure_cache.move_to_end(key)
+            return copy.deepcopy(self._structure_cache[key])
+        
+        structure = self._build_structure(frequencies, aspects)
+        self._structure_cache[key] = structure
+        if len(self._structure_cache) > STRUCTURE_CACHE_SIZE:
+            self._structure_cache.popitem(last=False)
+        return copy.deepcopy(structure)
+    
+    def _build_structure(self, frequencies: Dict, aspects: List[Aspect]) -> Dict:
+        """Create the musical structure without caching"""
+        # Gather sign and tempo aggregates in a single pass over the planets
+        weights = {'Sun': 3, 'Moon': 2, 'Ascendant': 2}
+        cardinal_count = 0
+        has_mutable = False
+        total_tempo = 0
+        total_weight = 0
+        for planet, data in frequencies.items():
+            sign = data.sign
+            if sign in CARDINAL:
+                cardinal_count += 1
+            elif sign in MUTABLE:
+                has_mutable = True
+            weight = weights.get(planet, 1)
+            total_tempo += data.tempo * weight
+            total_weight += weight
+        
         structure = {
             'key_signature': self._determine_key_signature(frequencies),
-            'time_signature': self._determine_time_signature(frequencies),
-            'tempo': self._calculate_overall_tempo(frequencies),
+            'time_signature': self._determine_time_signature(cardinal_count, has_mutable),
+            'tempo': self._calculate_overall_tempo(total_tempo, total_weight),
             'sections': self._create_sections(frequencies, aspects),
             'progression': self._create_chord_progression(frequencies, aspects)
         }
@@ -161,45 +382,27 @@ class QuantumelodicMetaSystem:
     def _determine_key_signature(self, frequencies: Dict) -> str:
         """Determine overall key based on Sun, Moon, and Ascendant"""
         # Priority: Sun > Ascendant > Moon
-        if 'Sun' in frequencies:
-            return frequencies['Sun']['mode']
-        elif 'Ascendant' in frequencies:
-            return frequencies['Ascendant']['mode']
-        elif 'Moon' in frequencies:
-            return frequencies['Moon']['mode']
+        for planet in ('Sun', 'Ascendant', 'Moon'):
+            data = frequencies.get(planet)
+            if data is not None:
+                return data.mode
         return 'Ionian'  # Default to major
     
-    def _determine_time_signature(self, frequencies: Dict) -> str:
+    def _determine_time_signature(self, cardinal_count: int, has_mutable: bool) -> str:
         """Determine time signature based on element distribution"""
         # This is a simplified version - could be enhanced
-        cardinal_count = sum(1 for p in frequencies.values() 
-                           if p['sign'] in ['Aries', 'Cancer', 'Libra', 'Capricorn'])
-        
         if cardinal_count >= 3:
             return "4/4"  # Strong, driving rhythm
-        elif any(p['sign'] in ['Gemini', 'Virgo', 'Sagittarius', 'Pisces'] 
-                for p in frequencies.values()):
+        elif has_mutable:
             return "6/8"  # Flowing, mutable
         else:
             return "3/4"  # Waltz-like, fixed
     
-    def _calculate_overall_tempo(self, frequencies: Dict) -> int:
+    def _calculate_overall_tempo(self, total_tempo: int, total_weight: int) -> int:
         """Calculate weighted average tempo"""
-        if not frequencies:
-            return 120
-            
-        total_tempo = 0
-        weights = {'Sun': 3, 'Moon': 2, 'Ascendant': 2}
-        total_weight = 0
-        
-        for planet, data in frequencies.items():
-            weight = weights.get(planet, 1)
-            total_tempo += data['tempo'] * weight
-            total_weight += weight
-        
         return int(total_tempo / total_weight) if total_weight > 0 else 120
     
-    def _create_sections(self, frequencies: Dict, aspects: List[Dict]) -> List[Dict]:
+    def _create_sections(self, frequencies: Dict, aspects: List[Aspect]) -> List[Dict]:
         """Create musical sections based on house placements"""
         # Simplified version - would integrate house data
         sections = [
@@ -210,21 +413,22 @@ class QuantumelodicMetaSystem:
         ]
         return sections
     
-    def _create_chord_progression(self, frequencies: Dict, aspects: List[Dict]) -> List[str]:
+    def _create_chord_progression(self, frequencies: Dict, aspects: List[Aspect]) -> List[str]:
         """Create chord progression based on aspects"""
         progression = []
         
         # Start with tonic
         progression.append("I")
         
-        # Add chords based on harmonious aspects
+        # Add chords based on harmonious aspects, keeping aspect order
         for aspect in aspects:
-            if aspect['harmony'] == 'consonant' and aspect['strength'] > 0.5:
-                if aspect['interval'] == 'perfect_5th':
-                    progression.append("V")
-                elif aspect['interval'] == 'major_6th':
-                    progression.append("vi")
-            elif aspect['harmony'] == 'dissonant':
+            harmony = aspect.harmony
+            if harmony == 'consonant':
+                if aspect.strength > 0.5:
+                    chord = STRONG_CONSONANT_CHORDS.get(aspect.interval)
+                    if chord is not None:
+                        progression.append(chord)
+            elif harmony == 'dissonant':
                 progression.append("bII")  # Neapolitan
         
         # Return to tonic
@@ -234,19 +438,41 @@ class QuantumelodicMetaSystem:
     
     def generate_composition(self, birth_data: Dict) -> Dict:
         """Generate complete musical composition from birth data"""
-        print("🌟 Fetching natal chart data...")
+        logger.info("Fetching natal chart data")
         chart_data = self.fetch_natal_chart(birth_data)
         
         if not chart_data:
             return None
         
-        print("🎵 Calculating unique frequencies...")
+        return self._compose(birth_data, chart_data)
+    
+    def generate_compositions_batch(self, birth_data_list: List[Dict]) -> List[Dict]:
+        """Generate compositions for several charts, fetching them concurrently"""
+        logger.info("Fetching %d natal charts", len(birth_data_list))
+        with ThreadPoolExecutor(max_workers=BATCH_FETCH_WORKERS) as ex:
+            charts = list(ex.map(self.fetch_natal_chart, birth_data_list))
+        
+        return [self._compose(birth_data, chart_data) if chart_data else None
+                for birth_data, chart_data in zip(birth_data_list, charts)]
+    
+    async def agenerate_compositions(self, birth_data_list: List[Dict]) -> List[Dict]:
+        """Generate compositions for several charts, fetching them concurrently"""
+        logger.info("Fetching %d natal charts", len(birth_data_list))
+        async with self._async_client() as client:
+            charts = await asyncio.gather(*(self.afetch_natal_chart(b, client) for b in birth_data_list))
+        
+        return [self._compose(birth_data, chart_data) if chart_data else None
+                for birth_data, chart_data in zip(birth_data_list, charts)]
+    
+    def _compose(self, birth_data: Dict, chart_data: Dict) -> Dict:
+        """Turn fetched chart data into a composition"""
+        logger.info("Calculating unique frequencies")
         frequencies = self.calculate_frequencies(chart_data)
         
-        print("🎼 Analyzing aspect harmonics...")
+        logger.info("Analyzing aspect harmonics")
         aspects = self.generate_aspect_harmonics(chart_data)
         
-        print("🎹 Creating musical structure...")
+        logger.info("Creating musical structure")
         structure = self.create_musical_structure(frequencies, aspects)
         
         composition = {
@@ -265,8 +491,12 @@ class QuantumelodicMetaSystem:
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
     # Initialize system
-    api_key = "Wno8gGxCZO91mq9qaRgqU8oJrMDZ6WXy4FQjua4t"
+    api_key = os.environ.get("FREEASTROLOGY_API_KEY")
+    if not api_key:
+        raise SystemExit("Set FREEASTROLOGY_API_KEY to run the example")
     qms = QuantumelodicMetaSystem(api_key)
     
     # Example birth data
@@ -287,4 +517,4 @@ if __name__ == "__main__":
     
     if composition:
         print("\n✨ Composition Generated!")
-        print(json.dumps(composition, indent=2))
\ No newline at end of file
+        print(_dumps(composition))
\ No newline at end of file
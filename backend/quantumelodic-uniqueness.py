@@ -3,77 +3,332 @@ Advanced Uniqueness Algorithm for Quantumelodic MetaSystem
 Ensures each natal chart produces a truly unique musical composition
 """
 
+import copy
 import numpy as np
-from typing import Dict, List, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 import hashlib
-from datetime import datetime
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels run as plain Python without it
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+PHI = 1.618033988749895  # Golden ratio
+UNIQUE_FREQUENCY_CACHE_SIZE = 4096
+
+class PlanetID(IntEnum):
+    SUN = 0
+    MOON = 1
+    MERCURY = 2
+    VENUS = 3
+    MARS = 4
+    JUPITER = 5
+    SATURN = 6
+    URANUS = 7
+    NEPTUNE = 8
+    PLUTO = 9
+
+class SignID(IntEnum):
+    ARIES = 0
+    TAURUS = 1
+    GEMINI = 2
+    CANCER = 3
+    LEO = 4
+    VIRGO = 5
+    LIBRA = 6
+    SCORPIO = 7
+    SAGITTARIUS = 8
+    CAPRICORN = 9
+    AQUARIUS = 10
+    PISCES = 11
+
+class Element(IntEnum):
+    FIRE = 0
+    EARTH = 1
+    AIR = 2
+    WATER = 3
+
+class Quality(IntEnum):
+    CARDINAL = 0
+    FIXED = 1
+    MUTABLE = 2
+
+# Every table below is indexed by these ids, translated from names once at
+# entry; unknown planet or sign names index each table's trailing default slot
+PLANETS = tuple(p.name.title() for p in PlanetID)
+SIGNS = tuple(s.name.title() for s in SignID)
+ELEMENTS = tuple(e.name.title() for e in Element)
+QUALITIES = tuple(q.name.title() for q in Quality)
+PLANET_INDEX = {planet: i for i, planet in enumerate(PLANETS)}
+SIGN_INDEX = {sign: i for i, sign in enumerate(SIGNS)}
+
+# Element and modality of each sign, Earth and Cardinal for anything else
+SIGN_ELEMENT = np.array([
+    Element.FIRE, Element.EARTH, Element.AIR, Element.WATER,
+    Element.FIRE, Element.EARTH, Element.AIR, Element.WATER,
+    Element.FIRE, Element.EARTH, Element.AIR, Element.WATER,
+    Element.EARTH
+], dtype=np.int8)
+SIGN_QUALITY = np.array([
+    Quality.CARDINAL, Quality.FIXED, Quality.MUTABLE,
+    Quality.CARDINAL, Quality.FIXED, Quality.MUTABLE,
+    Quality.CARDINAL, Quality.FIXED, Quality.MUTABLE,
+    Quality.CARDINAL, Quality.FIXED, Quality.MUTABLE,
+    Quality.CARDINAL
+], dtype=np.int8)
+
+# Swing factor per sign (0.5 to 1.0), spread by a fixed multiplicative hash so
+# it is stable across processes, unlike the builtin str hash
+SIGN_SWING = np.array([0.5 + (sign_id * 0x9E37 % 50) / 100 for sign_id in range(len(SignID) + 1)])
+
+# Waveform per planet, sine for anything else
+WAVEFORM = (
+    'sawtooth',  # Bright, full spectrum
+    'sine',      # Pure, emotional
+    'square',    # Clear, articulate
+    'triangle',  # Smooth, warm
+    'sawtooth',  # Aggressive, cutting
+    'complex',   # Rich harmonics
+    'square',    # Structured
+    'noise',     # Experimental
+    'sine_pad',  # Ethereal
+    'pulse',     # Intense
+    'sine'
+)
+
+# Filter per element, by Element id
+ELEMENT_FILTER = (
+    ('highpass', 800, 0.7),
+    ('lowpass', 400, 0.3),
+    ('bandpass', 1200, 0.5),
+    ('lowpass', 600, 0.6)
+)
+ELEMENT_CUTOFF = np.array([cutoff for _, cutoff, _ in ELEMENT_FILTER], dtype=np.float64)
+
+# Attack, decay, sustain and release per planet; anything else uses the Sun's
+ENVELOPE_ADSR = np.array([
+    [0.1, 0.2, 0.8, 0.5],
+    [0.3, 0.4, 0.5, 1.0],
+    [0.01, 0.1, 0.4, 0.2],
+    [0.5, 0.3, 0.7, 0.8],
+    [0.001, 0.05, 0.9, 0.1],
+    [0.2, 0.3, 0.9, 0.6],
+    [0.8, 0.5, 0.6, 1.5],
+    [0.001, 0.001, 0.3, 0.01],
+    [2.0, 1.0, 0.7, 3.0],
+    [0.5, 0.2, 1.0, 0.5],
+    [0.1, 0.2, 0.8, 0.5]
+])
+
+# Attack and release scaling per element, by Element id
+ELEMENT_ENVELOPE_MOD = np.array([
+    [0.5, 0.5],
+    [2.0, 2.0],
+    [0.7, 0.7],
+    [1.5, 1.5]
+])
+
+# Final envelope for every planet x element pair, fused once at import
+ADSR_TABLE = np.repeat(ENVELOPE_ADSR[:, None, :], len(Element), axis=1)
+ADSR_TABLE[:, :, 0] *= ELEMENT_ENVELOPE_MOD[:, 0]
+ADSR_TABLE[:, :, 3] *= ELEMENT_ENVELOPE_MOD[:, 1]
+
+# Rhythm pattern and subdivision per modality, by Quality id
+QUALITY_RHYTHM = (
+    ((1, 0, 0, 1), 4),
+    ((1, 1, 1, 1), 4),
+    ((1, 0, 1, 0, 1, 0), 6)
+)
+
+# Base frequency per planet, with 440 Hz for anything else
+PLANET_BASE = np.array([
+    261.63,  # C4
+    293.66,  # D4
+    329.63,  # E4
+    349.23,  # F4
+    392.00,  # G4
+    440.00,  # A4
+    493.88,  # B4
+    523.25,  # C5
+    587.33,  # D5
+    659.25,  # E5
+    440.0
+])
+
+# Sacred geometry ratios
+SACRED_RATIOS = MappingProxyType({
+    'unison': 1/1,
+    'minor_second': 16/15,
+    'major_second': 9/8,
+    'minor_third': 6/5,
+    'major_third': 5/4,
+    'perfect_fourth': 4/3,
+    'tritone': 45/32,
+    'perfect_fifth': 3/2,
+    'minor_sixth': 8/5,
+    'major_sixth': 5/3,
+    'minor_seventh': 16/9,
+    'major_seventh': 15/8,
+    'octave': 2/1
+})
+
+# Sacred-ratio interval applied by each sign, with no shift for anything else
+SIGN_MODIFIER = np.array([
+    SACRED_RATIOS['major_third'],
+    SACRED_RATIOS['perfect_fourth'],
+    SACRED_RATIOS['major_second'],
+    SACRED_RATIOS['minor_sixth'],
+    SACRED_RATIOS['perfect_fifth'],
+    SACRED_RATIOS['minor_third'],
+    SACRED_RATIOS['major_sixth'],
+    SACRED_RATIOS['tritone'],
+    SACRED_RATIOS['major_seventh'],
+    SACRED_RATIOS['minor_seventh'],
+    SACRED_RATIOS['major_second'] * 2,
+    SACRED_RATIOS['octave'],
+    1.0
+])
+
+# Planetary orbital periods (in Earth days) for rhythm generation; the
+# luminaries and anything else use a year
+ORBITAL_PERIODS_DAYS = np.array([
+    365.25, 365.25, 87.97, 224.70, 686.98, 4332.59,
+    10759.22, 30688.5, 60195.0, 90560.0, 365.25
+])
+
+# Element frequencies (Hz) based on atomic vibrations
+ELEMENT_FREQUENCIES = MappingProxyType({
+    'Fire': 528.0,    # Transformation frequency
+    'Earth': 396.0,   # Grounding frequency
+    'Air': 741.0,     # Expression frequency
+    'Water': 639.0    # Flow frequency
+})
+
+# Overtone multiples per planet, zero-padded to a fixed width; the last row
+# is the default for unknown planets. HARMONIC_COUNT gives each row's length
+HARMONIC_TABLE = np.array([
+    [1, 2, 3, 4, 5],    # Full harmonic series
+    [1, 2, 4, 8, 0],    # Octaves only
+    [1, 3, 5, 7, 9],    # Odd harmonics
+    [1, 2, 3, 5, 8],    # Fibonacci harmonics
+    [1, 2, 4, 5, 7],    # Power harmonics
+    [1, 2, 3, 4, 6],    # Expansion harmonics
+    [1, 2, 4, 0, 0],    # Structural harmonics
+    [1, 3, 7, 11, 0],   # Prime harmonics
+    [1, 2, 3, 6, 9],    # Mystical harmonics
+    [1, 2, 5, 8, 13],   # Transformative harmonics
+    [1, 2, 3, 0, 0]
+], dtype=np.int8)
+HARMONIC_COUNT = np.array([5, 4, 5, 5, 5, 5, 3, 4, 5, 5, 3])
+
+
+@njit(cache=True)
+def _unique_freq_core(base, degree_total, house, time_modifier, harmonic_row, harmonic_count):
+    """Fundamental from its modifiers, plus its overtones for one harmonic profile"""
+    degree_modifier = 1 + (degree_total / 360) * (PHI - 1)
+    house_harmonic = 1 + (house - 1) / 12
+    fundamental = base * degree_modifier * house_harmonic * time_modifier
+    return fundamental, fundamental * harmonic_row[:harmonic_count]
+
+
+# Interval each aspect sounds as, and its ratio; anything else is a unison
+ASPECT_INDEX = {
+    'conjunction': 0,
+    'sextile': 1,
+    'square': 2,
+    'trine': 3,
+    'opposition': 4,
+    'quincunx': 5
+}
+ASPECT_INTERVAL = ('unison', 'major_sixth', 'minor_second', 'perfect_fifth',
+                   'octave', 'minor_seventh', 'unison')
+ASPECT_RATIO = np.array([SACRED_RATIOS[interval] for interval in ASPECT_INTERVAL])
+
+
+MASK64 = (1 << 64) - 1
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15  # splitmix64 increment, spreads planet ids
+
+
+def _mix64(x: int) -> int:
+    """splitmix64 finalizer; a cheap, well-distributed 64-bit integer hash"""
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+
+def _mix64_array(x: np.ndarray) -> np.ndarray:
+    """_mix64 over a uint64 array; NumPy's uint64 arithmetic wraps like the mask"""
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+@dataclass(frozen=True, slots=True)
+class ChartMusic:
+    """Musical parameters of a whole chart as aligned per-planet columns"""
+    fundamentals: np.ndarray     # (n,)
+    harmonics: np.ndarray        # (n, 5), zero past each planet's HARMONIC_COUNT
+    timbre_cutoff: np.ndarray    # (n,)
+    adsr: np.ndarray             # (n, 4) attack, decay, sustain, release
+    aspect_matrix: Optional[np.ndarray] = None  # (n, n, 4) harmony, beat, consonance, modulation
+
 
 class QuantumelodicUniqueness:
     """Advanced algorithms for ensuring musical uniqueness"""
     
-    def __init__(self):
-        # Sacred geometry ratios
-        self.phi = 1.618033988749895  # Golden ratio
-        self.sacred_ratios = {
-            'unison': 1/1,
-            'minor_second': 16/15,
-            'major_second': 9/8,
-            'minor_third': 6/5,
-            'major_third': 5/4,
-            'perfect_fourth': 4/3,
-            'tritone': 45/32,
-            'perfect_fifth': 3/2,
-            'minor_sixth': 8/5,
-            'major_sixth': 5/3,
-            'minor_seventh': 16/9,
-            'major_seventh': 15/8,
-            'octave': 2/1
-        }
+    def __init__(self, birth_epoch: float = 0.0):
+        # Seed for the per-planet time hash, from the birth moment in seconds
+        self._birth_seed = int(birth_epoch * 1e6) & MASK64
         
-        # Planetary orbital periods (in Earth days) for rhythm generation
-        self.orbital_periods = {
-            'Mercury': 87.97,
-            'Venus': 224.70,
-            'Mars': 686.98,
-            'Jupiter': 4332.59,
-            'Saturn': 10759.22,
-            'Uranus': 30688.5,
-            'Neptune': 60195.0,
-            'Pluto': 90560.0
-        }
+        # calculate_unique_frequency is a pure function of its arguments and
+        # the seed, so repeat placements are served from a bounded LRU
+        self._frequency_cache = OrderedDict()
         
-        # Element frequencies (Hz) based on atomic vibrations
-        self.element_frequencies = {
-            'Fire': 528.0,    # Transformation frequency
-            'Earth': 396.0,   # Grounding frequency
-            'Air': 741.0,     # Expression frequency
-            'Water': 639.0    # Flow frequency
-        }
+        # Shared read-only tables, built once at import
+        self.phi = PHI
+        self.sacred_ratios = SACRED_RATIOS
+        self.element_frequencies = ELEMENT_FREQUENCIES
     
     def calculate_unique_frequency(self, planet: str, sign: str, degree: float, 
                                  minute: float, house: int) -> Dict:
         """
         Calculate a truly unique frequency based on multiple factors
         """
+        key = (planet, sign, degree, minute, house)
+        if key in self._frequency_cache:
+            self._frequency_cache.move_to_end(key)
+            return copy.deepcopy(self._frequency_cache[key])
+        
+        result = self._calculate_unique_frequency(planet, sign, degree, minute, house)
+        self._frequency_cache[key] = result
+        if len(self._frequency_cache) > UNIQUE_FREQUENCY_CACHE_SIZE:
+            self._frequency_cache.popitem(last=False)
+        return copy.deepcopy(result)
+    
+    def _calculate_unique_frequency(self, planet: str, sign: str, degree: float,
+                                    minute: float, house: int) -> Dict:
         # Base frequency from planet-sign combination
         base_freq = self._get_base_frequency(planet, sign)
-        
-        # Degree modifier (using golden ratio)
-        degree_total = degree + (minute / 60)
-        degree_modifier = 1 + (degree_total / 360) * (self.phi - 1)
-        
-        # House modifier (using harmonic series)
-        house_harmonic = 1 + (house - 1) / 12
+        planet_ix = PLANET_INDEX.get(planet, len(PLANETS))
         
         # Time-based uniqueness (birth moment precision)
+        degree_total = degree + (minute / 60)
         time_hash = self._generate_time_hash(planet, degree_total)
         time_modifier = 1 + (time_hash % 1000) / 10000  # 0.1% to 10.1% variation
         
-        # Calculate final frequency
-        final_frequency = base_freq * degree_modifier * house_harmonic * time_modifier
-        
-        # Calculate harmonics (overtones)
-        harmonics = self._calculate_harmonics(final_frequency, planet)
+        # Golden-ratio degree and harmonic-series house modifiers, then the
+        # overtones, in the compiled core
+        final_frequency, overtones = _unique_freq_core(
+            base_freq, degree_total, house, time_modifier,
+            HARMONIC_TABLE[planet_ix], HARMONIC_COUNT[planet_ix]
+        )
+        final_frequency = float(final_frequency)
+        harmonics = [round(h, 3) for h in overtones.tolist()]
         
         # Calculate rhythm pattern based on orbital period
         rhythm_pattern = self._generate_rhythm_pattern(planet, sign)
@@ -86,223 +341,194 @@ class QuantumelodicUniqueness:
             'amplitude_envelope': self._generate_envelope(planet, sign)
         }
     
-    def _get_base_frequency(self, planet: str, sign: str) -> float:
-        """Get base frequency using planet-sign matrix"""
-        # Using a more complex calculation based on your interval matrix
-        planet_base = {
-            'Sun': 261.63,    # C4
-            'Moon': 293.66,   # D4
-            'Mercury': 329.63, # E4
-            'Venus': 349.23,  # F4
-            'Mars': 392.00,   # G4
-            'Jupiter': 440.00, # A4
-            'Saturn': 493.88, # B4
-            'Uranus': 523.25, # C5
-            'Neptune': 587.33, # D5
-            'Pluto': 659.25   # E5
-        }
+    def calculate_unique_frequencies(self, planets: List[str], signs: List[str],
+                                     degrees, minutes, houses) -> Dict[str, np.ndarray]:
+        """
+        Vectorized calculate_unique_frequency for a whole chart; returns
+        aligned arrays with one entry per planet
+        """
+        planet_ix = np.fromiter((PLANET_INDEX.get(p, len(PLANETS)) for p in planets),
+                                dtype=np.intp, count=len(planets))
+        sign_ix = np.fromiter((SIGN_INDEX.get(s, len(SIGNS)) for s in signs),
+                              dtype=np.intp, count=len(signs))
+        columns = self._frequency_columns(planet_ix, sign_ix, degrees, minutes, houses)
+        columns['fundamentals'] = np.round(columns['fundamentals'], 3)
+        return columns
+    
+    def compute_chart_music(self, planet_ix, sign_ix, degrees, minutes, houses,
+                            aspect_ids=None, orbs=None) -> ChartMusic:
+        """
+        Compute a whole chart's fundamentals, harmonics, timbre cutoffs and
+        envelopes in one pass over per-planet id arrays (PlanetID/SignID).
+        With an (n, n) matrix of aspect ids (ASPECT_INDEX values) and orbs,
+        also fills the pairwise aspect matrix
+        """
+        planet_ix = np.asarray(planet_ix, dtype=np.intp)
+        sign_ix = np.asarray(sign_ix, dtype=np.intp)
+        element_ix = SIGN_ELEMENT[sign_ix]
         
-        sign_modifier = {
-            'Aries': self.sacred_ratios['major_third'],
-            'Taurus': self.sacred_ratios['perfect_fourth'],
-            'Gemini': self.sacred_ratios['major_second'],
-            'Cancer': self.sacred_ratios['minor_sixth'],
-            'Leo': self.sacred_ratios['perfect_fifth'],
-            'Virgo': self.sacred_ratios['minor_third'],
-            'Libra': self.sacred_ratios['major_sixth'],
-            'Scorpio': self.sacred_ratios['tritone'],
-            'Sagittarius': self.sacred_ratios['major_seventh'],
-            'Capricorn': self.sacred_ratios['minor_seventh'],
-            'Aquarius': self.sacred_ratios['major_second'] * 2,
-            'Pisces': self.sacred_ratios['octave']
-        }
+        fundamentals = self._frequency_columns(planet_ix, sign_ix, degrees, minutes, houses)['fundamentals']
+        
+        aspect_matrix = None
+        if aspect_ids is not None:
+            harmony = fundamentals[:, None] * ASPECT_RATIO[np.asarray(aspect_ids, dtype=np.intp)]
+            beat = np.abs(fundamentals[None, :] - harmony)
+            consonance = 1 - (np.abs(np.asarray(orbs, dtype=np.float64)) / 10)
+            consonance = np.broadcast_to(consonance, harmony.shape)
+            aspect_matrix = np.stack((harmony, beat, consonance, beat / 10), axis=-1)
+        
+        return ChartMusic(
+            fundamentals=fundamentals,
+            harmonics=fundamentals[:, None] * HARMONIC_TABLE[planet_ix],
+            timbre_cutoff=ELEMENT_CUTOFF[element_ix],
+            adsr=ADSR_TABLE[planet_ix, element_ix],
+            aspect_matrix=aspect_matrix
+        )
+    
+    def _frequency_columns(self, planet_ix: np.ndarray, sign_ix: np.ndarray,
+                           degrees, minutes, houses) -> Dict[str, np.ndarray]:
+        """Unrounded fundamentals and their modifiers for per-planet id arrays"""
+        degrees = np.asarray(degrees, dtype=np.float64)
+        minutes = np.asarray(minutes, dtype=np.float64)
+        houses = np.asarray(houses, dtype=np.float64)
+        
+        base = PLANET_BASE[planet_ix] * SIGN_MODIFIER[sign_ix]
+        degree_total = degrees + (minutes / 60)
+        degree_modifiers = 1 + (degree_total / 360) * (self.phi - 1)
+        house_harmonics = 1 + (houses - 1) / 12
+        planet_ids = planet_ix.astype(np.uint64) * np.uint64(GOLDEN_GAMMA)
+        degree_bits = (degree_total * 1e6).astype(np.int64).view(np.uint64)
+        time_hashes = _mix64_array(np.uint64(self._birth_seed) ^ planet_ids ^ degree_bits)
+        time_modifiers = 1 + (time_hashes % np.uint64(1000)).astype(np.float64) / 10000
         
-        return planet_base.get(planet, 440.0) * sign_modifier.get(sign, 1.0)
+        return {
+            'fundamentals': base * degree_modifiers * house_harmonics * time_modifiers,
+            'degree_modifiers': degree_modifiers,
+            'house_harmonics': house_harmonics,
+            'time_modifiers': time_modifiers
+        }
+    
+    def _get_base_frequency(self, planet: str, sign: str) -> float:
+        """Get base frequency using planet-sign matrix"""
+        planet_ix = PLANET_INDEX.get(planet, len(PLANETS))
+        sign_ix = SIGN_INDEX.get(sign, len(SIGNS))
+        return float(PLANET_BASE[planet_ix] * SIGN_MODIFIER[sign_ix])
     
     def _generate_time_hash(self, planet: str, degree: float) -> int:
         """Generate unique hash based on precise birth moment"""
-        # Create a unique string from planet position
-        unique_string = f"{planet}_{degree}_{datetime.now().timestamp()}"
-        hash_object = hashlib.sha256(unique_string.encode())
-        return int(hash_object.hexdigest(), 16)
+        # Mix the birth seed with the planet and its exact position
+        planet_id = PLANET_INDEX.get(planet, len(PLANETS))
+        degree_bits = int(degree * 1e6) & MASK64
+        return _mix64(self._birth_seed ^ (planet_id * GOLDEN_GAMMA & MASK64) ^ degree_bits)
     
     def _calculate_harmonics(self, fundamental: float, planet: str) -> List[float]:
         """Calculate overtones based on planetary characteristics"""
-        harmonic_profiles = {
-            'Sun': [1, 2, 3, 4, 5],      # Full harmonic series
-            'Moon': [1, 2, 4, 8],         # Octaves only
-            'Mercury': [1, 3, 5, 7, 9],   # Odd harmonics
-            'Venus': [1, 2, 3, 5, 8],     # Fibonacci harmonics
-            'Mars': [1, 2, 4, 5, 7],      # Power harmonics
-            'Jupiter': [1, 2, 3, 4, 6],   # Expansion harmonics
-            'Saturn': [1, 2, 4],          # Structural harmonics
-            'Uranus': [1, 3, 7, 11],      # Prime harmonics
-            'Neptune': [1, 2, 3, 6, 9],   # Mystical harmonics
-            'Pluto': [1, 2, 5, 8, 13]     # Transformative harmonics
-        }
-        
-        profile = harmonic_profiles.get(planet, [1, 2, 3])
-        return [round(fundamental * h, 3) for h in profile]
+        planet_ix = PLANET_INDEX.get(planet, len(PLANETS))
+        overtones = fundamental * HARMONIC_TABLE[planet_ix, :HARMONIC_COUNT[planet_ix]]
+        return [round(h, 3) for h in overtones.tolist()]
     
     def _generate_rhythm_pattern(self, planet: str, sign: str) -> Dict:
         """Generate unique rhythm based on orbital mechanics"""
         # Base rhythm from orbital period
-        orbital_rhythm = self.orbital_periods.get(planet, 365.25)
+        orbital_rhythm = float(ORBITAL_PERIODS_DAYS[PLANET_INDEX.get(planet, len(PLANETS))])
         
         # Normalize to musical tempo (60-180 BPM)
         base_tempo = 60 + (orbital_rhythm % 120)
         
         # Sign modifies the rhythm pattern
-        sign_patterns = {
-            'Cardinal': {'pattern': [1, 0, 0, 1], 'subdivision': 4},
-            'Fixed': {'pattern': [1, 1, 1, 1], 'subdivision': 4},
-            'Mutable': {'pattern': [1, 0, 1, 0, 1, 0], 'subdivision': 6}
-        }
-        
-        sign_quality = self._get_sign_quality(sign)
-        pattern_info = sign_patterns.get(sign_quality, sign_patterns['Cardinal'])
+        sign_ix = SIGN_INDEX.get(sign, len(SIGNS))
+        pattern, subdivision = QUALITY_RHYTHM[SIGN_QUALITY[sign_ix]]
         
         return {
             'tempo': round(base_tempo, 1),
-            'pattern': pattern_info['pattern'],
-            'subdivision': pattern_info['subdivision'],
-            'swing_factor': 0.5 + (hash(sign) % 50) / 100  # 0.5 to 1.0
+            'pattern': list(pattern),
+            'subdivision': subdivision,
+            'swing_factor': float(SIGN_SWING[sign_ix])
         }
     
     def _calculate_timbre(self, planet: str, sign: str, house: int) -> Dict:
         """Calculate unique timbre characteristics"""
-        # Waveform selection based on planet
-        waveforms = {
-            'Sun': 'sawtooth',     # Bright, full spectrum
-            'Moon': 'sine',        # Pure, emotional
-            'Mercury': 'square',   # Clear, articulate
-            'Venus': 'triangle',   # Smooth, warm
-            'Mars': 'sawtooth',    # Aggressive, cutting
-            'Jupiter': 'complex',  # Rich harmonics
-            'Saturn': 'square',    # Structured
-            'Uranus': 'noise',     # Experimental
-            'Neptune': 'sine_pad', # Ethereal
-            'Pluto': 'pulse'       # Intense
-        }
-        
-        # Filter characteristics based on sign element
-        element = self._get_sign_element(sign)
-        filter_config = {
-            'Fire': {'type': 'highpass', 'cutoff': 800, 'resonance': 0.7},
-            'Earth': {'type': 'lowpass', 'cutoff': 400, 'resonance': 0.3},
-            'Air': {'type': 'bandpass', 'cutoff': 1200, 'resonance': 0.5},
-            'Water': {'type': 'lowpass', 'cutoff': 600, 'resonance': 0.6}
-        }
+        # Waveform selection based on planet, filter based on sign element
+        waveform = WAVEFORM[PLANET_INDEX.get(planet, len(PLANETS))]
+        filter_type, cutoff, resonance = ELEMENT_FILTER[SIGN_ELEMENT[SIGN_INDEX.get(sign, len(SIGNS))]]
         
         return {
-            'waveform': waveforms.get(planet, 'sine'),
-            'filter': filter_config.get(element, filter_config['Earth']),
+            'waveform': waveform,
+            'filter': {'type': filter_type, 'cutoff': cutoff, 'resonance': resonance},
             'modulation_depth': house / 12,  # 0.083 to 1.0
             'detune_cents': (house - 6.5) * 2  # -11 to +11 cents
         }
     
     def _generate_envelope(self, planet: str, sign: str) -> Dict:
         """Generate ADSR envelope based on astrological factors"""
-        # Planet determines basic envelope shape
-        planet_envelopes = {
-            'Sun': {'attack': 0.1, 'decay': 0.2, 'sustain': 0.8, 'release': 0.5},
-            'Moon': {'attack': 0.3, 'decay': 0.4, 'sustain': 0.5, 'release': 1.0},
-            'Mercury': {'attack': 0.01, 'decay': 0.1, 'sustain': 0.4, 'release': 0.2},
-            'Venus': {'attack': 0.5, 'decay': 0.3, 'sustain': 0.7, 'release': 0.8},
-            'Mars': {'attack': 0.001, 'decay': 0.05, 'sustain': 0.9, 'release': 0.1},
-            'Jupiter': {'attack': 0.2, 'decay': 0.3, 'sustain': 0.9, 'release': 0.6},
-            'Saturn': {'attack': 0.8, 'decay': 0.5, 'sustain': 0.6, 'release': 1.5},
-            'Uranus': {'attack': 0.001, 'decay': 0.001, 'sustain': 0.3, 'release': 0.01},
-            'Neptune': {'attack': 2.0, 'decay': 1.0, 'sustain': 0.7, 'release': 3.0},
-            'Pluto': {'attack': 0.5, 'decay': 0.2, 'sustain': 1.0, 'release': 0.5}
-        }
-        
-        envelope = planet_envelopes.get(planet, planet_envelopes['Sun']).copy()
+        # Planet determines basic envelope shape, sign element scales it
+        planet_ix = PLANET_INDEX.get(planet, len(PLANETS))
+        element = SIGN_ELEMENT[SIGN_INDEX.get(sign, len(SIGNS))]
+        attack, decay, sustain, release = ADSR_TABLE[planet_ix, element].tolist()
         
-        # Modify based on sign element
-        element = self._get_sign_element(sign)
-        element_modifiers = {
-            'Fire': {'attack': 0.5, 'release': 0.5},
-            'Earth': {'attack': 2.0, 'release': 2.0},
-            'Air': {'attack': 0.7, 'release': 0.7},
-            'Water': {'attack': 1.5, 'release': 1.5}
-        }
-        
-        modifier = element_modifiers.get(element, {'attack': 1.0, 'release': 1.0})
-        envelope['attack'] *= modifier['attack']
-        envelope['release'] *= modifier['release']
-        
-        return envelope
+        return {'attack': attack, 'decay': decay, 'sustain': sustain, 'release': release}
     
     def _get_sign_element(self, sign: str) -> str:
         """Get element for a zodiac sign"""
-        elements = {
-            'Aries': 'Fire', 'Leo': 'Fire', 'Sagittarius': 'Fire',
-            'Taurus': 'Earth', 'Virgo': 'Earth', 'Capricorn': 'Earth',
-            'Gemini': 'Air', 'Libra': 'Air', 'Aquarius': 'Air',
-            'Cancer': 'Water', 'Scorpio': 'Water', 'Pisces': 'Water'
-        }
-        return elements.get(sign, 'Earth')
+        return ELEMENTS[SIGN_ELEMENT[SIGN_INDEX.get(sign, len(SIGNS))]]
     
     def _get_sign_quality(self, sign: str) -> str:
         """Get quality (modality) for a zodiac sign"""
-        qualities = {
-            'Aries': 'Cardinal', 'Cancer': 'Cardinal', 
-            'Libra': 'Cardinal', 'Capricorn': 'Cardinal',
-            'Taurus': 'Fixed', 'Leo': 'Fixed', 
-            'Scorpio': 'Fixed', 'Aquarius': 'Fixed',
-            'Gemini': 'Mutable', 'Virgo': 'Mutable', 
-            'Sagittarius': 'Mutable', 'Pisces': 'Mutable'
-        }
-        return qualities.get(sign, 'Cardinal')
+        return QUALITIES[SIGN_QUALITY[SIGN_INDEX.get(sign, len(SIGNS))]]
     
     def calculate_aspect_harmony(self, aspect_type: str, orb: float, 
                                planet1_freq: float, planet2_freq: float) -> Dict:
         """Calculate harmonic relationship between two planets"""
-        # Get base interval for aspect
-        aspect_intervals = {
-            'conjunction': 'unison',
-            'sextile': 'major_sixth',
-            'square': 'minor_second',
-            'trine': 'perfect_fifth',
-            'opposition': 'octave',
-            'quincunx': 'minor_seventh'
-        }
+        harmonies = self.calculate_aspect_harmonies([aspect_type], [orb], [planet1_freq], [planet2_freq])
+        beat_freq = harmonies['beat_frequency'].item()
         
-        interval = aspect_intervals.get(aspect_type.lower(), 'unison')
-        ratio = self.sacred_ratios[interval]
+        return {
+            'harmony_frequency': round(harmonies['harmony_frequency'].item(), 3),
+            'beat_frequency': round(beat_freq, 3),
+            'consonance': harmonies['consonance'].item(),
+            'interval_name': harmonies['interval_name'][0],
+            'modulation_rate': round(beat_freq / 10, 3)  # Subtle modulation
+        }
+    
+    def calculate_aspect_harmonies(self, aspect_types: List[str], orbs,
+                                   planet1_freqs, planet2_freqs) -> Dict:
+        """
+        Vectorized calculate_aspect_harmony over a list of aspects; returns
+        aligned, unrounded arrays with one entry per aspect
+        """
+        aspect_ix = np.fromiter((ASPECT_INDEX.get(a.lower(), len(ASPECT_INDEX)) for a in aspect_types),
+                                dtype=np.intp, count=len(aspect_types))
+        orbs = np.asarray(orbs, dtype=np.float64)
+        planet1_freqs = np.asarray(planet1_freqs, dtype=np.float64)
+        planet2_freqs = np.asarray(planet2_freqs, dtype=np.float64)
         
         # Calculate harmony frequency
-        harmony_freq = planet1_freq * ratio
-        
-        # Orb affects the purity of the harmony
-        orb_factor = 1 - (abs(orb) / 10)  # Closer orb = purer harmony
+        harmony = planet1_freqs * ASPECT_RATIO[aspect_ix]
         
         # Calculate beat frequency (for subtle modulation)
-        beat_freq = abs(planet2_freq - harmony_freq)
+        beat = np.abs(planet2_freqs - harmony)
         
         return {
-            'harmony_frequency': round(harmony_freq, 3),
-            'beat_frequency': round(beat_freq, 3),
-            'consonance': orb_factor,
-            'interval_name': interval,
-            'modulation_rate': round(beat_freq / 10, 3)  # Subtle modulation
+            'harmony_frequency': harmony,
+            'beat_frequency': beat,
+            'consonance': 1 - (np.abs(orbs) / 10),  # Closer orb = purer harmony
+            'interval_name': [ASPECT_INTERVAL[i] for i in aspect_ix.tolist()],
+            'modulation_rate': beat / 10
         }
     
     def generate_musical_dna(self, full_chart_data: Dict) -> str:
         """Generate a unique musical DNA string for the chart"""
         # Create a unique identifier based on all planetary positions
-        dna_components = []
-        
-        for planet, data in full_chart_data.items():
-            if isinstance(data, dict) and 'frequency' in data:
-                freq_int = int(data['frequency'] * 1000)
-                dna_components.append(f"{planet[:2]}{freq_int}")
+        dna_components = [
+            f"{planet[:2]}{int(data['frequency'] * 1000)}"
+            for planet, data in full_chart_data.items()
+            if isinstance(data, dict) and 'frequency' in data
+        ]
         
-        # Add aspect signature
-        aspect_signature = hashlib.md5(
-            str(full_chart_data.get('aspects', [])).encode()
-        ).hexdigest()[:8]
+        # Add aspect signature; a 4-byte BLAKE2b digest is the 8 hex digits
+        aspect_signature = hashlib.blake2b(
+            str(full_chart_data.get('aspects', [])).encode(), digest_size=4
+        ).hexdigest()
         
         dna_components.append(f"ASP{aspect_signature}")
         
@@ -1,48 +1,10 @@
 from pathlib import Path
 import shutil
 
-# Define the base path for the new integrated project structure
-base_dir = Path("/mnt/data/quantumelodic_system")
-subdirs = ["core", "utils", "gui", "data", "output"]
-
-# Create folder structure
-for subdir in subdirs:
-    (base_dir / subdir).mkdir(parents=True, exist_ok=True)
-
-# Define where each file goes based on filename pattern
-file_map = {
-    "core": [
-        "quantumelodic_master_script.py",
-        "quantum_full_system_code.py",
-        "core_module.py",
-        "features_module.py",
-        "enhanced_system_module.py"
-    ],
-    "utils": [
-        "csv_quantum.py",
-        "Quantumelodic Templates.py"
-    ],
-    "gui": [
-        "quantumelodic-adaptive-personalized.py",
-        "quantumelodic-advanced-features.py",
-        "quantumelodic-advanced-collaborative.py"
-    ],
-    "output": [
-        "quantumelodic-enhanced-data-models.py",
-        "quantumelodies-complete.py"
-    ]
-}
-
-# Move files to their respective folders
-for folder, files in file_map.items():
-    for fname in files:
-        src = Path(f"/mnt/data/{fname}")
-        dest = base_dir / folder / fname
-        if src.exists():
-            shutil.copy(src, dest)
-
-# Create a README.md file summarizing the project
-readme_content = """
+# Default location of the new integrated project structure
+DEFAULT_BASE_DIR = Path("/mnt/data/quantumelodic_system")
+
+README_CONTENT = """
 # Quantumelodic MetaSystem Codebase
 
 ## Overview
@@ -61,3 +23,52 @@ This package contains the modular system for generating music from astrological
 To run a full session:
 ```bash
 python core/quantumelodic_master_script.py
+```
+"""
+
+def setup_project_layout(base_dir=DEFAULT_BASE_DIR):
+    """Create the project folders, copy the source files in and write the README"""
+    base_dir = Path(base_dir)
+    subdirs = ["core", "utils", "gui", "data", "output"]
+
+    # Create folder structure
+    for subdir in subdirs:
+        (base_dir / subdir).mkdir(parents=True, exist_ok=True)
+
+    # Define where each file goes based on filename pattern
+    file_map = {
+        "core": [
+            "quantumelodic_master_script.py",
+            "quantum_full_system_code.py",
+            "core_module.py",
+            "features_module.py",
+            "enhanced_system_module.py"
+        ],
+        "utils": [
+            "csv_quantum.py",
+            "Quantumelodic Templates.py"
+        ],
+        "gui": [
+            "quantumelodic-adaptive-personalized.py",
+            "quantumelodic-advanced-features.py",
+            "quantumelodic-advanced-collaborative.py"
+        ],
+        "output": [
+            "quantumelodic-enhanced-data-models.py",
+            "quantumelodies-complete.py"
+        ]
+    }
+
+    # Move files to their respective folders
+    for folder, files in file_map.items():
+        for fname in files:
+            src = Path(f"/mnt/data/{fname}")
+            dest = base_dir / folder / fname
+            if src.exists():
+                shutil.copy(src, dest)
+
+    # Create a README.md file summarizing the project
+    (base_dir / "README.md").write_text(README_CONTENT)
+
+if __name__ == "__main__":
+    setup_project_layout()
@@ -1,26 +1,42 @@
+import re
 import streamlit as st
+import numpy as np
 from datetime import datetime
 from flatlib.chart import Chart
 from flatlib.datetime import Datetime
 from flatlib.geopos import GeoPos
 from flatlib import const
 
-def validate_input(date_str, time_str, timezone_str, lat, lon):
-    errors = []
+DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+TIME_RE = re.compile(r"^([01]\d|2[0-3]):[0-5]\d$")
+TZ_RE = re.compile(r"^[+-]\d{2}:\d{2}$")
+
+def _is_valid_date(date_str):
+    # The regex rejects malformed input cheaply; strptime only confirms the
+    # day exists (e.g. no Feb 30)
+    if not DATE_RE.match(date_str):
+        return False
     try:
         datetime.strptime(date_str, "%Y-%m-%d")
     except ValueError:
+        return False
+    return True
+
+def validate_input(date_str, time_str, timezone_str, lat, lon):
+    errors = []
+    if not _is_valid_date(date_str):
         errors.append("Birthdate must be in YYYY-MM-DD format.")
-    try:
-        datetime.strptime(time_str, "%H:%M")
-    except ValueError:
+    if not TIME_RE.match(time_str):
         errors.append("Birth time must be in HH:MM 24-hour format.")
-    if not (timezone_str.startswith('+') or timezone_str.startswith('-')) or len(timezone_str) != 6:
+    if not TZ_RE.match(timezone_str):
         errors.append("Timezone must be in format +00:00 or -05:00.")
     if not lat or not lon:
         errors.append("Latitude and Longitude must be filled in.")
     return errors
 
+# flatlib chart construction is the slow step and Streamlit reruns the script on
+# every interaction, so results are cached on the birth inputs
+@st.cache_data(show_spinner=False)
 def generate_chart_data(birth_date, birth_time, timezone, lat, lon):
     dt = Datetime(date=birth_date, time=birth_time, utcoffset=timezone)
     pos = GeoPos(lat, lon)
@@ -32,30 +48,38 @@ def generate_chart_data(birth_date, birth_time, timezone, lat, lon):
             planets[obj] = {"sign": chart.get(obj).sign, "degree": chart.get(obj).lon}
     return {"planets": planets}
 
+def _degree_or_nan(degree):
+    try:
+        return float(degree)
+    except (TypeError, ValueError):
+        return np.nan
+
+@st.cache_data(show_spinner=False)
 def generate_quantumelodic_profile(chart_data):
-    tones = []
     base_note = 60
-    for planet, data in chart_data['planets'].items():
-        degree = data['degree']
-        try:
-            midi_note = int(base_note + (float(degree) / 30.0) * 12)
-            tones.append(midi_note)
-        except:
-            tones.append(base_note)
-    return tones
+    planets = chart_data['planets']
+    degrees = np.fromiter((_degree_or_nan(data['degree']) for data in planets.values()), dtype=np.float64, count=len(planets))
+    # A missing, non-numeric or NaN degree falls back to the base note
+    midi_notes = (base_note + (np.nan_to_num(degrees) / 30.0) * 12).astype(np.int16)
+    return midi_notes.tolist()
 
-def render_midi(melody_sequence, filename="quantumelodic_output.mid"):
+@st.cache_data(show_spinner=False)
+def render_midi_bytes(melody_sequence):
     from music21 import stream, note, midi
-    s = stream.Stream()
-    for pitch in melody_sequence:
-        n = note.Note()
+    notes = [note.Note() for _ in melody_sequence]
+    for n, pitch in zip(notes, melody_sequence):
         n.pitch.midi = pitch
         n.quarterLength = 1
-        s.append(n)
+    # One append call lays out every offset in a single pass
+    s = stream.Stream()
+    s.append(notes)
     mf = midi.translate.streamToMidiFile(s)
-    mf.open(filename, 'wb')
-    mf.write()
-    mf.close()
+    return mf.writestr()
+
+def render_midi(melody_sequence, filename="quantumelodic_output.mid"):
+    data = render_midi_bytes(tuple(melody_sequence))
+    with open(filename, 'wb') as f:
+        f.write(data)
 
 def main():
     st.title("Quantumelodic Music Generator")
@@ -0,0 +1,33 @@
+#!/bin/sh
+# Production launchers for the HTTP services.
+#   ./serve.sh api       FastAPI glossary/translation service (uvicorn workers)
+#   ./serve.sh composer  Flask composition service (gunicorn threaded workers)
+#
+# These servers are not part of the Streamlit requirements.txt; install them on
+# the host first: `pip install uvicorn` for api, `pip install gunicorn` for
+# composer. uvicorn uses uvloop/httptools automatically when they are present,
+# and both services encode JSON with orjson when it is installed.
+#
+# Composer threads share one QuantumelodicMetasystem per worker process, so
+# request handlers must only mutate per-request state (see for_request()).
+set -e
+
+WORKERS="${WEB_CONCURRENCY:-$(nproc)}"
+ROOT="$(cd "$(dirname "$0")" && pwd)"
+
+case "$1" in
+    api)
+        cd "$ROOT/api"
+        exec uvicorn quantumelodies_api:app --host 0.0.0.0 --port "${PORT:-8000}" \
+            --workers "$WORKERS" --loop auto --http auto --no-access-log
+        ;;
+    composer)
+        cd "$ROOT/backend"
+        exec gunicorn -w "$WORKERS" -k gthread --threads 8 \
+            -b "0.0.0.0:${PORT:-5000}" enhanced_system_module:app
+        ;;
+    *)
+        echo "usage: $0 {api|composer}" >&2
+        exit 1
+        ;;
+esac
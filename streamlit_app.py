@@ -1,6 +1,9 @@
+import io
 import json
+import re
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 import pytz
 import streamlit as st
@@ -11,96 +14,123 @@ from utils.natal_csv_generator import (
     compute_natal_chart,
 )
 
+# Signs and elements are addressed by dense integer ids so per-sign tables are
+# plain array/tuple lookups
+SIGNS = ("Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+         "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces")
+SIGN_ID = {sign: i for i, sign in enumerate(SIGNS)}
+
+ELEMENTS = ("Fire", "Earth", "Air", "Water")
+SIGN_ELEMENT = np.array([0, 1, 2, 3, 0, 1, 2, 3, 0, 1, 2, 3], dtype=np.int8)
+
+# Melodic influence of each element on a planet's theme, by element id
+ELEMENT_TEMPO_MOD = np.array([1.2, 0.9, 1.1, 0.8])
+ELEMENT_INTENSITY = ("Strong", "Steady", "Light", "Flowing")
+
+# Musical key for each ascendant sign, by sign id
+SIGN_KEY = ("C Major", "F Major", "A Major", "D Minor", "G Major", "Bb Major",
+            "E Major", "G Minor", "D Major", "Eb Major", "B Major", "C Minor")
+
 # Define the AstroEngine class
 class AstroEngine:
+    __slots__ = ("chart_data", "dominant_element", "aspect_patterns", "element_counts", "retrogrades", "house_set")
+    
     def __init__(self, chart_data):
         self.chart_data = chart_data
+        
+        # One pass over the planets gathers element ids, retrogrades and houses
+        element_ids = []
+        self.retrogrades = []
+        self.house_set = set()
+        for planet, data in chart_data["planets"].items():
+            sign_id = SIGN_ID.get(data["sign"])
+            if sign_id is not None:
+                element_ids.append(SIGN_ELEMENT[sign_id])
+            if data.get("retrograde"):
+                self.retrogrades.append(planet)
+            self.house_set.add(data["house"])
+        self.element_counts = np.bincount(element_ids, minlength=len(ELEMENTS))
+        
         self.dominant_element = self._calculate_dominant_element()
         self.aspect_patterns = self._identify_aspect_patterns()
         
     def _calculate_dominant_element(self):
-        # Count elements across planets
-        elements = {"Fire": 0, "Earth": 0, "Air": 0, "Water": 0}
-        element_map = {
-            "Aries": "Fire", "Leo": "Fire", "Sagittarius": "Fire",
-            "Taurus": "Earth", "Virgo": "Earth", "Capricorn": "Earth",
-            "Gemini": "Air", "Libra": "Air", "Aquarius": "Air",
-            "Cancer": "Water", "Scorpio": "Water", "Pisces": "Water"
-        }
-        
-        # Count elements for each planet
-        for planet, data in self.chart_data["planets"].items():
-            sign = data["sign"]
-            if sign in element_map:
-                elements[element_map[sign]] += 1
-        
-        # Return the element with highest count
-        return max(elements, key=elements.get)
+        # Return the element with highest count, ties going to the earlier element
+        return ELEMENTS[int(self.element_counts.argmax())]
     
     def _identify_aspect_patterns(self):
         # Identify patterns from the aspects list
         patterns = []
-        if "aspects" in self.chart_data and "majorAspects" in self.chart_data["aspects"]:
-            aspects_text = " ".join(self.chart_data["aspects"]["majorAspects"])
+        aspects = self.chart_data.get("aspects", {})
+        if "majorAspects" in aspects and "significantPatterns" in aspects:
+            aspects_text = " ".join(aspects["majorAspects"])
+            significant_patterns = aspects["significantPatterns"]
             
-            if "significantPatterns" in self.chart_data["aspects"]:
-                if "trine" in aspects_text and "Grand Trine" in self.chart_data["aspects"]["significantPatterns"]:
-                    patterns.append("Grand Trine")
-                    
-                if "square" in aspects_text and "T-Square" in self.chart_data["aspects"]["significantPatterns"]:
-                    patterns.append("T-Square")
+            if "trine" in aspects_text and "Grand Trine" in significant_patterns:
+                patterns.append("Grand Trine")
+                
+            if "square" in aspects_text and "T-Square" in significant_patterns:
+                patterns.append("T-Square")
             
         return patterns
     
     def analyze_chart(self):
         # Full chart analysis
+        chart_data = self.chart_data
+        planets = chart_data["planets"]
         return {
             "dominant_element": self.dominant_element,
             "aspect_patterns": self.aspect_patterns,
-            "ascendant_influence": self.chart_data["angles"]["Ascendant"]["sign"] if "angles" in self.chart_data else "",
-            "sun_moon_dynamic": f"{self.chart_data['planets']['Sun']['sign']}-{self.chart_data['planets']['Moon']['sign']}",
+            "ascendant_influence": chart_data["angles"]["Ascendant"]["sign"] if "angles" in chart_data else "",
+            "sun_moon_dynamic": f"{planets['Sun']['sign']}-{planets['Moon']['sign']}",
             "retrograde_planets": self._get_retrograde_planets()
         }
     
     def _get_retrograde_planets(self):
         # Return list of retrograde planets
-        retrogrades = []
-        for planet, data in self.chart_data["planets"].items():
-            if "retrograde" in data and data["retrograde"]:
-                retrogrades.append(planet)
-        return retrogrades
+        return self.retrogrades
+
+# Musical mappings are static, so build them once at import
+PLANET_TO_MODE = {
+    "Sun": {"mode": "Ionian", "tonic": "E", "instrument": "Brass", "tempo": 120},
+    "Moon": {"mode": "Aeolian", "tonic": "F", "instrument": "Piano, Cello", "tempo": 70},
+    "Mercury": {"mode": "Mixolydian", "tonic": "D", "instrument": "Flutes", "tempo": 130},
+    "Venus": {"mode": "Lydian", "tonic": "G", "instrument": "Strings", "tempo": 70},
+    "Mars": {"mode": "Phrygian", "tonic": "C", "instrument": "Percussion", "tempo": 160},
+    "Jupiter": {"mode": "Lydian", "tonic": "A", "instrument": "Brass", "tempo": 100},
+    "Saturn": {"mode": "Dorian", "tonic": "B", "instrument": "Bassoon", "tempo": 60},
+    "Uranus": {"mode": "Aeolian", "tonic": "Ab", "instrument": "Synthesizers", "tempo": 140},
+    "Neptune": {"mode": "Ionian", "tonic": "Bb", "instrument": "Harp", "tempo": 50},
+    "Pluto": {"mode": "Phrygian", "tonic": "Db", "instrument": "Low Brass", "tempo": 90}
+}
+
+ASPECT_TO_HARMONY = {
+    "conjunction": "Unison",
+    "trine": "Perfect Fifth",
+    "square": "Tritone",
+    "opposition": "Octave",
+    "sextile": "Major Third"
+}
+
+# One alternation scan per aspect line instead of a substring test per aspect type
+ASPECT_RE = re.compile("|".join(map(re.escape, ASPECT_TO_HARMONY)), re.IGNORECASE)
+
+HOUSE_TO_FORM = {
+    "1": "Introduction",
+    "4": "Emotional Theme",
+    "7": "Balance Section",
+    "10": "Climactic Section"
+}
 
 # Define the MusicEngine class
 class MusicEngine:
+    __slots__ = ("planet_to_mode", "aspect_to_harmony", "house_to_form")
+    
     def __init__(self):
         # Define musical mappings
-        self.planet_to_mode = {
-            "Sun": {"mode": "Ionian", "tonic": "E", "instrument": "Brass", "tempo": 120},
-            "Moon": {"mode": "Aeolian", "tonic": "F", "instrument": "Piano, Cello", "tempo": 70},
-            "Mercury": {"mode": "Mixolydian", "tonic": "D", "instrument": "Flutes", "tempo": 130},
-            "Venus": {"mode": "Lydian", "tonic": "G", "instrument": "Strings", "tempo": 70},
-            "Mars": {"mode": "Phrygian", "tonic": "C", "instrument": "Percussion", "tempo": 160},
-            "Jupiter": {"mode": "Lydian", "tonic": "A", "instrument": "Brass", "tempo": 100},
-            "Saturn": {"mode": "Dorian", "tonic": "B", "instrument": "Bassoon", "tempo": 60},
-            "Uranus": {"mode": "Aeolian", "tonic": "Ab", "instrument": "Synthesizers", "tempo": 140},
-            "Neptune": {"mode": "Ionian", "tonic": "Bb", "instrument": "Harp", "tempo": 50},
-            "Pluto": {"mode": "Phrygian", "tonic": "Db", "instrument": "Low Brass", "tempo": 90}
-        }
-        
-        self.aspect_to_harmony = {
-            "conjunction": "Unison",
-            "trine": "Perfect Fifth",
-            "square": "Tritone",
-            "opposition": "Octave",
-            "sextile": "Major Third"
-        }
-        
-        self.house_to_form = {
-            "1": "Introduction",
-            "4": "Emotional Theme",
-            "7": "Balance Section",
-            "10": "Climactic Section"
-        }
+        self.planet_to_mode = PLANET_TO_MODE
+        self.aspect_to_harmony = ASPECT_TO_HARMONY
+        self.house_to_form = HOUSE_TO_FORM
     
     def generate_melody(self, planet, sign):
         # Generate a melodic theme based on planet and sign
@@ -110,29 +140,14 @@ class MusicEngine:
         planet_data = self.planet_to_mode[planet]
         
         # Adjust for sign influence (simplified)
-        sign_groups = {
-            "Fire": {"tempo_mod": 1.2, "intensity": "Strong"},
-            "Earth": {"tempo_mod": 0.9, "intensity": "Steady"},
-            "Air": {"tempo_mod": 1.1, "intensity": "Light"},
-            "Water": {"tempo_mod": 0.8, "intensity": "Flowing"}
-        }
-        
-        element_map = {
-            "Aries": "Fire", "Leo": "Fire", "Sagittarius": "Fire",
-            "Taurus": "Earth", "Virgo": "Earth", "Capricorn": "Earth",
-            "Gemini": "Air", "Libra": "Air", "Aquarius": "Air",
-            "Cancer": "Water", "Scorpio": "Water", "Pisces": "Water"
-        }
-        
-        element = element_map.get(sign, "Fire")
-        sign_influence = sign_groups[element]
+        element = SIGN_ELEMENT[SIGN_ID[sign]] if sign in SIGN_ID else 0
         
         # Create melody template
         melody = {
             "mode": planet_data["mode"],
             "tonic": planet_data["tonic"],
-            "tempo": planet_data["tempo"] * sign_influence["tempo_mod"],
-            "quality": sign_influence["intensity"],
+            "tempo": round(planet_data["tempo"] * ELEMENT_TEMPO_MOD[element]),
+            "quality": ELEMENT_INTENSITY[element],
             "instrument": planet_data["instrument"]
         }
         
@@ -140,24 +155,11 @@ class MusicEngine:
     
     def generate_harmony(self, aspects):
         # Generate harmonic progression based on aspects
-        harmonies = []
-        
-        # Simple implementation
-        for aspect in aspects:
-            for aspect_type, harmony in self.aspect_to_harmony.items():
-                if aspect_type in aspect.lower():
-                    harmonies.append(harmony)
-                    break
-        
-        return harmonies
+        return [self.aspect_to_harmony[m.group(0).lower()] for aspect in aspects if (m := ASPECT_RE.search(aspect))]
     
     def generate_form(self, houses):
-        # Generate musical form based on house placements
-        form_sections = []
-        
-        for house, form in self.house_to_form.items():
-            if house in houses:
-                form_sections.append(form)
+        # Generate musical form based on house placements; houses is a set
+        form_sections = [form for house, form in self.house_to_form.items() if house in houses]
         
         # Add default sections if needed
         if not form_sections:
@@ -165,37 +167,50 @@ class MusicEngine:
             
         return form_sections
 
+# Instrumentation and performance guidance by dominant element; the notes are
+# completed with the chart's aspect patterns
+ELEMENT_INSTRUMENTS = {
+    "Fire": ("Brass", "Percussion", "Electric Guitar"),
+    "Earth": ("Strings", "Bass", "Acoustic Guitar"),
+    "Air": ("Woodwinds", "Synthesizer", "Harp"),
+    "Water": ("Piano", "Cello", "Ambient Synths")
+}
+
+PERFORMANCE_NOTES = {
+    "Fire": "Perform with a energetic and bold, with strong dynamics and assertive articulation character. {}.",
+    "Earth": "Perform with a grounded and steady, with consistent rhythm and rich tonal quality character. {}.",
+    "Air": "Perform with a light and fluid, with agile phrasing and transparent textures character. {}.",
+    "Water": "Perform with a flowing and emotional, with rubato and expressive dynamics character. {}."
+}
+
 # Define the MappingEngine class
 class MappingEngine:
+    __slots__ = ("astro_engine", "music_engine")
+    
     def __init__(self, astro_engine, music_engine):
         self.astro_engine = astro_engine
         self.music_engine = music_engine
     
     def translate_chart(self):
         # Analyze the chart
-        chart_analysis = self.astro_engine.analyze_chart()
+        astro_engine = self.astro_engine
+        music_engine = self.music_engine
+        chart_data = astro_engine.chart_data
+        planets = chart_data["planets"]
+        aspects = chart_data.get("aspects", {})
+        chart_analysis = astro_engine.analyze_chart()
         
         # Generate musical elements
-        sun_melody = self.music_engine.generate_melody(
-            "Sun", 
-            self.astro_engine.chart_data["planets"]["Sun"]["sign"]
-        )
-        
-        moon_melody = self.music_engine.generate_melody(
-            "Moon", 
-            self.astro_engine.chart_data["planets"]["Moon"]["sign"]
-        )
+        sun_melody = music_engine.generate_melody("Sun", planets["Sun"]["sign"])
+        moon_melody = music_engine.generate_melody("Moon", planets["Moon"]["sign"])
         
         # Generate dominant harmonies
         harmonies = []
-        if "aspects" in self.astro_engine.chart_data and "majorAspects" in self.astro_engine.chart_data["aspects"]:
-            harmonies = self.music_engine.generate_harmony(
-                self.astro_engine.chart_data["aspects"]["majorAspects"]
-            )
+        if "majorAspects" in aspects:
+            harmonies = music_engine.generate_harmony(aspects["majorAspects"])
         
         # Generate form structure
-        houses = [data["house"] for planet, data in self.astro_engine.chart_data["planets"].items()]
-        form = self.music_engine.generate_form(houses)
+        form = music_engine.generate_form(astro_engine.house_set)
         
         # Adjust for retrograde planets
         retrogrades = chart_analysis["retrograde_planets"]
@@ -207,7 +222,7 @@ class MappingEngine:
             "overview": self._generate_overview(chart_analysis, sun_melody, moon_melody),
             "structure": form,
             "musical_details": {
-                "key": self._determine_key(self.astro_engine.chart_data["angles"]["Ascendant"]["sign"] if "angles" in self.astro_engine.chart_data else "Aries"),
+                "key": self._determine_key(chart_data["angles"]["Ascendant"]["sign"] if "angles" in chart_data else "Aries"),
                 "time_signature": self._determine_time_signature(chart_analysis["dominant_element"]),
                 "tempo": self._calculate_average_tempo(sun_melody, moon_melody),
                 "melodies": {
@@ -230,17 +245,11 @@ class MappingEngine:
     def _generate_overview(self, analysis, sun_melody, moon_melody):
         # Generate overview text
         minutes = 5 + len(analysis["aspect_patterns"])  # Simple duration calculation
-        return f"A {minutes}-minute composition exploring the {analysis['sun_moon_dynamic']} dynamic, with {analysis['dominant_element']} element dominating the piece. Tempo averages {int(self._calculate_average_tempo(sun_melody, moon_melody))} BPM."
+        return f"A {minutes}-minute composition exploring the {analysis['sun_moon_dynamic']} dynamic, with {analysis['dominant_element']} element dominating the piece. Tempo averages {self._calculate_average_tempo(sun_melody, moon_melody)} BPM."
     
     def _determine_key(self, ascendant):
         # Map ascendant to musical key
-        key_map = {
-            "Aries": "C Major", "Leo": "G Major", "Sagittarius": "D Major",
-            "Taurus": "F Major", "Virgo": "Bb Major", "Capricorn": "Eb Major",
-            "Gemini": "A Major", "Libra": "E Major", "Aquarius": "B Major",
-            "Cancer": "D Minor", "Scorpio": "G Minor", "Pisces": "C Minor"
-        }
-        return key_map.get(ascendant, "C Major")
+        return SIGN_KEY[SIGN_ID[ascendant]] if ascendant in SIGN_ID else "C Major"
     
     def _determine_time_signature(self, element):
         # Map element to time signature
@@ -251,34 +260,54 @@ class MappingEngine:
         return sig_map.get(element, "4/4")
     
     def _calculate_average_tempo(self, sun_melody, moon_melody):
-        # Simple averaging of Sun and Moon tempos
-        return (sun_melody["tempo"] + moon_melody["tempo"]) / 2
+        # Simple averaging of Sun and Moon tempos; melody tempos are whole BPM
+        return (sun_melody["tempo"] + moon_melody["tempo"]) >> 1
     
     def _determine_instrumentation(self, analysis):
         # Determine instrumentation based on chart analysis
-        instruments = []
-        
-        if analysis["dominant_element"] == "Fire":
-            instruments.extend(["Brass", "Percussion", "Electric Guitar"])
-        elif analysis["dominant_element"] == "Earth":
-            instruments.extend(["Strings", "Bass", "Acoustic Guitar"])
-        elif analysis["dominant_element"] == "Air":
-            instruments.extend(["Woodwinds", "Synthesizer", "Harp"])
-        elif analysis["dominant_element"] == "Water":
-            instruments.extend(["Piano", "Cello", "Ambient Synths"])
-            
-        return instruments
+        return list(ELEMENT_INSTRUMENTS.get(analysis["dominant_element"], ()))
     
     def _generate_performance_notes(self, analysis):
         # Generate performance guidance
-        element_qualities = {
-            "Fire": "energetic and bold, with strong dynamics and assertive articulation",
-            "Earth": "grounded and steady, with consistent rhythm and rich tonal quality",
-            "Air": "light and fluid, with agile phrasing and transparent textures",
-            "Water": "flowing and emotional, with rubato and expressive dynamics"
-        }
-        
-        return f"Perform with a {element_qualities[analysis['dominant_element']]} character. {', '.join(analysis['aspect_patterns']) if analysis['aspect_patterns'] else 'Focus on the melodic interplay between themes'}."
+        return PERFORMANCE_NOTES[analysis["dominant_element"]].format(", ".join(analysis["aspect_patterns"]) or "Focus on the melodic interplay between themes")
+
+# The music engine is stateless, so one instance serves every session and rerun
+@st.cache_resource
+def get_music_engine():
+    return MusicEngine()
+
+# Only these sections of the chart feed the composition pipeline
+COMPOSITION_SECTIONS = ("planets", "angles", "aspects")
+
+# Compositions are keyed on the chart's JSON (insertion order preserved, since
+# retrograde effects follow planet order), so unchanged reruns skip the pipeline
+@st.cache_data(show_spinner=False)
+def build_composition(chart_json):
+    astro_engine = AstroEngine(json.loads(chart_json))
+    mapping_engine = MappingEngine(astro_engine, get_music_engine())
+    return mapping_engine.translate_chart()
+
+# Ephemeris lookups dominate a CSV submission; cache them on primitive inputs
+# so Streamlit's hasher stays cheap and resubmits skip the computation
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_natal_chart(name, birth_iso, latitude, longitude, timezone):
+    natal_inputs = NatalInputs(
+        name=name,
+        birth_datetime=datetime.fromisoformat(birth_iso),
+        latitude=latitude,
+        longitude=longitude,
+        timezone=timezone,
+    )
+    planetary_chart = compute_natal_chart(natal_inputs)
+    return planetary_chart, build_csv_row(planetary_chart, natal_inputs)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def natal_csv_bytes(name, birth_iso, latitude, longitude, timezone):
+    _, csv_row = build_natal_chart(name, birth_iso, latitude, longitude, timezone)
+    # Let pandas encode straight into a byte buffer rather than returning a str
+    buffer = io.BytesIO()
+    pd.DataFrame([csv_row]).to_csv(buffer, index=False, encoding="utf-8")
+    return buffer.getvalue()
 
 # Streamlit App
 st.set_page_config(
@@ -336,26 +365,22 @@ if submitted:
             st.error(error)
     else:
         try:
-            birth_dt = datetime.combine(csv_birth_date, csv_birth_time)
-            natal_inputs = NatalInputs(
-                name=full_name,
-                birth_datetime=birth_dt,
-                latitude=latitude,
-                longitude=longitude,
-                timezone=timezone_str,
+            natal_key = (
+                full_name,
+                datetime.combine(csv_birth_date, csv_birth_time).isoformat(),
+                latitude,
+                longitude,
+                timezone_str,
             )
-
-            planetary_chart = compute_natal_chart(natal_inputs)
-            csv_row = build_csv_row(planetary_chart, natal_inputs)
+            planetary_chart, csv_row = build_natal_chart(*natal_key)
 
             st.success("Natal chart synthesized successfully!")
             display_df = pd.DataFrame([csv_row])
             st.dataframe(display_df, use_container_width=True)
 
-            csv_bytes = display_df.to_csv(index=False).encode("utf-8")
             st.download_button(
                 label="Download CSV Row",
-                data=csv_bytes,
+                data=natal_csv_bytes(*natal_key),
                 file_name="natal_chart_row.csv",
                 mime="text/csv",
             )
@@ -387,32 +412,32 @@ with st.container():
         birth_location = st.text_input("Birth Location (City, Country)")
 
 # Planet input section
-planets_data = {}
 with st.expander("Planetary Positions", expanded=True):
     planet_names = ["Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"]
     zodiac_signs = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo", 
                     "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
     houses = [str(i) for i in range(1, 13)]
     
-    # Create 2 rows of 5 planets each
-    rows = [planet_names[i:i+5] for i in range(0, len(planet_names), 5)]
-    
-    for row in rows:
-        cols = st.columns(5)
-        for i, planet in enumerate(row):
-            with cols[i]:
-                st.markdown(f"**{planet}**")
-                sign = st.selectbox(f"{planet} Sign", zodiac_signs, key=f"{planet}_sign")
-                degree = st.number_input(f"{planet} Degree", min_value=0.0, max_value=29.99, step=0.01, key=f"{planet}_degree")
-                house = st.selectbox(f"{planet} House", houses, key=f"{planet}_house")
-                retrograde = st.checkbox(f"{planet} Retrograde", key=f"{planet}_retrograde")
-                
-                planets_data[planet] = {
-                    "sign": sign,
-                    "degree": degree,
-                    "house": house,
-                    "retrograde": retrograde
-                }
+    # One editable table instead of four widgets per planet
+    planet_table = st.data_editor(
+        pd.DataFrame({
+            "planet": planet_names,
+            "sign": "Aries",
+            "degree": 0.0,
+            "house": "1",
+            "retrograde": False
+        }),
+        column_config={
+            "planet": st.column_config.TextColumn("Planet", disabled=True),
+            "sign": st.column_config.SelectboxColumn("Sign", options=zodiac_signs, required=True),
+            "degree": st.column_config.NumberColumn("Degree", min_value=0.0, max_value=29.99, step=0.01, required=True),
+            "house": st.column_config.SelectboxColumn("House", options=houses, required=True),
+            "retrograde": st.column_config.CheckboxColumn("Retrograde")
+        },
+        hide_index=True,
+        key="planet_table"
+    )
+    planets_data = planet_table.set_index("planet").to_dict("index")
 
 # Ascendant and Midheaven
 with st.expander("Ascendant & Midheaven", expanded=True):
@@ -491,14 +516,11 @@ if st.button("Generate Quantumelodic Composition", type="primary"):
             }
         }
         
-        # Process through the Quantumelodic MetaSystem
-        astro_engine = AstroEngine(chart_data)
-        music_engine = MusicEngine()
-        mapping_engine = MappingEngine(astro_engine, music_engine)
-        
-        # Generate the composition
+        # Generate the composition through the Quantumelodic MetaSystem
         try:
-            composition = mapping_engine.translate_chart()
+            # Birth info, chart info and notes don't affect the music, so
+            # editing them reuses the cached composition
+            composition = build_composition(json.dumps({section: chart_data[section] for section in COMPOSITION_SECTIONS}))
             
             # Display composition
             st.success("Composition generated successfully!")
@@ -519,7 +541,7 @@ if st.button("Generate Quantumelodic Composition", type="primary"):
                 st.markdown("### Musical Details")
                 st.markdown(f"**Key:** {composition['musical_details']['key']}")
                 st.markdown(f"**Time Signature:** {composition['musical_details']['time_signature']}")
-                st.markdown(f"**Tempo:** {int(composition['musical_details']['tempo'])} BPM")
+                st.markdown(f"**Tempo:** {composition['musical_details']['tempo']} BPM")
                 
                 st.markdown("#### Melodic Themes")
                 st.markdown(f"**Sun Theme:** {composition['musical_details']['melodies']['sun_theme']['mode']} mode in {composition['musical_details']['melodies']['sun_theme']['tonic']}, played at {composition['musical_details']['melodies']['sun_theme']['tempo']:.1f} BPM with {composition['musical_details']['melodies']['sun_theme']['quality']} character on {composition['musical_details']['melodies']['sun_theme']['instrument']}")
@@ -1,10 +1,27 @@
-import csv
 from datetime import datetime
-from collections import defaultdict
+from functools import lru_cache
 import os
 from pathlib import Path
 import logging
 
+import pandas as pd
+
+# Fallback phrases for planets and aspects missing from the quality tables
+UNKNOWN_PLANET_PHRASES = ('Unknown, mystery', 'undefined tones')
+UNKNOWN_ASPECT_MEANING = 'creating an undefined relationship'
+
+# Repeated planet/sign/aspect names load as categoricals (integer codes)
+ASPECT_COLUMN_DTYPES = {
+    'planet1': 'category',
+    'planet2': 'category',
+    'aspect': 'category',
+    'sign1': 'category',
+    'sign2': 'category',
+}
+
+# RFC 5545 text escaping, applied in a single translate pass
+ICS_ESCAPE = str.maketrans({'\n': '\\n', ',': '\\,', ';': '\\;'})
+
 class AstroNarrativeProcessor:
     def __init__(self):
         # Setup paths and logging as before...
@@ -33,6 +50,20 @@ class AstroNarrativeProcessor:
             # ...
         }
 
+        # Resolve the phrases each interpretation needs once per planet and
+        # aspect, instead of re-joining themes for every aspect row
+        self.planet_phrases = {
+            name: (', '.join(quality['themes'][:2]), quality['musical'])
+            for name, quality in self.planet_qualities.items()
+        }
+        self.aspect_meanings = {
+            name: quality['meaning'] for name, quality in self.aspect_qualities.items()
+        }
+
+        # A year of aspects repeats the same few hundred planet/aspect triples,
+        # so their descriptive paragraph is built once per triple
+        self.describe_aspect = lru_cache(maxsize=1024)(self._describe_aspect)
+
     def parse_date(self, date_str):
         """Parse date string in format 'MMM d, YYYY'"""
         try:
@@ -41,34 +72,45 @@ class AstroNarrativeProcessor:
             logging.warning(f"Failed to parse date: {date_str} - {str(e)}")
             return None
 
+    def _describe_aspect(self, planet1, planet2, aspect):
+        """Describe a planet pair and aspect, independent of signs and timing"""
+        themes1, musical1 = self.planet_phrases.get(planet1, UNKNOWN_PLANET_PHRASES)
+        themes2, musical2 = self.planet_phrases.get(planet2, UNKNOWN_PLANET_PHRASES)
+        meaning = self.aspect_meanings.get(aspect.lower(), UNKNOWN_ASPECT_MEANING)
+
+        return (
+            f"This aspect brings together the {themes1} qualities of {planet1} "
+            f"with the {themes2} qualities of {planet2}, resulting in {meaning}. "
+            f"Musically, this manifests as {musical1} interweaving with {musical2}."
+        )
+
     def generate_interpretation(self, aspect):
         """
-        Generate descriptive interpretation of an aspect with proper grammar
+        Generate descriptive interpretation of an aspect with proper grammar.
+        ``aspect`` is a row from ``DataFrame.itertuples``.
         """
-        planet1 = self.planet_qualities.get(aspect['planet1'], 
-                                           {'themes': ['Unknown', 'mystery'], 'musical': 'undefined tones'})
-        planet2 = self.planet_qualities.get(aspect['planet2'], 
-                                           {'themes': ['Unknown', 'mystery'], 'musical': 'undefined tones'})
-        aspect_quality = self.aspect_qualities.get(aspect['aspect'].lower(), 
-                                                  {'meaning': 'creating an undefined relationship', 
-                                                   'musical': 'creates undefined harmonies'})
-
         interpretation = (
-            f"{aspect['planet1']} in {aspect['sign1']} {aspect['aspect']} "
-            f"{aspect['planet2']} in {aspect['sign2']} at {aspect['time']}\n\n"
-            f"This aspect brings together the {', '.join(planet1['themes'][:2])} qualities of {aspect['planet1']} "
-            f"with the {', '.join(planet2['themes'][:2])} qualities of {aspect['planet2']}, resulting in {aspect_quality['meaning']}. "
-            f"Musically, this manifests as {planet1['musical']} interweaving with {planet2['musical']}."
+            f"{aspect.planet1} in {aspect.sign1} {aspect.aspect} "
+            f"{aspect.planet2} in {aspect.sign2} at {aspect.time}\n\n"
+            f"{self.describe_aspect(aspect.planet1, aspect.planet2, aspect.aspect)}"
         )
 
         return interpretation
 
     def read_aspects_csv(self, filename):
         """Read and parse the aspects CSV file"""
-        # Rest of the code remains the same...
+        df = pd.read_csv(filename, dtype=ASPECT_COLUMN_DTYPES)
 
-    def generate_ics_content(self, daily_aspects):
-        """Generate the ICS calendar content"""
+        # Parse the whole date column at once; rows that fail are logged and dropped
+        dates = pd.to_datetime(df['date'].str.strip(), format='%b %d, %Y', errors='coerce')
+        unparsed = dates.isna()
+        if unparsed.any():
+            logging.warning(f"Failed to parse {int(unparsed.sum())} dates, e.g. {df.loc[unparsed, 'date'].iloc[0]!r}")
+        df['date'] = dates.dt.date
+        return df[~unparsed]
+
+    def generate_ics_content(self, aspects_df):
+        """Generate the ICS calendar content from the parsed aspects frame"""
         ics_lines = [
             'BEGIN:VCALENDAR',
             'VERSION:2.0',
@@ -78,14 +120,14 @@ class AstroNarrativeProcessor:
         ]
 
         days_processed = 0
-        for date, aspects in sorted(daily_aspects.items()):
+        for date, aspects in aspects_df.groupby('date', sort=True):
             date_str = date.strftime("%Y%m%d")
             
-            daily_interpretation = "Daily Astrological Symphony:\n\n"
-            for aspect in aspects:
-                daily_interpretation += self.generate_interpretation(aspect) + "\n\n"
-            
-            clean_interpretation = daily_interpretation.replace('\n', '\\n').replace(',', '\\,')
+            # Every section, header included, ends with a blank line
+            sections = ["Daily Astrological Symphony:"]
+            sections.extend(self.generate_interpretation(aspect) for aspect in aspects.itertuples(index=False))
+            sections.append("")
+            clean_interpretation = "\n\n".join(sections).translate(ICS_ESCAPE)
             
             ics_lines.extend([
                 'BEGIN:VEVENT',
@@ -103,7 +145,12 @@ class AstroNarrativeProcessor:
 
     def process_and_save(self, input_file, output_file):
         """Process the input CSV and save as ICS"""
-        # Rest of the code remains the same...
+        aspects_df = self.read_aspects_csv(self.data_dir / input_file)
+        ics_content = self.generate_ics_content(aspects_df)
+
+        output_path = self.output_dir / output_file
+        output_path.write_text(ics_content, encoding='utf-8')
+        logging.info(f"Saved calendar to {output_path}")
 
 def main():
     """Main execution function"""
@@ -1,60 +1,65 @@
-from skyfield.api import Topos, load
+from skyfield.api import load, wgs84
 from datetime import datetime
+from functools import lru_cache
+import threading
 import pytz
 
+# Parsing de421.bsp and building the timescale dominate each lookup, so both
+# are loaded once per process and shared
+_PLANETS = None
+_TS = None
+_LOAD_LOCK = threading.Lock()
+
+def _ephemeris():
+    global _PLANETS, _TS
+    if _PLANETS is None:
+        with _LOAD_LOCK:
+            if _PLANETS is None:
+                _TS = load.timescale()
+                _PLANETS = load('de421.bsp')
+    return _PLANETS, _TS
+
+SIGN_ORDER = ("Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+              "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces")
+
 def ra_to_zodiac_sign(ra_hours, ra_minutes, ra_seconds):
-    degrees = ra_hours * 15 + ra_minutes * 0.25 + ra_seconds * 0.004167
-    if 0 <= degrees < 30:
-        return "Aries", degrees
-    elif 30 <= degrees < 60:
-        return "Taurus", degrees - 30
-    elif 60 <= degrees < 90:
-        return "Gemini", degrees - 60
-    elif 90 <= degrees < 120:
-        return "Cancer", degrees - 90
-    elif 120 <= degrees < 150:
-        return "Leo", degrees - 120
-    elif 150 <= degrees < 180:
-        return "Virgo", degrees - 150
-    elif 180 <= degrees < 210:
-        return "Libra", degrees - 180
-    elif 210 <= degrees < 240:
-        return "Scorpio", degrees - 210
-    elif 240 <= degrees < 270:
-        return "Sagittarius", degrees - 240
-    elif 270 <= degrees < 300:
-        return "Capricorn", degrees - 270
-    elif 300 <= degrees < 330:
-        return "Aquarius", degrees - 300
-    elif 330 <= degrees < 360:
-        return "Pisces", degrees - 330
+    # Each sign spans 30 degrees, so the sign index falls out of one division
+    degrees = (ra_hours * 15 + ra_minutes * 0.25 + ra_seconds / 240.0) % 360
+    sign_index = int(degrees // 30)
+    return SIGN_ORDER[sign_index], degrees - sign_index * 30
+
+# Bodies reported by get_planetary_positions, by their ephemeris names
+BODIES = {
+    "Sun": 'sun',
+    "Moon": 'moon',
+    "Mercury": 'mercury',
+    "Venus": 'venus',
+    "Mars": 'mars',
+    "Jupiter": 'jupiter barycenter',
+    "Saturn": 'saturn barycenter',
+    "Uranus": 'uranus barycenter',
+    "Neptune": 'neptune barycenter',
+    "Pluto": 'pluto barycenter'
+}
+
+# Observers are built once per site from numeric degrees
+@lru_cache(maxsize=64)
+def _observer(latitude, longitude):
+    planets, _ = _ephemeris()
+    return planets['earth'] + wgs84.latlon(latitude, longitude)
 
-def get_planetary_positions(date_time, location):
-    planets = load('de421.bsp')
-    ts = load.timescale()
+def get_planetary_positions(date_time, latitude, longitude):
+    planets, ts = _ephemeris()
     
     t = ts.utc(date_time.year, date_time.month, date_time.day, date_time.hour, date_time.minute, date_time.second)
 
-    positions = {
-        "Sun": planets['sun'].at(t).observe(planets['earth']).apparent(),
-        "Moon": planets['moon'].at(t).observe(planets['earth']).apparent(),
-        "Mercury": planets['mercury'].at(t).observe(planets['earth']).apparent(),
-        "Venus": planets['venus'].at(t).observe(planets['earth']).apparent(),
-        "Mars": planets['mars'].at(t).observe(planets['earth']).apparent(),
-        "Jupiter": planets['jupiter barycenter'].at(t).observe(planets['earth']).apparent(),
-        "Saturn": planets['saturn barycenter'].at(t).observe(planets['earth']).apparent(),
-        "Uranus": planets['uranus barycenter'].at(t).observe(planets['earth']).apparent(),
-        "Neptune": planets['neptune barycenter'].at(t).observe(planets['earth']).apparent(),
-        "Pluto": planets['pluto barycenter'].at(t).observe(planets['earth']).apparent()
-    }
+    # Observe every body from a single observer position at t
+    observer_at_t = _observer(latitude, longitude).at(t)
 
     planetary_ra = {}
-    for planet, position in positions.items():
-        ra, dec, distance = position.radec()
-        ra_hours = ra.hours
-        ra_minutes = ra.minutes
-        ra_seconds = ra.seconds
-        planetary_ra[planet] = (ra_hours, ra_minutes, ra_seconds)
+    for planet, target in BODIES.items():
+        ra, dec, distance = observer_at_t.observe(planets[target]).apparent().radec()
+        planetary_ra[planet] = ra.hms()
     
     return planetary_ra
 
@@ -68,7 +73,7 @@ def main():
     date_time_utc = timezone.localize(date_time).astimezone(pytz.utc)
 
     # Get planetary positions
-    planetary_ra = get_planetary_positions(date_time_utc, Topos('40.7128 N', '74.0060 W'))
+    planetary_ra = get_planetary_positions(date_time_utc, 40.7128, -74.0060)
 
     # Convert RA to Zodiac Signs
     zodiac_positions = {planet: ra_to_zodiac_sign(*ra) for planet, ra in planetary_ra.items()}
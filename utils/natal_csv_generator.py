@@ -9,12 +9,21 @@ gracefully fall back to placeholder values instead of crashing the UI.
 
 from __future__ import annotations
 
+import math
+import shelve
+import threading
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pytz
-from skyfield.api import Star, load, wgs84
+from skyfield.api import load, wgs84
+from skyfield.framelib import ecliptic_frame
+from skyfield.nutationlib import iau2000b
 
 SIGN_ORDER: List[str] = [
     "Aries",
@@ -31,6 +40,8 @@ SIGN_ORDER: List[str] = [
     "Pisces",
 ]
 
+SIGN_INDEX: Dict[str, int] = {sign: index for index, sign in enumerate(SIGN_ORDER)}
+
 SIGN_ELEMENTS = {
     "Aries": "Fire",
     "Leo": "Fire",
@@ -61,6 +72,16 @@ SIGN_MODALITIES = {
     "Pisces": "Mutable",
 }
 
+# Element and modality of each sign as codes, indexed like SIGN_ORDER
+ELEMENT_NAMES: Tuple[str, ...] = ("Fire", "Earth", "Air", "Water")
+MODALITY_NAMES: Tuple[str, ...] = ("Cardinal", "Fixed", "Mutable")
+ELEMENT_OF_SIGN: Tuple[int, ...] = (0, 1, 2, 3, 0, 1, 2, 3, 0, 1, 2, 3)
+MODALITY_OF_SIGN: Tuple[int, ...] = (0, 1, 2, 0, 1, 2, 0, 1, 2, 0, 1, 2)
+_EARTH = ELEMENT_NAMES.index("Earth")
+
+# Personal points count extra towards the dominant element
+ELEMENT_WEIGHTS = {"Sun": 3, "Moon": 3, "Ascendant": 3, "Mercury": 2, "Venus": 2, "Mars": 2}
+
 SIGN_DATE_RANGES = {
     "Aries": "Mar 21 - Apr 19",
     "Taurus": "Apr 20 - May 20",
@@ -91,92 +112,156 @@ CHART_RULERS = {
     "Pisces": "Neptune",
 }
 
+# Chart bodies and their names in the DE421 ephemeris
+BODY_TARGETS = {
+    "Sun": "sun",
+    "Moon": "moon",
+    "Mercury": "mercury",
+    "Venus": "venus",
+    "Mars": "mars",
+    "Jupiter": "jupiter barycenter",
+    "Saturn": "saturn barycenter",
+    "Uranus": "uranus barycenter",
+    "Neptune": "neptune barycenter",
+    "Pluto": "pluto barycenter",
+}
+
+# Mean obliquity of the ecliptic at J2000; its drift is far below sign precision
+_OBLIQUITY = math.radians(23.4393)
+_COS_OBLIQUITY = math.cos(_OBLIQUITY)
+_SIN_OBLIQUITY = math.sin(_OBLIQUITY)
 
-@dataclass
+
+# A chart maps body names to {"sign": str, "degree": float, "sign_index": int}
+Chart = Dict[str, Dict[str, Any]]
+
+
+@dataclass(frozen=True, slots=True)
 class NatalInputs:
     """Normalized inputs from the Streamlit form."""
 
     name: str
     birth_datetime: datetime
-    latitude: float
-    longitude: float
+    latitude: Optional[float]
+    longitude: Optional[float]
     timezone: str = "UTC"
 
 
-def _longitude_to_sign(longitude: float) -> Tuple[str, float]:
-    """Convert an ecliptic longitude to a zodiac sign and degree within the sign."""
+def _longitude_to_sign(longitude: float) -> Tuple[str, float, int]:
+    """Convert an ecliptic longitude to a zodiac sign, degree within the sign
+    and the sign's index into ``SIGN_ORDER``."""
 
     normalized = longitude % 360
-    sign_index = int(normalized // 30)
+    # A tiny negative longitude can normalize to exactly 360.0; wrap it to Aries
+    sign_index = int(normalized // 30) % 12
     degree_in_sign = normalized % 30
-    return SIGN_ORDER[sign_index], degree_in_sign
+    return SIGN_ORDER[sign_index], degree_in_sign, sign_index
 
 
-def _best_match_ascendant(observer, ts_time) -> Tuple[str, float]:
-    """Estimate the ascendant by scanning ecliptic points along the eastern horizon.
-    
-    Note: This function attempts to create Star objects using ecliptic coordinates,
-    which may fail on some Skyfield versions. Returns a safe default on any error.
+def _longitudes_to_signs(longitudes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized ``_longitude_to_sign`` for batches of longitudes.
+
+    Returns integer sign indices into ``SIGN_ORDER`` alongside the degrees
+    within each sign, so a whole column of charts converts in one pass.
     """
 
-    try:
-        best_score = float("inf")
-        best_longitude = 0.0
-        for longitude in [x * 0.5 for x in range(0, 720)]:
-            try:
-                # Star(ecliptic_latlon=...) may not be supported in all Skyfield versions
-                # We catch broad exceptions here for maximum compatibility across versions
-                star = Star(ecliptic_latlon=(0.0, longitude))
-                alt, az, _ = observer.at(ts_time).observe(star).apparent().altaz()
-                score = abs(alt.degrees) + abs(az.degrees - 90)
-                if score < best_score:
-                    best_score = score
-                    best_longitude = longitude
-            except (AttributeError, TypeError, ValueError):
-                # Skip this longitude if Star construction or observation fails
-                # This handles variations in Skyfield API across versions
-                continue
-
-        return _longitude_to_sign(best_longitude)
-    except Exception:  # pragma: no cover - defensive guard
-        # Return safe default if any error occurs to allow partial chart computation
-        return ("Aries", 0.0)
+    normalized = np.mod(longitudes, 360.0)
+    # A tiny negative longitude can normalize to exactly 360.0; wrap it to Aries
+    sign_indices = (normalized // 30).astype(np.int64) % 12
+    return sign_indices, normalized % 30
+
+
+def _ascendant_longitude(gast_hours, latitude, longitude):
+    """Return the ecliptic longitude of the ascendant in degrees.
+
+    The ascendant is the ecliptic longitude rising on the eastern horizon. With
+    local sidereal time θ, obliquity ε and latitude φ it has the closed form
+    atan2(cos θ, -(sin θ cos ε + tan φ sin ε)). Accepts scalars or arrays.
+    """
+
+    lst = np.radians(gast_hours * 15.0 + longitude)
+    tan_lat = np.tan(np.radians(latitude))
+    ascendant = np.arctan2(
+        np.cos(lst),
+        -(np.sin(lst) * _COS_OBLIQUITY + tan_lat * _SIN_OBLIQUITY),
+    )
+    return np.degrees(ascendant)
+
+
+def _ascendant(ts_time, latitude: float, longitude: float) -> Tuple[str, float, int]:
+    """Compute the ascendant from local sidereal time and latitude."""
+
+    return _longitude_to_sign(float(_ascendant_longitude(ts_time.gast, latitude, longitude)))
 
 
-def _dominant_element(planets: Dict[str, Dict[str, float]]) -> str:
-    totals: Dict[str, float] = {"Fire": 0, "Earth": 0, "Air": 0, "Water": 0}
-    weights = {"Sun": 3, "Moon": 3, "Ascendant": 3, "Mercury": 2, "Venus": 2, "Mars": 2}
+def _sign_index(data: Dict[str, Any]) -> Optional[int]:
+    """Return a planet's index into ``SIGN_ORDER``, or ``None`` if unknown."""
+
+    sign_index = data.get("sign_index")
+    if sign_index is None:
+        # Charts not built by compute_natal_chart only carry the sign name
+        sign_index = SIGN_INDEX.get(data.get("sign", ""))
+    return sign_index
+
+
+def _dominant_element(planets: Chart) -> str:
+    totals = [0] * len(ELEMENT_NAMES)
 
     for planet, data in planets.items():
-        element = SIGN_ELEMENTS.get(data.get("sign", ""), "Earth")
-        totals[element] += weights.get(planet, 1)
+        sign_index = _sign_index(data)
+        element = ELEMENT_OF_SIGN[sign_index] if sign_index is not None else _EARTH
+        totals[element] += ELEMENT_WEIGHTS.get(planet, 1)
 
-    return max(totals, key=totals.get)
+    return ELEMENT_NAMES[totals.index(max(totals))]
 
 
-def _dominant_modality(planets: Dict[str, Dict[str, float]]) -> str:
-    totals: Dict[str, float] = {"Cardinal": 0, "Fixed": 0, "Mutable": 0}
+def _dominant_modality(planets: Chart) -> str:
+    totals = [0] * len(MODALITY_NAMES)
     for data in planets.values():
-        modality = SIGN_MODALITIES.get(data.get("sign", ""))
-        if modality:
-            totals[modality] += 1
-    return max(totals, key=totals.get)
+        sign_index = _sign_index(data)
+        if sign_index is not None:
+            totals[MODALITY_OF_SIGN[sign_index]] += 1
+    return MODALITY_NAMES[totals.index(max(totals))]
+
+
+# The ephemeris and timescale are loaded once per process and shared; parsing
+# de421.bsp and building the leap-second tables dominate a cold chart.
+_EPHEMERIS = None
+_TIMESCALE = None
+_LOAD_LOCK = threading.Lock()
 
 
 def _safe_load_ephemeris() -> Optional[object]:
-    """Attempt to load the JPL DE421 ephemeris.
+    """Return the shared JPL DE421 ephemeris, loading it on first use.
 
     Returns ``None`` when the ephemeris cannot be fetched so callers can
-    gracefully fall back to placeholder data instead of raising.
+    gracefully fall back to placeholder data instead of raising. Failed
+    loads are not cached, so a later call tries again.
     """
 
-    try:
-        return load("de421.bsp")
-    except Exception:  # pragma: no cover - defensive guard
-        return None
+    global _EPHEMERIS
+    if _EPHEMERIS is None:
+        with _LOAD_LOCK:
+            if _EPHEMERIS is None:
+                try:
+                    _EPHEMERIS = load("de421.bsp")
+                except Exception:  # pragma: no cover - defensive guard
+                    return None
+    return _EPHEMERIS
+
+
+def _timescale():
+    """Return the shared Skyfield timescale, building it on first use."""
 
+    global _TIMESCALE
+    if _TIMESCALE is None:
+        with _LOAD_LOCK:
+            if _TIMESCALE is None:
+                _TIMESCALE = load.timescale()
+    return _TIMESCALE
 
-def _placeholder_planets() -> Dict[str, Dict[str, float]]:
+
+def _placeholder_planets(include_ascendant: bool = True) -> Chart:
     """Return a placeholder planet map when computation is unavailable."""
 
     placeholder = {
@@ -194,84 +279,303 @@ def _placeholder_planets() -> Dict[str, Dict[str, float]]:
             "Pluto",
         ]
     }
-    placeholder["Ascendant"] = {"sign": "Unknown", "degree": 0.0}
+    if include_ascendant:
+        placeholder["Ascendant"] = {"sign": "Unknown", "degree": 0.0}
     return placeholder
 
 
-def compute_natal_chart(inputs: NatalInputs) -> Dict[str, Dict[str, float]]:
-    """Compute planet positions and ascendant for the provided inputs."""
+def compute_natal_chart(
+    inputs: NatalInputs, compute_ascendant: bool = True
+) -> Chart:
+    """Compute planet positions and, optionally, the ascendant.
+
+    Planet positions are memoized on the birth time, time zone and
+    coordinates rounded to 1e-4 degrees (about 11 m), so repeated Streamlit
+    reruns with the same form inputs skip the ephemeris work; they are also
+    kept in ``~/.quantumelodic_cache`` across restarts. Placeholder results
+    are never cached. With ``compute_ascendant=False`` the chart has
+    no ``Ascendant`` entry; ``build_csv_row`` fills it in when it needs it.
+
+    Planet signs do not depend on the birth place, so when either coordinate
+    is missing the planets are computed geocentrically and the ascendant,
+    if requested, is left unknown.
+    """
+
+    has_site = inputs.latitude is not None and inputs.longitude is not None
+    try:
+        planets = _compute_planets(
+            inputs.birth_datetime,
+            inputs.timezone,
+            round(inputs.latitude, 4) if has_site else None,
+            round(inputs.longitude, 4) if has_site else None,
+        )
+        # Hand out copies so callers cannot mutate the cached chart
+        chart = {name: dict(data) for name, data in planets.items()}
+        if compute_ascendant:
+            chart["Ascendant"] = (
+                _compute_ascendant(inputs) if has_site else {"sign": "Unknown", "degree": 0.0}
+            )
+        return chart
+    except Exception:  # pragma: no cover - defensive guard
+        return _placeholder_planets(include_ascendant=compute_ascendant)
+
+
+def compute_natal_chart_signs_only(inputs: NatalInputs) -> Chart:
+    """Compute planet positions without the ascendant; coordinates may be missing."""
+
+    return compute_natal_chart(inputs, compute_ascendant=False)
+
+
+def compute_natal_charts_batch(
+    inputs_list: List[NatalInputs],
+) -> List[Chart]:
+    """Compute full charts for many inputs in one vectorized pass.
+
+    Every birth time goes into a single Skyfield ``Time`` array, and each body
+    is observed once per distinct birth site over all of that site's times,
+    so nutation and precession are evaluated across the batch rather than
+    chart by chart. Results match ``compute_natal_chart`` and are not cached.
+    """
+
+    if not inputs_list:
+        return []
 
     ephemeris = _safe_load_ephemeris()
     if ephemeris is None:
-        return _placeholder_planets()
+        return [_placeholder_planets() for _ in inputs_list]
 
     try:
-        ts = load.timescale()
-        timezone = pytz.timezone(inputs.timezone)
-        localized_dt = timezone.localize(inputs.birth_datetime)
-        ts_time = ts.from_datetime(localized_dt.astimezone(pytz.UTC))
-        
-        # In Skyfield, topocentric observer requires Earth ephemeris + Topos combination
-        # Using wgs84.latlon(...) alone and calling .at(...) will fail
-        earth = ephemeris['earth']
-        observer = earth + wgs84.latlon(inputs.latitude, inputs.longitude)
-
-        bodies = {
-            "Sun": ephemeris["sun"],
-            "Moon": ephemeris["moon"],
-            "Mercury": ephemeris["mercury"],
-            "Venus": ephemeris["venus"],
-            "Mars": ephemeris["mars"],
-            "Jupiter": ephemeris["jupiter barycenter"],
-            "Saturn": ephemeris["saturn barycenter"],
-            "Uranus": ephemeris["uranus barycenter"],
-            "Neptune": ephemeris["neptune barycenter"],
-            "Pluto": ephemeris["pluto barycenter"],
-        }
-
-        planets: Dict[str, Dict[str, float]] = {}
-        for name, target in bodies.items():
-            astrometric = observer.at(ts_time).observe(target)
-            ecliptic_lon = astrometric.apparent().ecliptic_latlon()[1].degrees
-            sign, degree = _longitude_to_sign(ecliptic_lon)
-            planets[name] = {"sign": sign, "degree": degree}
-
-        asc_sign, asc_degree = _best_match_ascendant(observer, ts_time)
-        planets["Ascendant"] = {"sign": asc_sign, "degree": asc_degree}
-
-        return planets
+        return _compute_charts_batch(inputs_list, ephemeris)
     except Exception:  # pragma: no cover - defensive guard
-        return _placeholder_planets()
+        return [_placeholder_planets() for _ in inputs_list]
+
+
+def _compute_charts_batch(
+    inputs_list: List[NatalInputs], ephemeris
+) -> List[Chart]:
+    utc_datetimes = [
+        _tz(inputs.timezone).localize(inputs.birth_datetime).astimezone(pytz.UTC)
+        for inputs in inputs_list
+    ]
+    times = _timescale().from_datetimes(utc_datetimes)
+    # IAU 2000B nutation, as in _birth_time; slices of a Time do not inherit
+    # it, so each site's times get their share of the angles below
+    d_psi, d_eps = iau2000b(times.tt)
+    times._nutation_angles = (d_psi, d_eps)
+
+    sites: Dict[Tuple[float, float], List[int]] = {}
+    for index, inputs in enumerate(inputs_list):
+        sites.setdefault((inputs.latitude, inputs.longitude), []).append(index)
+
+    charts: List[Chart] = [{} for _ in inputs_list]
+    earth = ephemeris["earth"]
+    for (latitude, longitude), indices in sites.items():
+        site = np.array(indices)
+        site_times = times[site]
+        site_times._nutation_angles = (d_psi[site], d_eps[site])
+        observer_at = (earth + wgs84.latlon(latitude, longitude)).at(site_times)
+        for name, target in BODY_TARGETS.items():
+            astrometric = observer_at.observe(ephemeris[target])
+            ecliptic_lons = astrometric.frame_latlon(ecliptic_frame)[1].degrees
+            sign_indices, degrees = _longitudes_to_signs(ecliptic_lons)
+            for index, sign_index, degree in zip(indices, sign_indices.tolist(), degrees.tolist()):
+                charts[index][name] = {
+                    "sign": SIGN_ORDER[sign_index],
+                    "degree": degree,
+                    "sign_index": sign_index,
+                }
+
+    latitudes = np.array([inputs.latitude for inputs in inputs_list], dtype=float)
+    longitudes = np.array([inputs.longitude for inputs in inputs_list], dtype=float)
+    sign_indices, degrees = _longitudes_to_signs(_ascendant_longitude(times.gast, latitudes, longitudes))
+    for chart, sign_index, degree in zip(charts, sign_indices.tolist(), degrees.tolist()):
+        chart["Ascendant"] = {"sign": SIGN_ORDER[sign_index], "degree": degree, "sign_index": sign_index}
+
+    return charts
+
+
+@lru_cache(maxsize=64)
+def _tz(name: str):
+    """Return the pytz zone for ``name``, skipping pytz's name normalization on repeats."""
+
+    return pytz.timezone(name)
+
+
+def _birth_time(birth_datetime: datetime, timezone_name: str):
+    """Convert a local birth datetime to a Skyfield ``Time``."""
+
+    timezone = _tz(timezone_name)
+    localized_dt = timezone.localize(birth_datetime)
+    ts_time = _timescale().from_datetime(localized_dt.astimezone(pytz.UTC))
+    # Seed the nutation angles with IAU 2000B before anything reads the
+    # sidereal time or the ICRS rotation; Skyfield would otherwise evaluate
+    # the ~1,400-term IAU 2000A series. The two agree to about a milliarcsecond.
+    ts_time._nutation_angles = iau2000b(ts_time.tt)
+    return ts_time
+
+
+# Computed charts also persist on disk so they survive Streamlit restarts.
+# Bump the version tag whenever the ephemeris or the position math changes.
+_CHART_CACHE_PATH = Path.home() / ".quantumelodic_cache" / "charts.db"
+_CHART_CACHE_VERSION = "de421-astrometric-iau2000b-of-date-v4"
+_CHART_CACHE_LOCK = threading.Lock()
+
+
+def _chart_cache_key(
+    birth_datetime: datetime,
+    timezone_name: str,
+    latitude: Optional[float],
+    longitude: Optional[float],
+) -> str:
+    """Hash the chart inputs, and the cache version, into a shelf key."""
+
+    site = "geocentric" if latitude is None or longitude is None else f"{latitude!r}|{longitude!r}"
+    raw = f"{_CHART_CACHE_VERSION}|{birth_datetime.isoformat()}|{timezone_name}|{site}"
+    return blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _chart_cache_get(key: str) -> Optional[Chart]:
+    """Return the stored chart for ``key``, or ``None`` on a miss or any error."""
+
+    try:
+        with _CHART_CACHE_LOCK, shelve.open(str(_CHART_CACHE_PATH), flag="r") as shelf:
+            return shelf.get(key)
+    except Exception:  # pragma: no cover - missing or unreadable cache
+        return None
+
+
+def _chart_cache_set(key: str, planets: Chart) -> None:
+    """Store ``planets`` under ``key``; a read-only home directory is ignored."""
+
+    try:
+        with _CHART_CACHE_LOCK:
+            _CHART_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with shelve.open(str(_CHART_CACHE_PATH)) as shelf:
+                shelf[key] = planets
+    except Exception:  # pragma: no cover - defensive guard
+        pass
+
+
+@lru_cache(maxsize=256)
+def _compute_planets(
+    birth_datetime: datetime,
+    timezone_name: str,
+    latitude: Optional[float],
+    longitude: Optional[float],
+) -> Chart:
+    """Compute planet positions from hashable inputs; raises when it cannot.
+
+    Misses in this in-process cache fall through to the on-disk chart cache
+    before touching the ephemeris.
+    """
+
+    key = _chart_cache_key(birth_datetime, timezone_name, latitude, longitude)
+    planets = _chart_cache_get(key)
+    if planets is None:
+        planets = _ephemeris_planets(birth_datetime, timezone_name, latitude, longitude)
+        _chart_cache_set(key, planets)
+    return planets
 
 
-def build_csv_row(planets: Dict[str, Dict[str, float]], inputs: NatalInputs) -> Dict[str, str]:
-    """Construct the CSV row according to the requested schema."""
+def _ephemeris_planets(
+    birth_datetime: datetime,
+    timezone_name: str,
+    latitude: Optional[float],
+    longitude: Optional[float],
+) -> Chart:
+    """Compute planet positions with Skyfield; raises when it cannot.
+
+    Without both coordinates the bodies are observed from the geocenter.
+    """
+
+    ephemeris = _safe_load_ephemeris()
+    if ephemeris is None:
+        raise RuntimeError("DE421 ephemeris is unavailable")
+
+    ts_time = _birth_time(birth_datetime, timezone_name)
+    
+    # In Skyfield, topocentric observer requires Earth ephemeris + Topos combination
+    # Using wgs84.latlon(...) alone and calling .at(...) will fail
+    earth = ephemeris['earth']
+    if latitude is None or longitude is None:
+        observer = earth
+    else:
+        observer = earth + wgs84.latlon(latitude, longitude)
+
+    # Position the observer once; every body is observed from the same
+    # place and instant, sharing its Earth-orientation terms.
+    # Astrometric positions skip the aberration and light-deflection work of
+    # apparent(): they differ by at most ~20 arcseconds, which only changes
+    # the sign of a body sitting that close to a cusp.
+    observer_at = observer.at(ts_time)
+    positions = np.column_stack([
+        observer_at.observe(ephemeris[target]).position.au
+        for target in BODY_TARGETS.values()
+    ])
+
+    # Rotate every body into the ecliptic and equinox of date, the frame the
+    # ascendant is measured in, with a single matrix product
+    x, y, _ = ecliptic_frame.rotation_at(ts_time) @ positions
+    sign_indices, degrees = _longitudes_to_signs(np.degrees(np.arctan2(y, x)))
+
+    return {
+        name: {"sign": SIGN_ORDER[sign_index], "degree": degree, "sign_index": sign_index}
+        for name, sign_index, degree in zip(BODY_TARGETS, sign_indices.tolist(), degrees.tolist())
+    }
 
-    sun_sign = planets.get("Sun", {}).get("sign", "Unknown")
-    moon_sign = planets.get("Moon", {}).get("sign", "Unknown")
-    rising_sign = planets.get("Ascendant", {}).get("sign", "Unknown")
+
+def _compute_ascendant(inputs: NatalInputs) -> Dict[str, Any]:
+    """Compute the ascendant entry of a chart; needs no ephemeris."""
+
+    ts_time = _birth_time(inputs.birth_datetime, inputs.timezone)
+    sign, degree, sign_index = _ascendant(ts_time, inputs.latitude, inputs.longitude)
+    return {"sign": sign, "degree": degree, "sign_index": sign_index}
+
+
+def build_csv_row(planets: Chart, inputs: NatalInputs) -> Dict[str, str]:
+    """Construct the CSV row according to the requested schema.
+
+    Charts computed without an ascendant get one here, but only when the
+    birth coordinates are known; otherwise the rising sign stays unknown.
+    """
+
+    if (
+        "Ascendant" not in planets
+        and inputs.latitude is not None
+        and inputs.longitude is not None
+    ):
+        try:
+            planets = {**planets, "Ascendant": _compute_ascendant(inputs)}
+        except Exception:  # pragma: no cover - defensive guard
+            pass
+
+    # Walk the chart once; every sign lookup below is a single dict hit
+    sign_of = {planet: data.get("sign", "Unknown") for planet, data in planets.items()}
+    sun_sign = sign_of.get("Sun", "Unknown")
+    moon_sign = sign_of.get("Moon", "Unknown")
+    rising_sign = sign_of.get("Ascendant", "Unknown")
+    jupiter_sign = sign_of.get("Jupiter", "Unknown")
+    saturn_sign = sign_of.get("Saturn", "Unknown")
+    pluto_sign = sign_of.get("Pluto", "Unknown")
 
     dominant_element = _dominant_element(planets)
     dominant_modality = _dominant_modality(planets)
     chart_ruler = CHART_RULERS.get(rising_sign, "")
 
-    def planet_sign(planet: str) -> str:
-        return planets.get(planet, {}).get("sign", "Unknown")
-
     return {
         "Name": inputs.name,
         "SunSign": sun_sign,
         "MoonSign": moon_sign,
         "Rising": rising_sign,
         "DateRange": SIGN_DATE_RANGES.get(sun_sign, ""),
-        "Mercury": planet_sign("Mercury"),
-        "Venus": planet_sign("Venus"),
-        "Mars": planet_sign("Mars"),
-        "Jupiter": planet_sign("Jupiter"),
-        "Saturn": planet_sign("Saturn"),
-        "Uranus": planet_sign("Uranus"),
-        "Neptune": planet_sign("Neptune"),
-        "Pluto": planet_sign("Pluto"),
+        "Mercury": sign_of.get("Mercury", "Unknown"),
+        "Venus": sign_of.get("Venus", "Unknown"),
+        "Mars": sign_of.get("Mars", "Unknown"),
+        "Jupiter": jupiter_sign,
+        "Saturn": saturn_sign,
+        "Uranus": sign_of.get("Uranus", "Unknown"),
+        "Neptune": sign_of.get("Neptune", "Unknown"),
+        "Pluto": pluto_sign,
         "NorthNode": "Calculated node data unavailable in offline mode",
         "Chiron": "Calculated Chiron data unavailable in offline mode",
         "Element": dominant_element,
@@ -279,9 +583,8 @@ def build_csv_row(planets: Dict[str, Dict[str, float]], inputs: NatalInputs) ->
         "DominantPlanet": "Sun" if sun_sign else "",
         "ChartRuler": chart_ruler,
         "SoulPurpose": f"Evolve through {sun_sign} virtues while rising as {rising_sign}.",
-        "ShadowWork": f"Integrate the lessons of {planet_sign('Pluto')} and {planet_sign('Saturn')}.",
-        "LifeLesson": f"Discipline of {planet_sign('Saturn')} in a {dominant_modality} path.",
+        "ShadowWork": f"Integrate the lessons of {pluto_sign} and {saturn_sign}.",
+        "LifeLesson": f"Discipline of {saturn_sign} in a {dominant_modality} path.",
         "CoreWound": "Chiron themes require further calculation.",
-        "GiftToWorld": f"Jupiter in {planet_sign('Jupiter')} expands your influence.",
+        "GiftToWorld": f"Jupiter in {jupiter_sign} expands your influence.",
     }
-